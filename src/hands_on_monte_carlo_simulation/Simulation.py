@@ -19,13 +19,21 @@ class SimulationUI:
         self.lock = threading.Lock()
 
         
-        self.points_to_draw : list = []  # Liste de (x, y, color)
+        # Blocs de points reçus mais pas encore dessinés : liste de
+        # (xs, ys, inside_flags), tels que livrés par les workers
+        self.points_to_draw : list = []
+
+        # Tampons partagés alimentés par des workers processus (PointRing)
+        self.rings : list = []
 
         # Initialisation Pygame
         pygame.init()
         self.screen = pygame.display.set_mode((self.width, self.height + 100))
         pygame.display.set_caption("Monte-Carlo Simulation - Approximation de π")
 
+        # Surface persistante où chaque point n'est dessiné qu'une seule fois
+        self.points_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+
         # Police pour le texte
         self.font = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
@@ -81,15 +89,44 @@ class SimulationUI:
         self.screen.blit(pi_text, (10, stats_y + 50))
 
     def draw_all_points(self):
+        """
+        Dessine uniquement les nouveaux points sur la surface persistante puis
+        l'affiche : le coût d'une frame dépend du nombre de nouveaux points,
+        pas du nombre total de points déjà tirés.
+        """
         with self.lock:
-            for x, y, color in self.points_to_draw:
-                pixel_pos = self.math_to_screen(x, y)
-                pygame.draw.circle(self.screen, color, pixel_pos, 2)
+            new_blocks = self.points_to_draw
+            self.points_to_draw = []
+
+        for ring in self.rings:
+            # Vues sur la mémoire partagée : les points sont lus sans copie
+            blocks, new_points, new_inside = ring.read()
+            with self.lock:
+                self.total_points += new_points
+                self.inside_points += new_inside
+            new_blocks.extend(blocks)
+
+        scale = min(self.width, self.height)
+        for xs, ys, inside_flags in new_blocks:
+            if hasattr(xs, "astype"):
+                # Bloc numpy : conversion en pixels vectorisée, puis listes Python
+                # pour éviter d'itérer sur des scalaires numpy
+                screen_xs = (xs * scale).astype(int).tolist()
+                screen_ys = (self.height - ys * scale).astype(int).tolist()
+                inside_flags = inside_flags.tolist()
+            else:
+                screen_xs = [int(x * scale) for x in xs]
+                screen_ys = [int(self.height - y * scale) for y in ys]
+            for screen_x, screen_y, is_inside in zip(screen_xs, screen_ys, inside_flags):
+                color = (0, 255, 0) if is_inside else (255, 0, 0)
+                pygame.draw.circle(self.points_surface, color, (screen_x, screen_y), 2)
+
+        self.screen.blit(self.points_surface, (0, 0))
 
     def update(self):
         self.screen.fill(self.bg_color)
-        self.draw_quadrant_circle(line_width=3)
         self.draw_all_points()
+        self.draw_quadrant_circle(line_width=3)
         self.draw_statistics()
         pygame.display.flip()
 
@@ -107,15 +144,31 @@ class SimulationUI:
         pygame.draw.circle(self.screen, color, pixel_pos, radius)
 
     def add_point_callback(self, x: float, y: float, is_inside: bool):
-        color = (0, 255, 0) if is_inside else (255, 0, 0)
         with self.lock:
             self.total_points += 1
             if is_inside:
                 self.inside_points += 1
-            self.points_to_draw.append((x, y, color))
+            self.points_to_draw.append(((x,), (y,), (is_inside,)))
+
+    def add_points_callback(self, xs, ys, inside_flags, inside_count: int):
+        """
+        Reçoit un bloc de points : les tableaux sont mis en file tels quels, sous
+        un seul verrou par bloc, et ne sont lus qu'au moment du dessin.
+        """
+        with self.lock:
+            self.total_points += len(xs)
+            self.inside_points += inside_count
+            self.points_to_draw.append((xs, ys, inside_flags))
+
+    def add_ring(self, ring):
+        """
+        Ajoute un tampon partagé dont les nouveaux points sont lus à chaque frame
+        """
+        self.rings.append(ring)
 
     def reset_statistics(self):
         with self.lock:
             self.total_points = 0
             self.inside_points = 0
             self.points_to_draw = []
+        self.points_surface.fill((0, 0, 0, 0))
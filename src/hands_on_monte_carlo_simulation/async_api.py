@@ -0,0 +1,194 @@
+import os
+import random
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Optional, Set, Union
+
+from .distributed import compute_shard
+from .monte_carlo_simulation import MonteCarloSimulation
+from .regions import Region, make_region
+from .samplers import PSEUDO_RANDOM_SAMPLERS
+
+
+# Nombre de tirages par tâche soumise au pool : borne le délai d'arrêt après annulation
+ASYNC_SHARD_SIZE = 200_000
+
+
+class Progress:
+    """
+    État d'une estimation en cours, produit après chaque shard terminé
+    """
+
+    def __init__(self, total_points: int, inside_points: int, region: Region,
+                 planned_points: Optional[int], done: bool):
+        self.total_points = total_points
+        self.inside_points = inside_points
+        self.estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points, region.scale)
+        self.stderr = MonteCarloSimulation.standard_error(total_points, inside_points, region.scale)
+        self.label = region.label
+        # Fraction des tirages prévus déjà effectuée (None en mode précision cible)
+        self.progress = total_points / planned_points if planned_points else None
+        self.done = done
+
+    def __repr__(self) -> str:
+        return (f"Progress({self.label} ≈ {self.estimate:.10f}, {self.total_points} points, "
+                f"done={self.done})")
+
+
+class SimulationPool:
+    """
+    Pool de processus partagé par les estimations lancées depuis une boucle
+    asyncio. Chaque estimation découpe ses tirages en shards (comme le
+    coordinateur réparti) et n'en a jamais plus de max_workers en cours : les
+    requêtes concurrentes se partagent les cœurs au lieu de les surcharger.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers (int, optional): Le nombre de processus. Defaults to None (nombre de cœurs).
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Créé à la première estimation : importer le module ne lance aucun processus.
+        # Méthode spawn : le pool naît depuis une boucle asyncio, dans un processus
+        # à plusieurs threads où fork() peut bloquer l'enfant
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                mp_context=multiprocessing.get_context("spawn"))
+        return self.executor
+
+    async def stream(self, nb_draws: Optional[int], seed: Optional[int] = None,
+                     engine: str = "python", sampler: str = "random",
+                     region: Union[str, Region] = "quadrant", dimension: Optional[int] = None,
+                     shard_size: int = ASYNC_SHARD_SIZE,
+                     target_stderr: Optional[float] = None) -> AsyncIterator[Progress]:
+        """
+        Lance une estimation et produit son état après chaque shard terminé. Les
+        tirages s'exécutent dans le pool, jamais dans la boucle. Annuler la tâche
+        qui consomme l'itérateur (ou en sortir) annule les shards pas encore
+        démarrés ; les shards en cours, courts, se terminent sans être attendus.
+
+        Args:
+            nb_draws (int, optional): Le nombre total de tirages, None pour tirer
+                jusqu'à target_stderr
+            seed (int, optional): La graine. À graine et shard_size fixés, le résultat
+                ne dépend pas du pool. Defaults to None.
+            engine (str): Le moteur de calcul. Defaults to "python".
+            sampler (str): L'échantillonneur. Defaults to "random".
+            region (str | Region): La région évaluée. Defaults to "quadrant".
+            dimension (int, optional): La dimension de la région. Defaults to None.
+            shard_size (int): Le nombre de tirages par shard. Defaults to ASYNC_SHARD_SIZE.
+            target_stderr (float, optional): Arrêt dès que l'erreur type passe sous
+                cette valeur. Defaults to None.
+
+        Returns:
+            AsyncIterator de Progress, le dernier ayant done=True
+        """
+        if nb_draws is None and target_stderr is None:
+            raise ValueError("Il faut un nombre de tirages ou une erreur type visée")
+        if nb_draws is not None and nb_draws < 1:
+            raise ValueError("Le nombre de tirages doit être >= 1")
+        if target_stderr is not None and sampler not in PSEUDO_RANDOM_SAMPLERS:
+            raise ValueError("Le mode précision cible nécessite un échantillonneur pseudo-aléatoire (random ou philox)")
+        region = make_region(region, dimension)
+        if seed is None:
+            # Tous les shards doivent partager la graine (brouillage QMC commun)
+            seed = random.SystemRandom().getrandbits(63)
+        nb_shards = -(-nb_draws // shard_size) if nb_draws is not None else None
+
+        loop = asyncio.get_running_loop()
+        executor = self._executor()
+        pending: Set[asyncio.Future] = set()
+        next_shard = 0
+        total_points = inside_points = 0
+        try:
+            while True:
+                while len(pending) < self.max_workers and (nb_shards is None or next_shard < nb_shards):
+                    draws = shard_size if nb_draws is None else min(shard_size, nb_draws - next_shard * shard_size)
+                    shard = {"shard_id": next_shard, "draws": draws, "seed": seed, "engine": engine,
+                             "sampler": sampler, "segment_size": shard_size, "region": region,
+                             "dimension": region.dimension}
+                    pending.add(loop.run_in_executor(executor, compute_shard, shard))
+                    next_shard += 1
+
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in finished:
+                    total, inside = future.result()
+                    total_points += total
+                    inside_points += inside
+
+                reached = target_stderr is not None and 0 < inside_points < total_points and \
+                    MonteCarloSimulation.standard_error(total_points, inside_points, region.scale) <= target_stderr
+                # Tous les shards en cours peuvent se terminer ensemble : il faut
+                # aussi qu'il ne reste aucun shard à soumettre
+                done = reached or (not pending and nb_shards is not None and next_shard >= nb_shards)
+                yield Progress(total_points, inside_points, region, nb_draws, done)
+                if done:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def estimate(self, nb_draws: Optional[int], **kwargs) -> Progress:
+        """
+        Lance une estimation et retourne son état final (voir stream pour les paramètres)
+
+        Raises:
+            RuntimeError: Si l'estimation n'a produit aucun état
+        """
+        progress = None
+        async for progress in self.stream(nb_draws, **kwargs):
+            pass
+        if progress is None:
+            raise RuntimeError("L'estimation n'a produit aucun résultat")
+        return progress
+
+    def shutdown(self) -> None:
+        """
+        Arrête les processus du pool (les shards en attente sont abandonnés)
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+_default_pool: Optional[SimulationPool] = None
+
+
+def get_default_pool() -> SimulationPool:
+    """
+    Retourne le pool partagé par défaut, d'un processus par cœur
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = SimulationPool()
+    return _default_pool
+
+
+async def estimate_pi_async(nb_draws: Optional[int], pool: Optional[SimulationPool] = None,
+                            **kwargs) -> Progress:
+    """
+    Estime pi (ou la quantité de la région) sans bloquer la boucle asyncio
+
+    Args:
+        nb_draws (int, optional): Le nombre total de tirages
+        pool (SimulationPool, optional): Le pool à utiliser. Defaults to None (pool par défaut).
+        **kwargs: Les paramètres de SimulationPool.stream
+
+    Returns:
+        Progress: L'état final
+    """
+    return await (pool or get_default_pool()).estimate(nb_draws, **kwargs)
+
+
+def estimate_pi_progress(nb_draws: Optional[int], pool: Optional[SimulationPool] = None,
+                         **kwargs) -> AsyncIterator[Progress]:
+    """
+    Comme estimate_pi_async, mais produit l'état après chaque shard :
+    async for progress in estimate_pi_progress(10**8): ...
+    """
+    return (pool or get_default_pool()).stream(nb_draws, **kwargs)
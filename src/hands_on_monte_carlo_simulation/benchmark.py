@@ -0,0 +1,314 @@
+import os
+import sys
+import json
+import time
+import logging
+import itertools
+import platform
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # resource n'existe que sous Unix
+    resource = None  # type: ignore[assignment]
+
+from .threading_manager import ThreadingManager, gil_enabled
+from .monte_carlo_simulation import BLOCK_SIZE, VECTOR_ENGINES
+
+
+# Modules du GUI, qui ne doivent pas être chargés par une exécution sans --gui
+GUI_MODULES = ("pygame", "hands_on_monte_carlo_simulation.Simulation")
+
+# Arguments de la courte exécution CLI dont on mesure le démarrage
+STARTUP_ARGV = ["-N", "1000", "-o", os.devnull]
+
+# Script exécuté dans un interpréteur neuf par measure_startup : lance le CLI
+# puis écrit sur la sortie standard (le résultat allant dans os.devnull) la
+# durée des imports et les modules du GUI chargés
+STARTUP_SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+from hands_on_monte_carlo_simulation.main import main
+import_time = time.perf_counter() - start
+argv, gui_modules = json.loads(sys.argv[1])
+sys.argv = ["monte-carlo-simulation"] + argv
+try:
+    main()
+except SystemExit:
+    pass
+print(json.dumps({"import_time": import_time,
+                  "gui_modules": [name for name in gui_modules if name in sys.modules]}))
+"""
+
+
+def measure_startup(argv: Optional[List[str]] = None, repeat: int = 5) -> Dict:
+    """
+    Mesure le démarrage d'une courte exécution CLI, chaque fois dans un
+    interpréteur neuf (rien n'est déjà importé), en gardant la meilleure mesure
+
+    Args:
+        argv (list, optional): Les arguments du CLI. Defaults to None (STARTUP_ARGV).
+        repeat (int): Le nombre de mesures. Defaults to 5.
+
+    Returns:
+        dict: wall_time (durée totale du processus), import_time (import de
+        main) et gui_modules (modules du GUI chargés, vide attendu)
+    """
+    argv = STARTUP_ARGV if argv is None else argv
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    wall_times = []
+    import_times = []
+    gui_modules = set()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, json.dumps([argv, GUI_MODULES])],
+                                   env=env, capture_output=True, text=True, check=True)
+        wall_times.append(time.perf_counter() - start)
+        measure = json.loads(completed.stdout.strip().splitlines()[-1])
+        import_times.append(measure["import_time"])
+        gui_modules.update(measure["gui_modules"])
+    return {
+        "argv": argv,
+        "wall_time": min(wall_times),
+        "import_time": min(import_times),
+        "gui_modules": sorted(gui_modules),
+    }
+
+
+def _rusage() -> Dict[str, float]:
+    """
+    Retourne le temps CPU (processus courant et processus fils terminés) et le
+    pic de mémoire résidente en Ko. Ce pic couvre toute la vie du processus :
+    pour qu'il soit propre à un cas, le cas doit tourner dans un processus neuf
+    (voir run_case_isolated).
+    """
+    if resource is None:
+        return {"cpu_time": time.process_time(), "peak_rss_kb": 0}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return {
+        "cpu_time": own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+        "peak_rss_kb": max(own.ru_maxrss, children.ru_maxrss),
+    }
+
+
+def case_key(case: Dict) -> tuple:
+    """
+    Retourne la clé identifiant un cas de benchmark (pour la comparaison à une référence)
+    """
+    return (case["engine"], case["backend"], case["workers"], case["draws"], case["block_size"])
+
+
+def run_case(engine: str, backend: str, workers: int, draws: int, block_size: Optional[int],
+             repeat: int = 3, warmup: int = 1, seed: Optional[int] = 0) -> Dict:
+    """
+    Mesure un cas de benchmark : warmup exécutions ignorées, puis repeat
+    exécutions mesurées dont on garde la meilleure (moins sensible au bruit).
+
+    Args:
+        engine (str): Le moteur de calcul
+        backend (str): Le backend d'exécution
+        workers (int): Le nombre de workers
+        draws (int): Le nombre de tirages par worker
+        block_size (int, optional): Le nombre de points par bloc des moteurs vectorisés,
+            None quand il est sans effet (moteur python)
+        repeat (int): Le nombre d'exécutions mesurées. Defaults to 3.
+        warmup (int): Le nombre d'exécutions de chauffe. Defaults to 1.
+        seed (int, optional): La graine de la simulation. Defaults to 0.
+
+    Returns:
+        dict: Les paramètres du cas et ses mesures (points_per_sec, wall_time,
+        cpu_time, peak_rss_kb)
+    """
+    manager = ThreadingManager(nb_threads=workers, nb_draws_per_thread=draws, seed=seed,
+                               engine=engine, backend=backend,
+                               block_size=block_size if block_size is not None else BLOCK_SIZE)
+    for _ in range(warmup):
+        manager.run_parallel()
+
+    wall_times = []
+    cpu_times = []
+    for _ in range(repeat):
+        before = _rusage()
+        start = time.perf_counter()
+        total_points, _ = manager.run_parallel()
+        wall_times.append(time.perf_counter() - start)
+        cpu_times.append(_rusage()["cpu_time"] - before["cpu_time"])
+
+    best = min(range(repeat), key=lambda i: wall_times[i])
+    return {
+        "engine": engine,
+        "backend": backend,
+        "workers": workers,
+        "draws": draws,
+        "block_size": block_size,
+        "total_points": total_points,
+        "points_per_sec": total_points / wall_times[best] if wall_times[best] > 0 else 0.0,
+        "wall_time": wall_times[best],
+        "cpu_time": cpu_times[best],
+        "peak_rss_kb": _rusage()["peak_rss_kb"],
+    }
+
+
+def run_case_isolated(*args, **kwargs) -> Dict:
+    """
+    Exécute run_case dans un processus neuf (méthode spawn), pour que le pic de
+    mémoire mesuré soit celui du cas seul et non le maximum des cas précédents
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_case, *args, **kwargs).result()
+
+
+def run_benchmarks(engines: List[str], backends: List[str], workers: List[int], draws: List[int],
+                   block_sizes: List[int], repeat: int = 3, warmup: int = 1,
+                   isolate: bool = True) -> List[Dict]:
+    """
+    Exécute le produit cartésien des paramètres. La taille de bloc n'ayant
+    d'effet que sur les moteurs vectorisés, les cas python ne sont mesurés qu'une fois
+    (block_size None).
+
+    Args:
+        isolate (bool): Exécute chaque cas dans un processus neuf. Defaults to True.
+
+    Returns:
+        list: Un résultat (voir run_case) par cas
+    """
+    results = []
+    cases = []
+    for engine, backend, nb_workers, nb_draws in itertools.product(engines, backends, workers, draws):
+        for block_size in (block_sizes if engine in VECTOR_ENGINES else [None]):
+            cases.append((engine, backend, nb_workers, nb_draws, block_size))
+
+    for engine, backend, nb_workers, nb_draws, block_size in cases:
+        logging.info(f"Benchmark: engine={engine} backend={backend} workers={nb_workers} "
+                     f"draws={nb_draws} block_size={block_size}")
+        runner = run_case_isolated if isolate else run_case
+        result = runner(engine, backend, nb_workers, nb_draws, block_size, repeat, warmup)
+        logging.info(f"  {result['points_per_sec']:.0f} points/s")
+        results.append(result)
+    return results
+
+
+def scaling_summary(results: List[Dict]) -> List[Dict]:
+    """
+    Calcule le passage à l'échelle de chaque cas par rapport au même cas à un
+    seul worker : speedup = débit / débit à 1 worker, efficiency = speedup / workers.
+    Une efficacité proche de 1 indique un passage à l'échelle linéaire (threads
+    sur un interpréteur sans GIL, ou processus).
+
+    Args:
+        results (list): Les résultats de run_benchmarks
+
+    Returns:
+        list: Pour chaque cas à plusieurs workers dont la référence à 1 worker a été mesurée,
+        le cas, speedup et efficiency
+    """
+    single = {(r["engine"], r["backend"], r["draws"], r["block_size"]): r["points_per_sec"]
+              for r in results if r["workers"] == 1}
+    summary = []
+    for result in results:
+        reference = single.get((result["engine"], result["backend"], result["draws"], result["block_size"]))
+        if result["workers"] > 1 and reference:
+            speedup = result["points_per_sec"] / reference
+            summary.append({
+                "engine": result["engine"],
+                "backend": result["backend"],
+                "workers": result["workers"],
+                "draws": result["draws"],
+                "block_size": result["block_size"],
+                "speedup": speedup,
+                "efficiency": speedup / result["workers"],
+            })
+    return summary
+
+
+def find_regressions(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[Dict]:
+    """
+    Compare les débits à ceux d'une référence. Un cas régresse si son débit
+    est inférieur à (1 - tolerance) fois le débit de référence ; les cas absents
+    de la référence sont ignorés.
+
+    Args:
+        results (list): Les résultats courants
+        baseline (list): Les résultats de référence
+        tolerance (float): La baisse relative de débit tolérée
+
+    Returns:
+        list: Pour chaque régression, le cas, le débit de référence et le débit courant
+    """
+    reference = {case_key(case): case["points_per_sec"] for case in baseline}
+    regressions = []
+    for result in results:
+        expected = reference.get(case_key(result))
+        if expected is not None and result["points_per_sec"] < (1.0 - tolerance) * expected:
+            regressions.append({
+                "case": dict(zip(("engine", "backend", "workers", "draws", "block_size"),
+                                 case_key(result))),
+                "baseline_points_per_sec": expected,
+                "points_per_sec": result["points_per_sec"],
+            })
+    return regressions
+
+
+def run_bench_mode(args) -> int:
+    """
+    Exécute la commande bench : mesures, écriture JSON et comparaison
+    éventuelle à une référence
+
+    Args:
+        args: Arguments parsés par parse_bench_arguments
+
+    Returns:
+        int: Le code de sortie (1 si une régression est détectée)
+    """
+    results = run_benchmarks(args.engines, args.backends, args.workers, args.draws,
+                             args.block_sizes, repeat=args.repeat, warmup=args.warmup,
+                             isolate=args.isolate)
+    # Le passage à l'échelle des threads dépend de l'interpréteur (GIL ou non)
+    report: Dict = {
+        "runtime": {"python": platform.python_version(), "gil_enabled": gil_enabled(),
+                    "cpu_count": os.cpu_count()},
+        "results": results,
+        "scaling": scaling_summary(results),
+    }
+    for entry in report["scaling"]:
+        logging.info(f"Passage à l'échelle: {entry['engine']}/{entry['backend']} x{entry['workers']}: "
+                     f"speedup {entry['speedup']:.2f}, efficacité {entry['efficiency']:.0%}")
+
+    exit_code = 0
+    if args.startup:
+        startup = report["startup"] = measure_startup(repeat=args.repeat)
+        logging.info(f"Démarrage: {startup['wall_time']:.3f}s (imports {startup['import_time']:.3f}s)")
+        if startup["gui_modules"]:
+            logging.error(f"Modules du GUI chargés sans --gui: {', '.join(startup['gui_modules'])}")
+            exit_code = 1
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline["results"], args.tolerance)
+        report["regressions"] = regressions
+        for regression in regressions:
+            logging.error(f"Régression: {regression['case']} "
+                          f"{regression['points_per_sec']:.0f} points/s au lieu de "
+                          f"{regression['baseline_points_per_sec']:.0f}")
+        if regressions:
+            exit_code = 1
+        if args.startup and "startup" in baseline and \
+                report["startup"]["wall_time"] > (1.0 + args.tolerance) * baseline["startup"]["wall_time"]:
+            logging.error(f"Régression du démarrage: {report['startup']['wall_time']:.3f}s "
+                          f"au lieu de {baseline['startup']['wall_time']:.3f}s")
+            exit_code = 1
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        logging.info(f"Résultats écrits dans {args.output}")
+    return exit_code
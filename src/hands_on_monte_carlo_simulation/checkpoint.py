@@ -0,0 +1,52 @@
+import os
+import json
+import tempfile
+from typing import Dict, List
+
+# Version du format des fichiers de reprise
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, config: Dict, workers: List[Dict]) -> None:
+    """
+    Écrit un fichier de reprise de façon atomique : le contenu est écrit dans
+    un fichier temporaire du même répertoire puis renommé, si bien qu'une
+    interruption ne laisse jamais un fichier à moitié écrit.
+
+    Args:
+        path (str): Le chemin du fichier de reprise
+        config (dict): La configuration de la simulation (nombre de workers, graine, ...)
+        workers (list): Pour chaque worker, ses compteurs et l'état de son générateur
+    """
+    data = {"version": CHECKPOINT_VERSION, "config": config, "workers": workers}
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str) -> Dict:
+    """
+    Lit un fichier de reprise
+
+    Args:
+        path (str): Le chemin du fichier de reprise
+
+    Returns:
+        dict: Le contenu du fichier ({"version", "config", "workers"})
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Version de fichier de reprise non supportée: {data.get('version')}")
+    # Les fichiers écrits avant l'ajout des régions portent sur le quadrant
+    data["config"].setdefault("region", "quadrant")
+    data["config"].setdefault("dimension", 2)
+    return data
@@ -0,0 +1,320 @@
+import json
+import time
+import random
+import socket
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+from .threading_manager import make_worker_generator
+from .monte_carlo_simulation import MonteCarloSimulation
+from .logger_runner import write_output
+from .regions import Region, make_region
+
+
+# Nombre de tirages par shard par défaut
+SHARD_SIZE = 1_000_000
+
+# Durée (en secondes) pendant laquelle un worker réessaie de joindre le coordinateur
+CONNECT_TIMEOUT = 10.0
+
+# Période (en secondes) à laquelle le coordinateur vérifie si le calcul est terminé
+ACCEPT_INTERVAL = 0.1
+
+# Durée (en secondes) accordée à chaque connexion pour envoyer "done" en fin de calcul
+CLOSE_TIMEOUT = 1.0
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Découpe une adresse de la forme hôte:port
+
+    Args:
+        address (str): L'adresse, l'hôte pouvant être vide (toutes les interfaces)
+
+    Returns:
+        Tuple de la forme (hôte, port)
+    """
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(f"Adresse invalide: {address} (attendu hôte:port)")
+    return host.strip("[]"), int(port)
+
+
+def send_message(stream, message: dict) -> None:
+    """
+    Envoie un message du protocole : un objet JSON par ligne
+    """
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def receive_message(stream) -> dict:
+    """
+    Lit le message suivant du protocole
+
+    Returns:
+        dict: Le message décodé
+
+    Raises:
+        ConnectionError: Si la connexion a été fermée par l'autre extrémité
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connexion fermée")
+    return json.loads(line)
+
+
+def compute_shard(shard: dict) -> Tuple[int, int]:
+    """
+    Calcule un shard avec PointGenerator.generate_batch. Le générateur d'un
+    shard ne dépend que de son indice : un shard réattribué à un autre worker
+    donne exactement le même résultat.
+
+    Args:
+        shard (dict): Le message "shard" envoyé par le coordinateur
+
+    Returns:
+        Tuple de la forme (total_points, inside_points)
+    """
+    generator = make_worker_generator(shard["shard_id"], shard["seed"], shard["engine"],
+                                      sampler=shard["sampler"], segment_size=shard["segment_size"],
+                                      region=shard["region"], dimension=shard["dimension"])
+    return generator.generate_batch(shard["draws"])
+
+
+class Coordinator:
+    """
+    Coordinateur d'une exécution répartie : découpe le budget de tirages en
+    shards à graines disjointes, les distribue aux workers connectés en TCP et
+    fusionne leurs compteurs. Le shard d'un worker qui se déconnecte avant
+    d'avoir rendu son résultat est remis en file pour un autre worker.
+
+    Protocole (un objet JSON par ligne) : le worker envoie {"type": "ready"},
+    le coordinateur répond par un message "shard" ou "done" ; après chaque
+    shard, le worker renvoie {"type": "result", ...}, qui vaut nouvelle demande.
+    """
+
+    def __init__(self, total_draws: int, shard_size: int = SHARD_SIZE, seed: Optional[int] = None,
+                 engine: str = "python", sampler: str = "random", host: str = "127.0.0.1",
+                 port: int = 0, region: Union[str, Region] = "quadrant",
+                 dimension: Optional[int] = None):
+        """
+        Initialise le coordinateur et ouvre le port d'écoute
+
+        Args:
+            total_draws (int): Le nombre total de tirages
+            shard_size (int): Le nombre de tirages par shard. Defaults to SHARD_SIZE.
+            seed (int, optional): La graine globale. Si None, une graine est tirée
+                au hasard : tous les workers doivent partager la même. Defaults to None.
+            engine (str): Le moteur de calcul des workers. Defaults to "python".
+            sampler (str): L'échantillonneur. Defaults to "random".
+            host (str): L'interface d'écoute. Defaults to "127.0.0.1".
+            port (int): Le port d'écoute, 0 pour un port libre quelconque. Defaults to 0.
+            region (str | Region): La région évaluée. Les workers la reconstruisent
+                à partir de son nom : un plugin doit être importable sur chaque
+                machine. Defaults to "quadrant".
+            dimension (int, optional): La dimension de la région. Defaults to None.
+
+        Raises:
+            ValueError: Si le moteur, l'échantillonneur et la région sont incompatibles
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.engine = engine
+        self.sampler = sampler
+        self.region = make_region(region, dimension)
+        self.shard_size = shard_size
+        # Construire le générateur d'un shard valide moteur, échantillonneur et
+        # région avant l'écoute : une combinaison invalide n'attend pas l'échec
+        # d'un worker pour être signalée
+        make_worker_generator(0, seed, engine, sampler, segment_size=shard_size, region=self.region)
+        nb_shards = -(-total_draws // shard_size)
+        self.shards = {shard_id: min(shard_size, total_draws - shard_id * shard_size)
+                       for shard_id in range(nb_shards)}
+        self.pending = deque(self.shards)
+        self.results: Dict[int, Tuple[int, int]] = {}
+        self.reassigned = 0
+        self.handlers: List[threading.Thread] = []
+        self.condition = threading.Condition()
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()[:2]
+
+    def finished(self) -> bool:
+        """
+        Indique si tous les shards ont été calculés (à appeler sous self.condition)
+        """
+        return len(self.results) == len(self.shards)
+
+    def run(self) -> Tuple[int, int]:
+        """
+        Accepte les workers jusqu'à ce que tous les shards soient calculés
+
+        Returns:
+            Tuple de la forme (total_points, inside_points)
+        """
+        logging.info(f"Coordinateur en écoute sur {self.address[0]}:{self.address[1]}, "
+                     f"{len(self.shards)} shard(s) de {self.shard_size} tirages")
+        self.server.settimeout(ACCEPT_INTERVAL)
+        with self.server:
+            while True:
+                with self.condition:
+                    if self.finished():
+                        break
+                try:
+                    connection, address = self.server.accept()
+                except socket.timeout:
+                    continue
+                connection.settimeout(None)
+                # Détecte les machines tombées sans fermeture propre de la connexion
+                connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                handler = threading.Thread(target=self._serve_worker, args=(connection, address),
+                                           daemon=True)
+                handler.start()
+                self.handlers.append(handler)
+
+        # Laisse aux workers connectés le temps de recevoir "done"
+        for handler in self.handlers:
+            handler.join(timeout=CLOSE_TIMEOUT)
+
+        total_points = sum(total for total, _ in self.results.values())
+        inside_points = sum(inside for _, inside in self.results.values())
+        return total_points, inside_points
+
+    def _next_shard(self) -> Optional[int]:
+        """
+        Retourne le prochain shard à calculer, en attendant qu'un shard soit
+        remis en file tant que le calcul n'est pas terminé
+
+        Returns:
+            int: L'indice du shard, ou None si tous les shards sont calculés
+        """
+        with self.condition:
+            while not self.pending and not self.finished():
+                self.condition.wait()
+            if self.finished():
+                return None
+            return self.pending.popleft()
+
+    def _serve_worker(self, connection: socket.socket, address) -> None:
+        """
+        Dialogue avec un worker jusqu'à la fin du calcul ou sa déconnexion
+        """
+        logging.info(f"Worker connecté: {address[0]}:{address[1]}")
+        assigned: Optional[int] = None
+        try:
+            with connection, connection.makefile("rwb") as stream:
+                while True:
+                    message = receive_message(stream)
+                    if assigned is not None and message.get("type") == "result" \
+                            and message.get("shard_id") == assigned:
+                        with self.condition:
+                            self.results[assigned] = (message["total"], message["inside"])
+                            self.condition.notify_all()
+                        logging.debug(f"Shard {assigned} terminé par {address[0]}:{address[1]} "
+                                      f"({len(self.results)}/{len(self.shards)})")
+                        assigned = None
+
+                    assigned = self._next_shard()
+                    if assigned is None:
+                        send_message(stream, {"type": "done"})
+                        return
+                    send_message(stream, {
+                        "type": "shard",
+                        "shard_id": assigned,
+                        "draws": self.shards[assigned],
+                        "seed": self.seed,
+                        "engine": self.engine,
+                        "sampler": self.sampler,
+                        "segment_size": self.shard_size,
+                        "region": self.region.name,
+                        "dimension": self.region.dimension,
+                    })
+        except (OSError, ValueError) as e:
+            logging.warning(f"Worker {address[0]}:{address[1]} perdu: {e}")
+        finally:
+            if assigned is not None:
+                with self.condition:
+                    if assigned not in self.results:
+                        self.pending.appendleft(assigned)
+                        self.reassigned += 1
+                        logging.warning(f"Shard {assigned} remis en file")
+                        self.condition.notify_all()
+
+
+def run_worker(host: str, port: int, connect_timeout: float = CONNECT_TIMEOUT) -> int:
+    """
+    Calcule les shards envoyés par un coordinateur jusqu'à ce qu'il n'y en ait plus
+
+    Args:
+        host (str): L'hôte du coordinateur
+        port (int): Le port du coordinateur
+        connect_timeout (float): Durée pendant laquelle la connexion est retentée,
+            le coordinateur pouvant démarrer après le worker. Defaults to CONNECT_TIMEOUT.
+
+    Returns:
+        int: Le nombre de shards calculés
+    """
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = socket.create_connection((host or "localhost", port))
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(ACCEPT_INTERVAL)
+
+    nb_shards = 0
+    with connection, connection.makefile("rwb") as stream:
+        send_message(stream, {"type": "ready"})
+        while True:
+            message = receive_message(stream)
+            if message["type"] == "done":
+                break
+            total_points, inside_points = compute_shard(message)
+            nb_shards += 1
+            logging.debug(f"Shard {message['shard_id']}: {inside_points}/{total_points}")
+            send_message(stream, {"type": "result", "shard_id": message["shard_id"],
+                                  "total": total_points, "inside": inside_points})
+    logging.info(f"{nb_shards} shard(s) calculé(s)")
+    return nb_shards
+
+
+def run_coordinator_mode(args) -> None:
+    """
+    Exécute la commande coordinator : distribue les shards puis écrit l'estimation
+    de π (ou de la quantité estimée par la région)
+
+    Args:
+        args: Arguments parsés par parse_coordinator_arguments
+    """
+    host, port = parse_address(args.listen)
+    coordinator = Coordinator(args.total_draws, shard_size=args.shard_size, seed=args.seed,
+                              engine=args.engine, sampler=args.sampler, host=host, port=port,
+                              region=args.region, dimension=args.dimension)
+    logging.info(f"Graine: {coordinator.seed}")
+    start = time.perf_counter()
+    total_points, inside_points = coordinator.run()
+    elapsed = time.perf_counter() - start
+
+    region = coordinator.region
+    pi_estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points, region.scale)
+    logging.info(f"Points totaux: {total_points}")
+    logging.info(f"Points dans le quadrant: {inside_points}")
+    logging.info(f"Shards réattribués: {coordinator.reassigned}")
+    logging.info(f"Durée: {elapsed:.3f}s")
+    write_output(args.output, f"{region.label} ≈ {pi_estimate:.10f}")
+
+
+def run_worker_mode(args) -> None:
+    """
+    Exécute la commande worker
+
+    Args:
+        args: Arguments parsés par parse_worker_arguments
+    """
+    host, port = parse_address(args.connect)
+    run_worker(host, port, connect_timeout=args.connect_timeout)
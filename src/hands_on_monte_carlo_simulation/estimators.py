@@ -0,0 +1,358 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Iterable, Self, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : les estimateurs ont aussi une version Python
+    np = None  # type: ignore[assignment]
+
+from .monte_carlo_simulation import MonteCarloSimulation, Z_95
+
+
+# Estimateurs de pi disponibles : proportion de points dans le quadrant
+# (hit-or-miss) et estimateurs à variance réduite
+ESTIMATORS = ("hit-or-miss", "stratified", "antithetic", "control-variate")
+
+# Nombre de strates par axe de l'estimateur stratifié (grille de STRATA_PER_AXIS² cellules)
+STRATA_PER_AXIS = 16
+
+# Espérance de la variable de contrôle u² pour u uniforme sur [0, 1)
+CONTROL_MEAN = 1.0 / 3.0
+
+
+class Estimator(ABC):
+    """
+    Estimateur de pi alimenté par les points tirés dans le carré unité. Chaque
+    estimateur accumule des statistiques additives : les estimateurs des
+    workers sont fusionnés par merge() après exécution, et chacun fournit sa
+    propre erreur type, ce qui permet de comparer leur coût à précision égale.
+    """
+
+    name: str = ""
+
+    def __init__(self):
+        # Nombre de points tirés (chaque point peut donner plusieurs évaluations)
+        self.draws = 0
+
+    @abstractmethod
+    def update_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        """
+        Ajoute un lot de points (moteur python)
+
+        Args:
+            points: Les points, des tuples (x, y) du carré unité
+        """
+        ...
+
+    @abstractmethod
+    def update_block(self, block) -> None:
+        """
+        Ajoute un bloc de points (moteur numpy)
+
+        Args:
+            block (np.ndarray): Les points, de forme (n, 2)
+        """
+        ...
+
+    @abstractmethod
+    def merge(self, other: Self) -> None:
+        """
+        Ajoute les statistiques d'un autre estimateur du même type (autre worker)
+        """
+        ...
+
+    @abstractmethod
+    def estimate(self) -> float:
+        """
+        Retourne l'estimation de pi
+        """
+        ...
+
+    @abstractmethod
+    def standard_error(self) -> float:
+        """
+        Retourne l'erreur type de l'estimation (inf si aucun point n'a été tiré)
+        """
+        ...
+
+    def confidence_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """
+        Calcule l'intervalle de confiance (approximation normale) sur pi
+
+        Args:
+            z (float): Le quantile de la loi normale. Defaults to Z_95 (95 %).
+
+        Returns:
+            Tuple (borne_inf, borne_sup)
+        """
+        half_width = z * self.standard_error()
+        return (self.estimate() - half_width, self.estimate() + half_width)
+
+    def variance_per_draw(self) -> float:
+        """
+        Retourne la variance de l'estimation ramenée à un point tiré : l'erreur
+        type après n points vaut sqrt(variance_per_draw / n)
+        """
+        return self.draws * self.standard_error() ** 2
+
+    def draws_for_stderr(self, target_stderr: float) -> int:
+        """
+        Estime le nombre de points nécessaires pour atteindre une erreur type
+
+        Args:
+            target_stderr (float): L'erreur type visée
+
+        Returns:
+            int: Le nombre de points
+        """
+        return math.ceil(self.variance_per_draw() / target_stderr ** 2)
+
+
+class HitOrMissEstimator(Estimator):
+    """
+    Estimateur de référence : 4 fois la proportion de points dans le quadrant
+    """
+
+    name = "hit-or-miss"
+
+    def __init__(self):
+        super().__init__()
+        self.inside = 0
+
+    def update_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        for x, y in points:
+            self.draws += 1
+            if x * x + y * y <= 1.0:
+                self.inside += 1
+
+    def update_block(self, block) -> None:
+        self.draws += len(block)
+        self.inside += int(np.count_nonzero(np.einsum('ij,ij->i', block, block) <= 1.0))
+
+    def merge(self, other: "HitOrMissEstimator") -> None:
+        self.draws += other.draws
+        self.inside += other.inside
+
+    def estimate(self) -> float:
+        return MonteCarloSimulation.estimate_pi(self.draws, self.inside)
+
+    def standard_error(self) -> float:
+        return MonteCarloSimulation.standard_error(self.draws, self.inside)
+
+
+class AntitheticEstimator(Estimator):
+    """
+    Variables antithétiques : chaque point (x, y) est évalué avec son symétrique
+    (1 - x, 1 - y). Un point proche de l'origine (dans le quadrant) a son
+    symétrique proche de (1, 1) (hors du quadrant) : les deux indicateurs sont
+    négativement corrélés et leur moyenne varie moins qu'un indicateur seul.
+    La moyenne d'une paire vaut 0, 1/2 ou 1 : on compte les paires dont les deux
+    points, ou un seul, sont dans le quadrant.
+    """
+
+    name = "antithetic"
+
+    def __init__(self):
+        super().__init__()
+        self.both = 0
+        self.one = 0
+
+    def update_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        for x, y in points:
+            self.draws += 1
+            hits = (x * x + y * y <= 1.0) + ((1.0 - x) ** 2 + (1.0 - y) ** 2 <= 1.0)
+            if hits == 2:
+                self.both += 1
+            elif hits == 1:
+                self.one += 1
+
+    def update_block(self, block) -> None:
+        self.draws += len(block)
+        hits = (np.einsum('ij,ij->i', block, block) <= 1.0).astype(np.int8)
+        mirrored = 1.0 - block
+        hits += np.einsum('ij,ij->i', mirrored, mirrored) <= 1.0
+        self.both += int(np.count_nonzero(hits == 2))
+        self.one += int(np.count_nonzero(hits == 1))
+
+    def merge(self, other: "AntitheticEstimator") -> None:
+        self.draws += other.draws
+        self.both += other.both
+        self.one += other.one
+
+    def estimate(self) -> float:
+        if self.draws == 0:
+            return 0.0
+        return 4.0 * (self.both + 0.5 * self.one) / self.draws
+
+    def standard_error(self) -> float:
+        if self.draws == 0:
+            return math.inf
+        mean = (self.both + 0.5 * self.one) / self.draws
+        mean_square = (self.both + 0.25 * self.one) / self.draws
+        return 4.0 * math.sqrt(max(mean_square - mean * mean, 0.0) / self.draws)
+
+
+class StratifiedEstimator(Estimator):
+    """
+    Échantillonnage stratifié : le carré est découpé en une grille de
+    strata_per_axis² cellules et le k-ième point tiré est ramené dans la cellule
+    k modulo le nombre de cellules, qui reçoivent ainsi autant de points à une
+    unité près. L'estimation est la moyenne des proportions des cellules : les
+    cellules entièrement dans le quadrant ou en dehors ne contribuent plus à la
+    variance, seules celles que coupe le cercle en apportent.
+    """
+
+    name = "stratified"
+
+    def __init__(self, strata_per_axis: int = STRATA_PER_AXIS):
+        """
+        Args:
+            strata_per_axis (int): Le nombre de cellules par axe. Defaults to STRATA_PER_AXIS.
+        """
+        super().__init__()
+        self.strata_per_axis = strata_per_axis
+        nb_cells = strata_per_axis * strata_per_axis
+        self.totals = [0] * nb_cells
+        self.insides = [0] * nb_cells
+
+    def update_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        k = self.strata_per_axis
+        nb_cells = len(self.totals)
+        for x, y in points:
+            cell = self.draws % nb_cells
+            self.draws += 1
+            cell_x, cell_y = divmod(cell, k)
+            x, y = (cell_x + x) / k, (cell_y + y) / k
+            self.totals[cell] += 1
+            if x * x + y * y <= 1.0:
+                self.insides[cell] += 1
+
+    def update_block(self, block) -> None:
+        k = self.strata_per_axis
+        nb_cells = len(self.totals)
+        cells = (self.draws + np.arange(len(block))) % nb_cells
+        self.draws += len(block)
+        xs = (cells // k + block[:, 0]) / k
+        ys = (cells % k + block[:, 1]) / k
+        inside = xs * xs + ys * ys <= 1.0
+        totals = np.bincount(cells, minlength=nb_cells).tolist()
+        insides = np.bincount(cells[inside], minlength=nb_cells).tolist()
+        self.totals = [a + b for a, b in zip(self.totals, totals)]
+        self.insides = [a + b for a, b in zip(self.insides, insides)]
+
+    def merge(self, other: "StratifiedEstimator") -> None:
+        self.draws += other.draws
+        self.totals = [a + b for a, b in zip(self.totals, other.totals)]
+        self.insides = [a + b for a, b in zip(self.insides, other.insides)]
+
+    def _filled_cells(self):
+        # Avec moins de points que de cellules, seules les cellules tirées sont
+        # moyennées (estimation biaisée tant que toutes ne sont pas remplies)
+        return [(total, inside) for total, inside in zip(self.totals, self.insides) if total]
+
+    def estimate(self) -> float:
+        cells = self._filled_cells()
+        if not cells:
+            return 0.0
+        return 4.0 * sum(inside / total for total, inside in cells) / len(cells)
+
+    def standard_error(self) -> float:
+        cells = self._filled_cells()
+        if not cells:
+            return math.inf
+        variance = sum((inside / total) * (1.0 - inside / total) / total for total, inside in cells)
+        return 4.0 * math.sqrt(variance) / len(cells)
+
+
+class ControlVariateEstimator(Estimator):
+    """
+    Estimateur conditionnel avec variable de contrôle : au lieu de tester si un
+    point est sous le cercle, on intègre la hauteur du quart de cercle,
+    f(u) = 4 sqrt(1 - u²), dont la moyenne pour u uniforme vaut pi. Chaque
+    point tiré fournit deux abscisses (x et y). La variable de contrôle
+    g(u) = u², d'espérance connue 1/3 et très corrélée à f, corrige l'estimation :
+    pi ≈ moyenne(f) - beta (moyenne(g) - 1/3), avec beta = Cov(f, g) / Var(g)
+    estimé sur les tirages.
+    """
+
+    name = "control-variate"
+
+    def __init__(self):
+        super().__init__()
+        # Sommes de f, g, f², g² et f g sur les abscisses évaluées
+        self.sums = [0.0] * 5
+
+    def _add(self, sums) -> None:
+        self.sums = [a + b for a, b in zip(self.sums, sums)]
+
+    def update_points(self, points: Iterable[Tuple[float, float]]) -> None:
+        sum_f = sum_g = sum_ff = sum_gg = sum_fg = 0.0
+        draws = 0
+        for point in points:
+            draws += 1
+            for u in point:
+                g = u * u
+                f = 4.0 * math.sqrt(1.0 - g)
+                sum_f += f
+                sum_g += g
+                sum_ff += f * f
+                sum_gg += g * g
+                sum_fg += f * g
+        self.draws += draws
+        self._add((sum_f, sum_g, sum_ff, sum_gg, sum_fg))
+
+    def update_block(self, block) -> None:
+        self.draws += len(block)
+        g = np.square(block).ravel()
+        f = 4.0 * np.sqrt(1.0 - g)
+        self._add((float(f.sum()), float(g.sum()), float(f @ f), float(g @ g), float(f @ g)))
+
+    def merge(self, other: "ControlVariateEstimator") -> None:
+        self.draws += other.draws
+        self._add(other.sums)
+
+    def _moments(self) -> Tuple[float, float, float, float, float]:
+        """
+        Retourne les moyennes de f et g et les variances et covariance empiriques
+        """
+        n = 2 * self.draws
+        sum_f, sum_g, sum_ff, sum_gg, sum_fg = self.sums
+        mean_f, mean_g = sum_f / n, sum_g / n
+        return (mean_f, mean_g, sum_ff / n - mean_f * mean_f, sum_gg / n - mean_g * mean_g,
+                sum_fg / n - mean_f * mean_g)
+
+    def estimate(self) -> float:
+        if self.draws == 0:
+            return 0.0
+        mean_f, mean_g, _, var_g, cov_fg = self._moments()
+        beta = cov_fg / var_g if var_g > 0 else 0.0
+        return mean_f - beta * (mean_g - CONTROL_MEAN)
+
+    def standard_error(self) -> float:
+        if self.draws == 0:
+            return math.inf
+        _, _, var_f, var_g, cov_fg = self._moments()
+        residual = var_f - cov_fg * cov_fg / var_g if var_g > 0 else var_f
+        return math.sqrt(max(residual, 0.0) / (2 * self.draws))
+
+
+def make_estimator(name: str) -> Estimator:
+    """
+    Construit un estimateur à partir de son nom
+
+    Args:
+        name (str): "hit-or-miss", "stratified", "antithetic" ou "control-variate"
+
+    Returns:
+        Estimator: L'estimateur, sans aucun point
+    """
+    if name == "hit-or-miss":
+        return HitOrMissEstimator()
+    if name == "stratified":
+        return StratifiedEstimator()
+    if name == "antithetic":
+        return AntitheticEstimator()
+    if name == "control-variate":
+        return ControlVariateEstimator()
+    raise ValueError(f"Estimateur inconnu: {name} (choix possibles: {', '.join(ESTIMATORS)})")
@@ -1,9 +1,20 @@
 import sys
-import pygame
+import time
 import logging
-from .Simulation import SimulationUI
 from .threading_manager import ThreadingManager
 from .monte_carlo_simulation import MonteCarloSimulation
+from .checkpoint import load_checkpoint
+from .telemetry import Telemetry
+from .tracing import TraceWriter
+from .point_ring import PointRing
+from .result_cache import ResultCache
+from .samplers import PSEUDO_RANDOM_SAMPLERS
+from .estimators import ESTIMATORS
+
+
+# Erreur type de référence à laquelle --compare-estimators ramène le coût de chaque estimateur
+COMPARISON_STDERR = 1e-4
+
 
 def setup_logging(verbosity: int):
     """
@@ -53,7 +64,15 @@ def run_gui_mode(args):
     Args:
         args: Arguments parsés
     """
+    # pygame n'est importé qu'en mode GUI : les autres modes n'en paient pas le coût
+    import pygame
+    from .Simulation import SimulationUI
+
     logging.info("Initialisation du mode GUI...")
+    if args.telemetry is not None or args.metrics_port is not None:
+        logging.warning("La télémétrie n'est pas disponible en mode GUI")
+    if args.trace is not None:
+        logging.warning("La trace de convergence n'est pas disponible en mode GUI")
     
     ui = SimulationUI(
         width=args.width,
@@ -70,8 +89,19 @@ def run_gui_mode(args):
     manager = ThreadingManager(
         nb_threads=args.nb_threads,
         nb_draws_per_thread=args.nb_draws,
-        seed=args.seed
+        seed=args.seed,
+        engine=args.engine,
+        backend=args.backend,
+        sampler=args.sampler
     )
+
+    # Avec des processus, chaque worker écrit ses points dans un tampon partagé
+    rings = None
+    if manager.resolve_backend() == "process":
+        rings = [PointRing() for _ in range(args.nb_threads)]
+        for ring in rings:
+            ui.add_ring(ring)
+        logging.info("Workers processus : points transmis au GUI par mémoire partagée")
     
     # Premier affichage
     ui.update()
@@ -81,7 +111,11 @@ def run_gui_mode(args):
     
     def simulation_thread():
         """Thread pour exécuter la simulation sans bloquer la GUI"""
-        manager.run_parallel(callback=ui.add_point_callback)
+        if rings is not None:
+            manager.run_parallel(rings=rings, batch_size=args.gui_batch_size)
+        else:
+            manager.run_parallel(batch_callback=ui.add_points_callback,
+                                 batch_size=args.gui_batch_size)
         logging.info("Simulation terminée")
     
     sim_thread = threading.Thread(target=simulation_thread)
@@ -103,6 +137,12 @@ def run_gui_mode(args):
     
     # Attendre la fin du thread de simulation
     sim_thread.join()
+
+    if rings is not None:
+        # Relit les derniers compteurs publiés puis libère la mémoire partagée
+        ui.update()
+        for ring in rings:
+            ring.close(unlink=True)
     
     # Calcul final
     pi_estimate = MonteCarloSimulation.estimate_pi(ui.total_points, ui.inside_points)
@@ -118,6 +158,29 @@ def run_gui_mode(args):
     ui.close()
 
 
+def make_telemetry(args):
+    """
+    Crée la télémétrie demandée par --telemetry et --metrics-port
+    
+    Args:
+        args: Arguments parsés
+    
+    Returns:
+        Telemetry, ou None si aucune télémétrie n'est demandée
+    """
+    if args.telemetry is None and args.metrics_port is None:
+        return None
+    stream = None
+    if args.telemetry == '-':
+        stream = sys.stderr
+    elif args.telemetry is not None:
+        stream = open(args.telemetry, 'w')
+    telemetry = Telemetry(stream, interval=args.telemetry_interval, metrics_port=args.metrics_port)
+    if telemetry.address is not None:
+        logging.info(f"Métriques Prometheus: http://{telemetry.address[0]}:{telemetry.address[1]}/metrics")
+    return telemetry
+
+
 def run_cli_mode(args):
     """
     Exécute la simulation en mode ligne de commande (sans GUI)
@@ -125,35 +188,265 @@ def run_cli_mode(args):
     Args:
         args: Arguments parsés
     """
-    logging.info("Exécution en mode CLI (sans GUI)")
+    telemetry = make_telemetry(args)
+    trace = None
+    try:
+        if args.trace is not None:
+            # En reprise, la trace existante est complétée
+            trace = TraceWriter(args.trace, args.trace_format, every=args.trace_every,
+                                append=args.resume is not None)
+            logging.info(f"Trace de convergence: {args.trace} (tous les {args.trace_every} tirages par worker)")
+        run_cli_simulation(args, telemetry, trace)
+    finally:
+        if trace is not None:
+            trace.close()
+        if telemetry is not None:
+            telemetry.close()
+            if telemetry.stream not in (None, sys.stderr):
+                telemetry.stream.close()
+
+
+def run_cli_simulation(args, telemetry=None, trace=None):
+    """
+    Corps du mode CLI
     
-    # Calcul du nombre total de points
-    total_draws = args.nb_threads * args.nb_draws
-    logging.info(f"Génération de {total_draws} points avec {args.nb_threads} thread(s)")
+    Args:
+        args: Arguments parsés
+        telemetry: La télémétrie de l'exécution. Defaults to None.
+        trace: L'écrivain de la trace de convergence. Defaults to None.
+    """
+    logging.info("Exécution en mode CLI (sans GUI)")
     
     if args.seed is not None:
         logging.info(f"Utilisation de la graine: {args.seed}")
+    logging.info(f"Moteur de calcul: {args.engine}, backend: {args.backend}, "
+                 f"échantillonneur: {args.sampler}")
     
     # Création du gestionnaire de threads
-    manager = ThreadingManager(
-        nb_threads=args.nb_threads,
-        nb_draws_per_thread=args.nb_draws,
-        seed=args.seed
-    )
+    resume = None
+    if args.resume is not None:
+        # Reprise : la configuration est celle du fichier de reprise
+        resume = load_checkpoint(args.resume)
+        config = resume["config"]
+        logging.info(f"Reprise depuis {args.resume}: "
+                     f"{sum(worker['total_points'] for worker in resume['workers'])} points déjà tirés")
+        manager = ThreadingManager(
+            nb_threads=config["nb_threads"],
+            nb_draws_per_thread=config["nb_draws_per_thread"],
+            seed=config["seed"],
+            engine=config["engine"],
+            backend=args.backend,
+            sampler=config["sampler"],
+            block_size=config["block_size"],
+            telemetry=telemetry,
+            trace=trace,
+            region=config["region"],
+            dimension=config["dimension"]
+        )
+    else:
+        manager = ThreadingManager(
+            nb_threads=args.nb_threads,
+            nb_draws_per_thread=args.nb_draws,
+            seed=args.seed,
+            engine=args.engine,
+            backend=args.backend,
+            sampler=args.sampler,
+            telemetry=telemetry,
+            trace=trace,
+            region=args.region,
+            dimension=args.dimension,
+            total_draws=args.total_draws,
+            chunk_size=args.chunk_size
+        )
+
+    if args.target_stderr is not None or args.target_digits is not None:
+        run_precision_mode(args, manager, resume)
+        return
+
+    if args.compare_estimators:
+        run_estimator_comparison(args, manager)
+        return
+
+    if args.estimator is not None:
+        run_estimator_mode(args, manager)
+        return
+
+    # Calcul du nombre total de points
+    total_draws = manager.total_draws or manager.nb_threads * manager.nb_draws_per_thread
+    logging.info(f"Génération de {total_draws} points avec {manager.nb_threads} thread(s)")
     
     # Lancement de la simulation
     logging.info("Démarrage de la simulation...")
-    total_points, inside_points = manager.run_parallel()
+    total_points, inside_points = run_manager(args, manager, resume)
     
-    # Calcul de π
-    pi_estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points)
+    # Calcul de π (ou de la quantité estimée par la région)
+    region = manager.region
+    pi_estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points, region.scale)
     
     # Affichage des résultats
     logging.info(f"Points totaux: {total_points}")
     logging.info(f"Points dans le quadrant: {inside_points}")
     logging.info(f"Ratio: {inside_points/total_points:.6f}")
-    logging.info(f"Estimation de π: {pi_estimate:.10f}")
+    logging.info(f"Estimation de {region.label}: {pi_estimate:.10f}")
     
     # Écriture du résultat
-    result = f"π ≈ {pi_estimate:.10f}"
+    result = f"{region.label} ≈ {pi_estimate:.10f}"
+    if args.compare_random and manager.sampler not in PSEUDO_RANDOM_SAMPLERS:
+        result += " " + compare_with_random(manager, pi_estimate)
+    write_output(args.output, result)
+
+
+def run_manager(args, manager: ThreadingManager, resume=None, target_stderr=None):
+    """
+    Lance la simulation, avec écriture périodique d'un fichier de reprise si
+    --checkpoint ou --resume est donné, ou à travers le cache de résultats si
+    --cache est donné
+    
+    Args:
+        args: Arguments parsés
+        manager: Le gestionnaire de threads configuré
+        resume: Le contenu du fichier de reprise à poursuivre. Defaults to None.
+        target_stderr: L'erreur type visée, None pour un nombre de tirages fixe. Defaults to None.
+    
+    Returns:
+        Tuple (total_points, inside_points)
+    """
+    if args.cache is not None:
+        logging.info(f"Cache de résultats: {args.cache}")
+        return manager.run_cached(ResultCache(args.cache, int(args.cache_size * 1024 * 1024)))
+    checkpoint_path = args.checkpoint if args.checkpoint is not None else args.resume
+    if checkpoint_path is not None:
+        logging.info(f"Fichier de reprise: {checkpoint_path} (toutes les {args.checkpoint_interval}s)")
+        return manager.run_with_checkpoints(checkpoint_path,
+                                            checkpoint_interval=args.checkpoint_interval,
+                                            resume=resume, target_stderr=target_stderr)
+    if target_stderr is not None:
+        return manager.run_until_precision(target_stderr)
+    return manager.run_parallel()
+
+
+def compare_with_random(manager: ThreadingManager, pi_estimate: float) -> str:
+    """
+    Relance la simulation en pseudo-aléatoire avec le même nombre de tirages
+    et compare les erreurs absolues des deux estimations
+    
+    Args:
+        manager: Le gestionnaire utilisé pour l'estimation
+        pi_estimate: L'estimation obtenue avec l'échantillonneur choisi
+    
+    Returns:
+        str: Le résumé de la comparaison
+
+    Raises:
+        ValueError: Si la valeur exacte de la région n'est pas connue
+    """
+    exact = manager.region.exact
+    if exact is None:
+        raise ValueError(f"La région {manager.region.name} n'a pas de valeur exacte connue")
+    reference = ThreadingManager(
+        nb_threads=manager.nb_threads,
+        nb_draws_per_thread=manager.nb_draws_per_thread,
+        seed=manager.seed,
+        engine=manager.engine,
+        backend=manager.backend,
+        region=manager.region,
+        total_draws=manager.total_draws,
+        chunk_size=manager.chunk_size
+    )
+    total_points, inside_points = reference.run_parallel()
+    random_estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points, manager.region.scale)
+    
+    error = abs(pi_estimate - exact)
+    random_error = abs(random_estimate - exact)
+    logging.info(f"Erreur {manager.sampler}: {error:.3e}, erreur random: {random_error:.3e}")
+    return f"(erreur {manager.sampler}: {error:.3e}, erreur random: {random_error:.3e})"
+
+
+def run_estimator_mode(args, manager: ThreadingManager):
+    """
+    Estime pi avec l'estimateur choisi (--estimator) et rapporte son erreur type
+
+    Args:
+        args: Arguments parsés
+        manager: Le gestionnaire de threads configuré
+    """
+    logging.info(f"Estimateur: {args.estimator}, {manager.nb_threads * manager.nb_draws_per_thread} points "
+                 f"avec {manager.nb_threads} thread(s)")
+    start = time.perf_counter()
+    estimator = manager.run_estimator(args.estimator)
+    elapsed = time.perf_counter() - start
+
+    low, high = estimator.confidence_interval()
+    logging.info(f"Points totaux: {estimator.draws}")
+    logging.info(f"Erreur type: {estimator.standard_error():.3e}")
+    logging.info(f"Variance par tirage: {estimator.variance_per_draw():.4g}")
+    logging.info(f"Durée: {elapsed:.3f}s")
+
+    result = (f"{manager.region.label} ≈ {estimator.estimate():.10f} (IC 95 %: [{low:.10f}, {high:.10f}], "
+              f"erreur type {estimator.standard_error():.3e}, {estimator.name}, {estimator.draws} points, "
+              f"{elapsed:.3f}s)")
+    write_output(args.output, result)
+
+
+def run_estimator_comparison(args, manager: ThreadingManager):
+    """
+    Exécute chaque estimateur avec le même nombre de tirages et compare leur
+    coût à précision égale : le temps nécessaire pour atteindre une erreur
+    type donnée est proportionnel à variance par tirage × durée par tirage.
+
+    Args:
+        args: Arguments parsés
+        manager: Le gestionnaire de threads configuré
+    """
+    lines = []
+    costs = {}
+    for name in ESTIMATORS:
+        start = time.perf_counter()
+        estimator = manager.run_estimator(name)
+        elapsed = time.perf_counter() - start
+        costs[name] = estimator.variance_per_draw() * elapsed / estimator.draws
+        lines.append(f"{name}: {manager.region.label} ≈ {estimator.estimate():.10f}, "
+                     f"erreur type {estimator.standard_error():.3e}, "
+                     f"variance par tirage {estimator.variance_per_draw():.4g}, "
+                     f"{estimator.draws_for_stderr(COMPARISON_STDERR)} points et "
+                     f"{costs[name] / COMPARISON_STDERR ** 2:.3g}s pour une erreur type de {COMPARISON_STDERR:g}")
+        logging.info(lines[-1])
+    cheapest = min(costs, key=lambda name: costs[name])
+    lines.append(f"Estimateur le moins coûteux: {cheapest}")
+    write_output(args.output, "\n".join(lines))
+
+
+def run_precision_mode(args, manager: ThreadingManager, resume=None):
+    """
+    Exécute la simulation jusqu'à atteindre la précision demandée
+    (--target-stderr ou --target-digits)
+    
+    Args:
+        args: Arguments parsés
+        manager: Le gestionnaire de threads configuré
+        resume: Le contenu du fichier de reprise à poursuivre. Defaults to None.
+    """
+    if args.target_stderr is not None:
+        target_stderr = args.target_stderr
+    else:
+        target_stderr = MonteCarloSimulation.stderr_for_digits(args.target_digits)
+    logging.info(f"Mode précision cible: erreur type visée {target_stderr:.3e} "
+                 f"avec {manager.nb_threads} thread(s)")
+    
+    start = time.perf_counter()
+    total_points, inside_points = run_manager(args, manager, resume, target_stderr)
+    elapsed = time.perf_counter() - start
+    
+    scale = manager.region.scale
+    pi_estimate = MonteCarloSimulation.estimate_pi(total_points, inside_points, scale)
+    stderr = MonteCarloSimulation.standard_error(total_points, inside_points, scale)
+    low, high = MonteCarloSimulation.confidence_interval(total_points, inside_points, scale=scale)
+    
+    logging.info(f"Points totaux: {total_points}")
+    logging.info(f"Points dans le quadrant: {inside_points}")
+    logging.info(f"Erreur type: {stderr:.3e}")
+    logging.info(f"Durée: {elapsed:.3f}s")
+    
+    result = (f"{manager.region.label} ≈ {pi_estimate:.10f} (IC 95 %: [{low:.10f}, {high:.10f}], "
+              f"{total_points} points, {elapsed:.3f}s)")
     write_output(args.output, result)
@@ -1,12 +1,136 @@
 import sys
 import logging
-from .parser import parse_arguments
+from .parser import (parse_arguments, parse_bench_arguments, parse_coordinator_arguments,
+                     parse_serve_arguments, parse_sweep_arguments, parse_worker_arguments)
 from .logger_runner import setup_logging, run_gui_mode, run_cli_mode
+from .regions import make_region
+from .samplers import PSEUDO_RANDOM_SAMPLERS
+
+
+def bench_main(argv) -> None:
+    """
+    Point d'entrée de la commande bench
+    """
+    from .benchmark import run_bench_mode
+
+    args = parse_bench_arguments(argv)
+    setup_logging(args.verbose)
+
+    if args.repeat < 1 or args.warmup < 0:
+        logging.error("Il faut au moins une exécution mesurée et un nombre de chauffes >= 0")
+        sys.exit(1)
+
+    sys.exit(run_bench_mode(args))
+
+
+def coordinator_main(argv) -> None:
+    """
+    Point d'entrée de la commande coordinator
+    """
+    from .distributed import run_coordinator_mode
+
+    args = parse_coordinator_arguments(argv)
+    setup_logging(args.verbose)
+
+    if args.total_draws < 1 or args.shard_size < 1:
+        logging.error("Le nombre de tirages et la taille des shards doivent être >= 1")
+        sys.exit(1)
+
+    try:
+        run_coordinator_mode(args)
+    except (OSError, ValueError) as e:
+        logging.error(f"Erreur du coordinateur: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logging.info("\nCoordinateur interrompu par l'utilisateur")
+    sys.exit(0)
+
+
+def worker_main(argv) -> None:
+    """
+    Point d'entrée de la commande worker
+    """
+    from .distributed import run_worker_mode
+
+    args = parse_worker_arguments(argv)
+    setup_logging(args.verbose)
+
+    try:
+        run_worker_mode(args)
+    except (OSError, ValueError) as e:
+        logging.error(f"Erreur du worker: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logging.info("\nWorker interrompu par l'utilisateur")
+    sys.exit(0)
+
+
+def serve_main(argv) -> None:
+    """
+    Point d'entrée de la commande serve
+    """
+    from .server import run_serve_mode
+
+    args = parse_serve_arguments(argv)
+    setup_logging(args.verbose)
+
+    if args.workers < 1 or args.shard_size < 1 or args.batch_draws < 1 or args.max_draws < 1 \
+            or args.max_pending < 1:
+        logging.error("Le nombre de workers, la taille des shards et des lots, le nombre maximal de tirages "
+                      "et la taille de la file doivent être >= 1")
+        sys.exit(1)
+
+    try:
+        run_serve_mode(args)
+    except OSError as e:
+        logging.error(f"Erreur du service: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logging.info("\nService interrompu par l'utilisateur")
+    sys.exit(0)
+
+
+def sweep_main(argv) -> None:
+    """
+    Point d'entrée de la commande sweep
+    """
+    from .sweep import run_sweep_mode
+
+    args = parse_sweep_arguments(argv)
+    setup_logging(args.verbose)
+
+    if args.workers < 1 or args.shard_size < 1 or args.batch_draws < 1 or args.max_draws < 1 \
+            or args.max_pending < 1:
+        logging.error("Le nombre de workers, la taille des shards et des lots, le nombre maximal de tirages "
+                      "et la taille de la file doivent être >= 1")
+        sys.exit(1)
+
+    try:
+        exit_code = run_sweep_mode(args)
+    except (OSError, ValueError) as e:
+        logging.error(f"Erreur du balayage: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logging.info("\nBalayage interrompu par l'utilisateur")
+        sys.exit(1)
+    sys.exit(exit_code)
+
 
 def main() -> None:
     """
     Point d'entrée principal du programme
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        bench_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "coordinator":
+        coordinator_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        worker_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        serve_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        sweep_main(sys.argv[2:])
+
     args = parse_arguments()
     
     # Configuration du logging
@@ -23,6 +147,98 @@ def main() -> None:
     if args.nb_draws < 1:
         logging.error("Le nombre de tirages doit être >= 1")
         sys.exit(1)
+
+    if args.total_draws is not None and (args.total_draws < 1 or args.chunk_size < 1):
+        logging.error("Le budget total de tirages et la taille des paquets doivent être >= 1")
+        sys.exit(1)
+
+    if args.total_draws is not None and (args.gui or args.checkpoint is not None or args.resume is not None
+                                         or args.trace is not None or args.target_stderr is not None
+                                         or args.target_digits is not None):
+        logging.error("--total-draws n'est pas disponible avec --gui, --checkpoint, --resume, --trace "
+                      "ni le mode précision cible")
+        sys.exit(1)
+
+    if args.cache is not None and (args.seed is None or args.gui or args.checkpoint is not None
+                                   or args.resume is not None or args.trace is not None
+                                   or args.telemetry is not None or args.metrics_port is not None
+                                   or args.target_stderr is not None or args.target_digits is not None):
+        logging.error("--cache nécessite --seed et n'est pas disponible avec --gui, --checkpoint, --resume, "
+                      "--trace, la télémétrie ni le mode précision cible")
+        sys.exit(1)
+
+    estimator_mode = args.estimator is not None or args.compare_estimators
+    if estimator_mode and (args.gui or args.checkpoint is not None or args.resume is not None
+                           or args.trace is not None or args.telemetry is not None
+                           or args.metrics_port is not None or args.target_stderr is not None
+                           or args.target_digits is not None or args.total_draws is not None
+                           or args.cache is not None or args.compare_random):
+        logging.error("--estimator/--compare-estimators ne sont pas disponibles avec --gui, --checkpoint, --resume, "
+                      "--trace, la télémétrie, le mode précision cible, --total-draws, --cache ni --compare-random")
+        sys.exit(1)
+
+    if args.gui_batch_size < 1:
+        logging.error("La taille des blocs GUI doit être >= 1")
+        sys.exit(1)
+
+    if args.checkpoint_interval <= 0:
+        logging.error("L'intervalle entre deux fichiers de reprise doit être > 0")
+        sys.exit(1)
+
+    if args.target_stderr is not None and args.target_stderr <= 0:
+        logging.error("L'erreur type visée doit être > 0")
+        sys.exit(1)
+
+    if args.target_digits is not None and args.target_digits < 1:
+        logging.error("Le nombre de décimales visé doit être >= 1")
+        sys.exit(1)
+
+    if args.trace_every < 1:
+        logging.error("L'intervalle de trace doit être >= 1")
+        sys.exit(1)
+
+    if args.telemetry_interval <= 0:
+        logging.error("L'intervalle de télémétrie doit être > 0")
+        sys.exit(1)
+
+    try:
+        region = make_region(args.region, args.dimension)
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    if args.gui and region.name != "quadrant":
+        logging.error("Le mode GUI n'affiche que le quadrant")
+        sys.exit(1)
+
+    if args.sampler == "sobol" and region.dimension != 2:
+        logging.error("La suite de Sobol n'est disponible qu'en dimension 2, utiliser --sampler halton")
+        sys.exit(1)
+
+    if args.engine == "integer" and (region.name != "quadrant" or args.sampler != "random"):
+        logging.error("Le moteur integer n'est disponible que pour le quadrant avec --sampler random")
+        sys.exit(1)
+
+    if estimator_mode and (region.name != "quadrant" or args.sampler not in PSEUDO_RANDOM_SAMPLERS
+                           or args.engine == "integer"):
+        logging.error("Les estimateurs ne sont disponibles que pour le quadrant, avec --sampler random ou philox "
+                      "et le moteur python ou numpy")
+        sys.exit(1)
+
+    precision_mode = args.target_stderr is not None or args.target_digits is not None
+    if precision_mode and args.sampler not in PSEUDO_RANDOM_SAMPLERS:
+        logging.error("--target-stderr/--target-digits nécessitent --sampler random ou philox : "
+                      "l'erreur type binomiale ne s'applique pas aux suites quasi-aléatoires")
+        sys.exit(1)
+
+    if args.compare_random and (args.sampler in PSEUDO_RANDOM_SAMPLERS or precision_mode):
+        logging.error("--compare-random nécessite un échantillonneur halton ou sobol "
+                      "et un nombre de tirages fixe")
+        sys.exit(1)
+
+    if args.compare_random and region.exact is None:
+        logging.error(f"--compare-random nécessite une région de valeur exacte connue ({region.name} n'en a pas)")
+        sys.exit(1)
     
     # Exécution selon le mode
     try:
@@ -39,3 +255,6 @@ def main() -> None:
         logging.error(f"Erreur lors de l'exécution: {e}", exc_info=True)
         sys.exit(1)
 
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,133 @@
+import math
 import random
-from typing import Tuple, List
+import logging
+from array import array
+from typing import Iterator, Tuple, Optional, Sequence, Union
+from .samplers import Sampler, RandomSampler
+from .regions import Region, Quadrant
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : le moteur Python reste disponible
+    np = None  # type: ignore[assignment]
+
+
+# Moteurs de calcul disponibles pour count_inside
+ENGINES = ("python", "numpy", "integer")
+
+# Moteurs vectorisés, qui nécessitent numpy
+VECTOR_ENGINES = ("numpy", "integer")
+
+# Nombre de bits de chaque coordonnée du moteur integer : x, y < 2^31 donc
+# x² + y² < 2^63 tient dans un entier non signé de 64 bits
+INTEGER_BITS = 31
+
+# Rayon du quart de cercle sur la grille entière, et son carré
+INTEGER_RADIUS = 1 << INTEGER_BITS
+INTEGER_RADIUS_SQUARED = INTEGER_RADIUS * INTEGER_RADIUS
+
+# Taille des blocs tirés par le moteur numpy (borne la mémoire utilisée)
+BLOCK_SIZE = 65536
+
+# Quantile de la loi normale pour un intervalle de confiance à 95 %
+Z_95 = 1.959963984540054
+
+
+def resolve_engine(engine: str) -> str:
+    """
+    Retourne le moteur effectivement utilisable, en se rabattant sur le moteur
+    Python si numpy n'est pas installé
+
+    Args:
+        engine (str): Le moteur demandé ("python", "numpy" ou "integer")
+
+    Returns:
+        str: Le moteur utilisé
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur inconnu: {engine} (choix possibles: {', '.join(ENGINES)})")
+    if engine in VECTOR_ENGINES and np is None:
+        logging.warning("numpy n'est pas installé, utilisation du moteur python")
+        return "python"
+    return engine
+
+
+def count_lattice_in_quadrant(raw) -> int:
+    """
+    Test d'appartenance exact du moteur integer. Chaque tirage brut de 64 bits
+    fournit deux coordonnées entières de INTEGER_BITS bits, x = bits 33 à 63 et
+    y = bits 1 à 31, soit le point (x / R, y / R) de la grille de pas 1 / R avec
+    R = 2^31. Le point est dans le quadrant si x² + y² <= R².
+
+    Le test est exact : x, y <= R - 1 donc x² + y² <= 2 (R - 1)² < 2 R² = 2^63,
+    aucun des calculs en uint64 ne déborde, et la comparaison d'entiers n'a pas
+    d'arrondi. Le test en flottants, lui, arrondit x² + y² à 2^-53 près et se
+    trompe sur les points à moins de 2^-53 du cercle.
+
+    Args:
+        raw (np.ndarray): Les tirages bruts, de type uint64. Le tableau n'est
+            plus utilisé après l'appel.
+
+    Returns:
+        int: Le nombre de points dans le quadrant
+    """
+    xs = raw >> np.uint64(64 - INTEGER_BITS)
+    ys = raw >> np.uint64(1)
+    ys &= np.uint64(INTEGER_RADIUS - 1)
+    np.multiply(xs, xs, out=xs)
+    np.multiply(ys, ys, out=ys)
+    xs += ys
+    return int(np.count_nonzero(xs <= np.uint64(INTEGER_RADIUS_SQUARED)))
+
+
+class PointBlock:
+    """
+    Bloc de points en colonnes : deux tableaux compacts de flottants pour x et y
+    (array('d') ou numpy) et un octet par point pour l'appartenance au quadrant,
+    soit 17 octets par point au lieu d'environ 120 pour une liste de tuples
+    (x, y, is_inside). Le bloc se parcourt, s'indexe et se découpe comme une
+    liste de tuples ; les colonnes se passent telles quelles au GUI.
+    """
+
+    def __init__(self, xs, ys, inside_flags):
+        """
+        Args:
+            xs: Les abscisses
+            ys: Les ordonnées
+            inside_flags: Les indicateurs d'appartenance (bytearray ou tableau numpy de booléens)
+        """
+        self.xs = xs
+        self.ys = ys
+        self.inside_flags = inside_flags
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __iter__(self) -> Iterator[Tuple[float, float, bool]]:
+        xs, ys, flags = self.xs, self.ys, self.inside_flags
+        if hasattr(xs, "astype"):
+            # Colonnes numpy : conversion en une fois plutôt que scalaire par scalaire
+            xs, ys, flags = xs.tolist(), ys.tolist(), flags.tolist()
+        for x, y, is_inside in zip(xs, ys, flags):
+            yield x, y, bool(is_inside)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return PointBlock(self.xs[index], self.ys[index], self.inside_flags[index])
+        return float(self.xs[index]), float(self.ys[index]), bool(self.inside_flags[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (PointBlock, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Mémoire occupée par les colonnes, en octets
+        """
+        return sum(column.nbytes if hasattr(column, "nbytes") else len(column) * memoryview(column).itemsize
+                   for column in (self.xs, self.ys, self.inside_flags))
 
 
 class MonteCarloSimulation: 
@@ -7,25 +135,48 @@ class MonteCarloSimulation:
     Classe pour effectuer les calculs Monte Carlo pour l'approximation de pi
     """
 
-    def __init__(self, seed: int):
+    def __init__(self, seed: Optional[int], engine: str = "python", block_size: int = BLOCK_SIZE,
+                 sampler: Optional[Sampler] = None, region: Optional[Region] = None):
         """
         Initialise la classe MonteCarloSimulation
 
         Args:
             seed (int, optional): La graine pour le générateur de nombres aléatoires. Defaults to None.
+            engine (str): Le moteur de calcul, "python", "numpy" ou "integer" (bits
+                aléatoires bruts et test exact en entiers, quadrant et
+                échantillonneur random uniquement). Defaults to "python".
+            block_size (int): Nombre de points tirés par bloc par le moteur numpy. Defaults to BLOCK_SIZE.
+            sampler (Sampler, optional): La source de points. Defaults to None (pseudo-aléatoire
+                avec un générateur privé initialisé par seed).
+            region (Region, optional): La région dont count_inside compte les points.
+                Defaults to None (quadrant du cercle unité).
         """
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
-        
+        self.engine = resolve_engine(engine)
+        self.block_size = block_size
+        self.region = region if region is not None else Quadrant()
+        # Source de points privée : aucun état aléatoire partagé entre instances
+        self.sampler = sampler if sampler is not None else RandomSampler(seed, self.region.dimension)
+        if self.sampler.dimension != self.region.dimension:
+            raise ValueError(f"L'échantillonneur est de dimension {self.sampler.dimension}, "
+                             f"la région de dimension {self.region.dimension}")
+        if self.engine == "integer" and not (isinstance(self.region, Quadrant)
+                                             and isinstance(self.sampler, RandomSampler)):
+            raise ValueError("Le moteur integer n'est disponible que pour le quadrant "
+                             "avec l'échantillonneur random")
+
     
     @staticmethod
-    def generate_random_points() -> Tuple[float, float]:
+    def generate_random_points(rng: Optional[random.Random] = None) -> Tuple[float, float]:
         """
         Génère un point aléatoire dans le carré de côté 1
+
+        Args:
+            rng (random.Random, optional): Le générateur à utiliser. Defaults to None (module random).
         """
-        x = random.uniform(0, 1)
-        y = random.uniform(0, 1)
+        uniform = random.uniform if rng is None else rng.uniform
+        x = uniform(0, 1)
+        y = uniform(0, 1)
         return x, y
 
     @staticmethod
@@ -44,23 +195,90 @@ class MonteCarloSimulation:
     
     def count_inside(self, n: int) -> int:
         """
-        Génère n points et retourne uniquement le nombre de points dans le quadrant,
-        sans stocker les coordonnées.
+        Génère n points et retourne uniquement le nombre de points dans la région
+        (le quadrant par défaut), sans stocker les coordonnées. Les n points sont
+        passés d'un seul lot à la région.
+
+        Args:
+            n (int): Le nombre de points à générer
+
+        Returns:
+            int: Le nombre de points dans la région
+        """
+        if self.engine == "numpy":
+            return self._count_inside_numpy(n)
+        if self.engine == "integer":
+            return self._count_inside_integer(n)
+
+        return self.region.count_points(self.sampler.points(n))
+
+    def _count_inside_numpy(self, n: int) -> int:
+        """
+        Version vectorisée de count_inside : les points sont tirés par blocs de
+        block_size et le test d'appartenance est fait sur le bloc entier, ce qui
+        borne la mémoire quel que soit n.
+
+        Args:
+            n (int): Le nombre de points à générer
+
+        Returns:
+            int: Le nombre de points dans la région
+        """
+        count_inside = 0
+        remaining = n
+        while remaining > 0:
+            size = min(remaining, self.block_size)
+            count_inside += self.region.count_block(self.sampler.block(size))
+            remaining -= size
+        return count_inside
+
+    def _count_inside_integer(self, n: int) -> int:
+        """
+        Version entière de count_inside : un tirage brut de 64 bits par point,
+        sans conversion en flottant, et test exact (count_lattice_in_quadrant)
+        sur des blocs de block_size points.
 
         Args:
             n (int): Le nombre de points à générer
 
         Returns:
             int: Le nombre de points dans le quadrant
+
+        Raises:
+            ValueError: Si l'échantillonneur n'est pas pseudo-aléatoire (random)
         """
+        sampler = self.sampler
+        if not isinstance(sampler, RandomSampler):
+            raise ValueError("Le moteur integer n'est disponible qu'avec l'échantillonneur random")
         count_inside = 0
-        for _ in range(n):
-            x, y = self.generate_random_points()
-            if self.is_in_quadrant(x, y):
-                count_inside += 1
+        remaining = n
+        while remaining > 0:
+            size = min(remaining, self.block_size)
+            count_inside += count_lattice_in_quadrant(sampler.raw_block(size))
+            remaining -= size
         return count_inside
 
-    def generate_point(self, n: int) -> Tuple[List[Tuple[float, float, bool]], int]:
+    def update_estimator(self, estimator, n: int) -> None:
+        """
+        Tire n points et les passe à un estimateur de pi (voir estimators), par
+        blocs de block_size avec le moteur numpy
+
+        Args:
+            estimator (Estimator): L'estimateur à alimenter
+            n (int): Le nombre de points à générer
+        """
+        if self.engine == "integer":
+            raise ValueError("Les estimateurs nécessitent des points flottants : moteur python ou numpy")
+        if self.engine == "python":
+            estimator.update_points(self.sampler.points(n))
+            return
+        remaining = n
+        while remaining > 0:
+            size = min(remaining, self.block_size)
+            estimator.update_block(self.sampler.block(size))
+            remaining -= size
+
+    def generate_point(self, n: int) -> Tuple[PointBlock, int]:
         """
         Génère n points aléatoires dans le carré de côté 1 et compte ceux qui sont dans le quadrant
 
@@ -68,30 +286,53 @@ class MonteCarloSimulation:
             n (int): Le nombre de points à générer
 
         Returns:
-            Tuple qui contient la liste des points avec leur statut, et le nombre de points dans le quadrant
-            Format : ([(x1, y1, is_inside), ...], count_inside)
+            Tuple qui contient les points avec leur statut, en colonnes, et le nombre de points dans le quadrant
+            Format : (PointBlock, count_inside), le bloc se parcourant comme [(x1, y1, is_inside), ...]
         """
-        points = []
-        count_inside = 0
+        xs, ys, inside_flags, count_inside = self.generate_point_arrays(n)
+        return (PointBlock(xs, ys, inside_flags), count_inside)
 
-        for _ in range(n):
-            x, y = self.generate_random_points()
-            is_inside = self.is_in_quadrant(x, y)
-            points.append((x, y, is_inside))
+    def generate_point_arrays(self, n: int) -> Tuple[Sequence[float], Sequence[float], Sequence[int], int]:
+        """
+        Génère n points et les retourne sous forme de tableaux compacts (un par
+        coordonnée) plutôt qu'une liste de tuples, pour la livraison par blocs au GUI.
 
-            if is_inside:
-                count_inside += 1
+        Args:
+            n (int): Le nombre de points à générer
 
-        return (points, count_inside)
+        Returns:
+            Tuple (xs, ys, inside_flags, count_inside) où xs et ys sont des tableaux
+            de flottants (array('d') ou numpy) et inside_flags un tableau d'octets/booléens
+        """
+        if self.engine in VECTOR_ENGINES:
+            points = self.sampler.block(n)
+            xs = points[:, 0].copy()
+            ys = points[:, 1].copy()
+            inside_flags = (xs * xs + ys * ys) <= 1.0
+            return xs, ys, inside_flags, int(np.count_nonzero(inside_flags))
+
+        xs = array('d')
+        ys = array('d')
+        inside_flags = bytearray(n)
+        count_inside = 0
+        for i, (x, y) in enumerate(self.sampler.points(n)):
+            xs.append(x)
+            ys.append(y)
+            if self.is_in_quadrant(x, y):
+                inside_flags[i] = 1
+                count_inside += 1
+        return xs, ys, inside_flags, count_inside
     
     @staticmethod
-    def estimate_pi(total_points: int, count_inside: int) -> float:
+    def estimate_pi(total_points: int, count_inside: int, scale: float = 4.0) -> float:
         """
         Calcule l'approximation de pi à partir du nombre total de points et du nombre de points dans le quadrant
 
         Args:
             total_points (int): Le nombre total de points générés
             count_inside (int): Le nombre de points qui sont dans le quadrant
+            scale (float): Le facteur appliqué à la proportion (Region.scale pour
+                une autre région). Defaults to 4.0 (pi).
 
         Returns:
             float: L'approximation de pi
@@ -100,7 +341,61 @@ class MonteCarloSimulation:
             return 0.0
         
         ratio = count_inside / total_points
-        return 4.0 * ratio
+        return scale * ratio
+
+    @staticmethod
+    def standard_error(total_points: int, count_inside: int, scale: float = 4.0) -> float:
+        """
+        Calcule l'erreur type de l'estimation de pi. Chaque tirage est une variable
+        de Bernoulli de paramètre p = pi/4, donc Var(4 * ratio) = 16 p (1 - p) / n.
+
+        Args:
+            total_points (int): Le nombre total de points générés
+            count_inside (int): Le nombre de points qui sont dans le quadrant
+            scale (float): Le facteur appliqué à la proportion. Defaults to 4.0 (pi).
+
+        Returns:
+            float: L'erreur type de l'estimation (inf si aucun point n'a été tiré)
+        """
+        if total_points == 0:
+            return math.inf
+
+        ratio = count_inside / total_points
+        return scale * math.sqrt(ratio * (1.0 - ratio) / total_points)
+
+    @staticmethod
+    def confidence_interval(total_points: int, count_inside: int, z: float = Z_95,
+                            scale: float = 4.0) -> Tuple[float, float]:
+        """
+        Calcule l'intervalle de confiance (approximation normale) sur pi
+
+        Args:
+            total_points (int): Le nombre total de points générés
+            count_inside (int): Le nombre de points qui sont dans le quadrant
+            z (float): Le quantile de la loi normale. Defaults to Z_95 (95 %).
+            scale (float): Le facteur appliqué à la proportion. Defaults to 4.0 (pi).
+
+        Returns:
+            Tuple (borne_inf, borne_sup)
+        """
+        pi_estimate = MonteCarloSimulation.estimate_pi(total_points, count_inside, scale)
+        half_width = z * MonteCarloSimulation.standard_error(total_points, count_inside, scale)
+        return (pi_estimate - half_width, pi_estimate + half_width)
+
+    @staticmethod
+    def stderr_for_digits(digits: int, z: float = Z_95) -> float:
+        """
+        Convertit un nombre de décimales exactes visé en erreur type cible : la
+        demi-largeur de l'intervalle de confiance doit rester sous 0.5 * 10^-digits.
+
+        Args:
+            digits (int): Le nombre de décimales visé
+            z (float): Le quantile de la loi normale. Defaults to Z_95 (95 %).
+
+        Returns:
+            float: L'erreur type cible
+        """
+        return 0.5 * 10.0 ** (-digits) / z
 
 
 class PointGenerator: 
@@ -108,17 +403,20 @@ class PointGenerator:
     Classe pour générer les points en utilisant le threading
     """
 
-    def __init__(self, seed: int):
+    def __init__(self, seed: Optional[int], engine: str = "python", sampler: Optional[Sampler] = None,
+                 block_size: int = BLOCK_SIZE, region: Optional[Region] = None):
         """
         Initialise le générateur
 
         Args : 
             seed (int, optional): La graine pour le générateur de nombres aléatoires. Defaults to None.
+            engine (str): Le moteur utilisé par generate_batch, "python", "numpy" ou "integer". Defaults to "python".
+            sampler (Sampler, optional): La source de points. Defaults to None (pseudo-aléatoire).
+            block_size (int): Nombre de points par bloc du moteur numpy. Defaults to BLOCK_SIZE.
+            region (Region, optional): La région évaluée par generate_batch. Defaults to None (quadrant).
         """
-        if seed is not None:
-            random.seed(seed)
-        
-        self.calculator = MonteCarloSimulation(seed)
+        self.calculator = MonteCarloSimulation(seed, engine=engine, sampler=sampler,
+                                               block_size=block_size, region=region)
     
     def generate_batch(self, n: int) -> Tuple[int, int]:
         """
@@ -129,12 +427,27 @@ class PointGenerator:
             n (int): Nombre de points à générer
         
         Returns:
-            Tuple de la forme (total_points, inside_points)
+            Tuple de la forme (total_points, inside_points), inside_points comptant
+            les points dans la région
         """
         inside_points = self.calculator.count_inside(n)
         return (n, inside_points)
     
-    def generate_points_with_details(self, n: int) -> Tuple[List[Tuple[float, float, bool]], int]:
+    def generate_estimate(self, estimator, n: int):
+        """
+        Génère un échantillon de n points et l'ajoute à un estimateur de pi
+
+        Args:
+            estimator (Estimator): L'estimateur à alimenter
+            n (int): Nombre de points à générer
+
+        Returns:
+            Estimator: L'estimateur alimenté
+        """
+        self.calculator.update_estimator(estimator, n)
+        return estimator
+
+    def generate_points_with_details(self, n: int) -> Tuple[PointBlock, int]:
         """
         Génère un échantillon de n points et retourne les détails de chaque point pour l'affichage GUI
 
@@ -142,6 +455,37 @@ class PointGenerator:
             n (int): Nombre de points à générer
         
         Returns:
-            Tuple de la forme ([(x1, y1, is_inside), ...], inside_points)
+            Tuple de la forme (PointBlock, inside_points)
+        """
+        return self.calculator.generate_point(n)
+
+    def generate_point_arrays(self, n: int) -> Tuple[Sequence[float], Sequence[float], Sequence[int], int]:
+        """
+        Génère un bloc de n points sous forme de tableaux compacts pour l'affichage GUI
+
+        Args:
+            n (int): Nombre de points à générer
+
+        Returns:
+            Tuple de la forme (xs, ys, inside_flags, inside_points)
+        """
+        return self.calculator.generate_point_arrays(n)
+
+    def get_state(self) -> dict:
+        """
+        Retourne l'état de la source de points, pour reprendre le tirage plus tard
+
+        Returns:
+            dict: L'état, sérialisable en JSON
+        """
+        return self.calculator.sampler.get_state()
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restaure un état obtenu par get_state : les tirages suivants sont ceux
+        qui auraient suivi au moment de la sauvegarde
+
+        Args:
+            state (dict): L'état à restaurer
         """
-        return self.calculator.generate_point(n)
\ No newline at end of file
+        self.calculator.sampler.set_state(state)
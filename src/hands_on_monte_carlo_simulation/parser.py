@@ -1,6 +1,7 @@
+import os
 import argparse
 
-def parse_arguments():
+def parse_arguments(argv=None):
     parser = argparse.ArgumentParser(description="Monte Carlo Simulation Parameters",
                                      add_help=False)
     #paramètres pour GUI 
@@ -14,6 +15,8 @@ def parse_arguments():
                         help='The background color of the GUI window. Default is white.')
     parser.add_argument('--circle-color', type=str, default='black',
                         help='The color of the quadrant circle in the GUI. Default is black.')
+    parser.add_argument('--gui-batch-size', type=int, default=1000,
+                        help='The number of points delivered to the GUI at once by each thread. Default is 1000.')
     parser.add_argument('--screen', type=str, default='main',
                         help='The screen to display the quadrant circle on. Default is "main".')
 
@@ -28,10 +31,198 @@ def parse_arguments():
                         help='The number of threads to run.')
     parser.add_argument('-N', '--nb-draws', type=int, default=1000,
                         help='The number of random draws for each thread.')
+    parser.add_argument('--total-draws', type=int, default=None,
+                        help='The total number of random draws, split into chunks that the workers pick up as soon as they are free. -N is ignored when this option is given.')
+    parser.add_argument('--chunk-size', type=int, default=100_000,
+                        help='With --total-draws, the number of draws per chunk. The result depends on the seed and the chunk size, not on the number of workers. Default is 100000.')
     parser.add_argument('-x', '--gui', action='store_true',
                         help='Enable GUI display. By default, no GUI window is opened.')
     parser.add_argument('-s', '--seed', type=int, default=None,
                         help='An optional seed for the random number generator to ensure reproducibility.'
                         )
+    parser.add_argument('--backend', type=str, choices=['thread', 'process', 'auto'], default='thread',
+                        help='The execution backend for the workers. "process" runs each worker in its own process to use several cores, "auto" picks processes when more than one worker is requested, and threads on a free-threaded (no-GIL) interpreter. With the GUI, process workers hand their points to the display through shared-memory ring buffers. Default is thread.')
+    parser.add_argument('--engine', type=str, choices=['python', 'numpy', 'integer'], default='python',
+                        help='The sampling engine. "numpy" draws points in vectorized blocks, "integer" draws raw 64-bit integers and tests x²+y² <= R² exactly in integer arithmetic (quadrant and random sampler only). Both fall back to "python" if numpy is not installed. Default is python.')
+    parser.add_argument('--sampler', type=str, choices=['random', 'philox', 'halton', 'sobol'], default='random',
+                        help='The point source. "philox" is a counter-based pseudo-random generator whose point i depends only on i, so with a seed the result does not depend on the number of workers. "halton" and "sobol" are scrambled low-discrepancy sequences. With these three, each worker uses a disjoint segment of a single sequence. Default is random.')
+    parser.add_argument('--region', type=str, default='quadrant',
+                        help='The region whose measure is estimated: "quadrant" (pi), "hypersphere" (volume of the unit ball of --dimension), or module:Class for a Region plugin. Default is quadrant.')
+    parser.add_argument('--dimension', type=int, default=None,
+                        help='The dimension of the drawn points, for regions that accept one. Default is the region default (2).')
+    parser.add_argument('--compare-random', action='store_true',
+                        help='With a quasi-random sampler, also run pseudo-random sampling with the same number of draws and report both errors.')
+    parser.add_argument('--checkpoint', type=str, default=None,
+                        help='Periodically save the worker counters and random generator states to this file so that the run can be resumed with --resume.')
+    parser.add_argument('--checkpoint-interval', type=float, default=60.0,
+                        help='The number of seconds between two checkpoint writes. Default is 60.')
+    parser.add_argument('--resume', type=str, default=None,
+                        help='Resume the run saved in this checkpoint file. The simulation parameters are read from the file, and checkpoints keep being written to it unless --checkpoint is given.')
+    parser.add_argument('--telemetry', type=str, default=None,
+                        help='Write live throughput, progress, ETA and worker utilization samples as JSON lines to this file. - means stderr.')
+    parser.add_argument('--telemetry-interval', type=float, default=1.0,
+                        help='The number of seconds between two telemetry samples. Default is 1.')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='Serve the latest telemetry sample in the Prometheus text format on http://127.0.0.1:PORT/metrics during the run.')
+    parser.add_argument('--trace', type=str, default=None,
+                        help='Stream the convergence trajectory (cumulative points, inside count, estimate and standard error) to this file while the simulation runs.')
+    parser.add_argument('--trace-format', type=str, choices=['csv', 'jsonl'], default=None,
+                        help='The trace file format. Default is csv for a .csv file, jsonl otherwise.')
+    parser.add_argument('--trace-every', type=int, default=10_000,
+                        help='The number of draws of a worker between two trace records. Default is 10000.')
+    parser.add_argument('--cache', type=str, default=None,
+                        help='A directory caching the per-shard counters of seeded runs. Rerunning a cached configuration is instant, and asking for more draws only computes the new ones. Requires --seed.')
+    parser.add_argument('--cache-size', type=float, default=64,
+                        help='The maximum size of the cache directory in MB; least recently used entries are removed beyond it. Default is 64.')
+    parser.add_argument('--estimator', type=str, choices=['hit-or-miss', 'stratified', 'antithetic', 'control-variate'], default=None,
+                        help='Estimate pi with this estimator and report its standard error: "stratified" spreads the draws over a grid of cells, "antithetic" also evaluates (1-x, 1-y) for each point, "control-variate" integrates the quarter circle height sqrt(1-x²) with x² as a control variate. Quadrant, random or philox sampler, python or numpy engine.')
+    parser.add_argument('--compare-estimators', action='store_true',
+                        help='Run every estimator with the same number of draws and report, for each, its standard error, its variance per draw and its cost for a given precision, to pick the cheapest one.')
+    precision = parser.add_mutually_exclusive_group()
+    precision.add_argument('--target-stderr', type=float, default=None,
+                           help='Run until the standard error of the estimate of pi falls below this value, then stop all workers. -N is ignored in this mode. Requires --sampler random or philox.')
+    precision.add_argument('--target-digits', type=int, default=None,
+                           help='Run until the 95%% confidence interval on pi guarantees this many decimal digits. -N is ignored in this mode. Requires --sampler random or philox.')
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_bench_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="monte-carlo-simulation bench",
+                                     description="Throughput benchmark of the Monte Carlo simulation. Every combination of the swept parameters is measured.")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase verbosity level. -v for information, -vv for debug.')
+    parser.add_argument('-o', '--output', type=str, default='-',
+                        help='The JSON file in which to write the results. - is the default and means to print on stdout.')
+    parser.add_argument('--engines', type=str, nargs='+', choices=['python', 'numpy', 'integer'], default=['python', 'numpy', 'integer'],
+                        help='The sampling engines to measure. Default is python numpy integer.')
+    parser.add_argument('--backends', type=str, nargs='+', choices=['thread', 'process'], default=['thread', 'process'],
+                        help='The execution backends to measure. Default is thread process.')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='The worker counts to measure. Default is 1 2 4.')
+    parser.add_argument('--draws', type=int, nargs='+', default=[1_000_000],
+                        help='The numbers of draws per worker to measure. Default is 1000000.')
+    parser.add_argument('--block-sizes', type=int, nargs='+', default=[65536],
+                        help='The block sizes of the vectorized engines to measure (not swept for the python engine). Default is 65536.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='The number of measured runs per case; the best one is kept. Default is 3.')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='The number of unmeasured warmup runs per case. Default is 1.')
+    parser.add_argument('--no-isolate', dest='isolate', action='store_false',
+                        help='Run every case in the current process. Faster, but peak_rss_kb then becomes the maximum over all cases run so far.')
+    parser.add_argument('--startup', action='store_true',
+                        help='Also measure the startup time of a short CLI run in a fresh interpreter, and fail if GUI modules (pygame) get imported without --gui.')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='A previous JSON result file to compare against. The exit status is 1 if a case is slower than the baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='The relative throughput drop tolerated before reporting a regression. Default is 0.1.')
+
+    return parser.parse_args(argv)
+
+
+def parse_serve_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="monte-carlo-simulation serve",
+                                     description="Long-lived estimation service on localhost. A warm pool of workers answers JSON requests: POST /estimate with {\"draws\", \"seed\", \"engine\", \"sampler\", \"region\", \"dimension\", \"target_stderr\"}. GET /stats and GET /metrics (Prometheus) expose request, throughput and latency counters.")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase verbosity level. -v for information, -vv for debug (one line per request).')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='The HTTP port on 127.0.0.1, 0 for any free port. Default is 8765.')
+    parser.add_argument('--unix-socket', type=str, default=None,
+                        help='Serve the same HTTP/JSON protocol on this Unix socket instead of the TCP port.')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='The number of warm workers. Default is the number of CPUs.')
+    parser.add_argument('--backend', type=str, choices=['thread', 'process', 'auto'], default='process',
+                        help='The worker backend. "auto" picks threads on a free-threaded (no-GIL) interpreter. Default is process.')
+    parser.add_argument('--shard-size', type=int, default=100_000,
+                        help='The number of draws per shard. Workers are shared between requests shard by shard, in turn. With a seed, the result depends on the shard size only. Default is 100000.')
+    parser.add_argument('--batch-draws', type=int, default=100_000,
+                        help='Shards of small requests are batched into a single task until it holds this many draws. Default is 100000.')
+    parser.add_argument('--max-draws', type=int, default=10 ** 9,
+                        help='The maximum number of draws of a request, also the cap of a request with only a target_stderr. Default is 1000000000.')
+    parser.add_argument('--max-pending', type=int, default=1000,
+                        help='The maximum number of queued or running requests; further requests get a 503 answer. Default is 1000.')
+    parser.add_argument('--allow-plugin-regions', action='store_true',
+                        help='Accept module:Class regions in requests. Building such a region imports its module, so any client could run the top-level code of any installed module: only use with trusted clients. By default only the built-in regions are accepted.')
+
+    return parser.parse_args(argv)
+
+
+def parse_sweep_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="monte-carlo-simulation sweep",
+                                     description="Parameter sweep: run many estimation configurations, from a grid or a file, over a single warm pool of workers. Configurations are served in turn shard by shard and small ones are batched together, so workers stay busy. One result row per configuration is written as soon as it finishes.")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase verbosity level. -v for information, -vv for debug (one line per configuration).')
+    parser.add_argument('-o', '--output', type=str, default='-',
+                        help='The file in which to write one row per configuration, in completion order (the config column gives the original order). - is the default and means to print on stdout.')
+    parser.add_argument('--format', type=str, choices=['csv', 'jsonl'], default=None,
+                        help='The output format. Default is csv if the output file ends with .csv, jsonl otherwise.')
+    parser.add_argument('--configs', type=str, default=None,
+                        help='A file of configurations: one JSON object per line, or a CSV file (.csv) whose header names the fields, with keys among draws, seed, engine, sampler, region, dimension, target_stderr. Replaces the grid options.')
+    parser.add_argument('--draws', type=int, nargs='+', default=[1_000_000],
+                        help='Grid: the numbers of draws (the cap when a target standard error is given). Default is 1000000.')
+    parser.add_argument('--seeds', type=int, nargs='+', default=[None],
+                        help='Grid: the seeds. Default is one random seed per configuration, written in the output.')
+    parser.add_argument('--engines', type=str, nargs='+', choices=['python', 'numpy', 'integer'], default=['python'],
+                        help='Grid: the sampling engines. Default is python.')
+    parser.add_argument('--samplers', type=str, nargs='+', choices=['random', 'philox', 'halton', 'sobol'], default=['random'],
+                        help='Grid: the point sources. Default is random.')
+    parser.add_argument('--regions', type=str, nargs='+', default=['quadrant'],
+                        help='Grid: the regions (quadrant, hypersphere or module:Class). Default is quadrant.')
+    parser.add_argument('--dimensions', type=int, nargs='+', default=[None],
+                        help='Grid: the dimensions of the drawn points. Default is the region default.')
+    parser.add_argument('--target-stderrs', type=float, nargs='+', default=[None],
+                        help='Grid: stop a configuration once its standard error falls below this value (pseudo-random samplers only). Default is none.')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='The number of workers of the shared pool. Default is the number of CPUs.')
+    parser.add_argument('--backend', type=str, choices=['thread', 'process', 'auto'], default='process',
+                        help='The worker backend. "auto" picks threads on a free-threaded (no-GIL) interpreter. Default is process.')
+    parser.add_argument('--shard-size', type=int, default=100_000,
+                        help='The number of draws per shard. With a seed, the result depends on the shard size only. Default is 100000.')
+    parser.add_argument('--batch-draws', type=int, default=100_000,
+                        help='Shards of small configurations are batched into a single task until it holds this many draws. Default is 100000.')
+    parser.add_argument('--max-draws', type=int, default=10 ** 9,
+                        help='The maximum number of draws of a configuration, also the cap of a configuration with only a target standard error. Default is 1000000000.')
+    parser.add_argument('--max-pending', type=int, default=1000,
+                        help='The maximum number of configurations queued at once. Default is 1000.')
+
+    return parser.parse_args(argv)
+
+
+def parse_coordinator_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="monte-carlo-simulation coordinator",
+                                     description="Split the draw budget into seed-disjoint shards and hand them to workers connecting over TCP (see the worker command).")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase verbosity level. -v for information, -vv for debug.')
+    parser.add_argument('-o', '--output', type=str, default='-',
+                        help='The output file in which to write the result. - is the default and means to print on stdout.')
+    parser.add_argument('--listen', type=str, default='127.0.0.1:5555',
+                        help='The host:port to listen on. Use 0.0.0.0:PORT to accept workers from other machines. Default is 127.0.0.1:5555.')
+    parser.add_argument('-N', '--total-draws', type=int, required=True,
+                        help='The total number of random draws, over all workers.')
+    parser.add_argument('--shard-size', type=int, default=1_000_000,
+                        help='The number of draws handed to a worker at once. Default is 1000000.')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='An optional seed. The result does not depend on the number of workers nor on which worker computes which shard.')
+    parser.add_argument('--engine', type=str, choices=['python', 'numpy', 'integer'], default='python',
+                        help='The sampling engine used by the workers. Default is python.')
+    parser.add_argument('--sampler', type=str, choices=['random', 'philox', 'halton', 'sobol'], default='random',
+                        help='The point source. Default is random.')
+    parser.add_argument('--region', type=str, default='quadrant',
+                        help='The region whose measure is estimated: "quadrant" (pi), "hypersphere" (volume of the unit ball of --dimension), or module:Class for a Region plugin. Default is quadrant.')
+    parser.add_argument('--dimension', type=int, default=None,
+                        help='The dimension of the drawn points, for regions that accept one. Default is the region default (2).')
+
+    return parser.parse_args(argv)
+
+
+def parse_worker_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="monte-carlo-simulation worker",
+                                     description="Compute the shards handed out by a coordinator until none are left.")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Increase verbosity level. -v for information, -vv for debug.')
+    parser.add_argument('--connect', type=str, required=True,
+                        help='The host:port of the coordinator.')
+    parser.add_argument('--connect-timeout', type=float, default=10.0,
+                        help='The number of seconds during which the connection is retried. Default is 10.')
+
+    return parser.parse_args(argv)
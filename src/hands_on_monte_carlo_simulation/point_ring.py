@@ -0,0 +1,122 @@
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple, cast
+
+
+# Nombre de points conservés par tampon : au-delà, le GUI ne dessine que les plus récents
+RING_CAPACITY = 1 << 16
+
+# En-tête du tampon : points écrits depuis le début, points dans le quadrant (uint64)
+HEADER_SIZE = 16
+
+
+class PointRing:
+    """
+    Tampon circulaire en mémoire partagée entre un worker processus (unique
+    écrivain) et le GUI (unique lecteur). Les coordonnées et les indicateurs
+    d'appartenance sont stockés en tableaux compacts (float64, float64, uint8) ;
+    l'en-tête contient les compteurs du worker, publiés après les points.
+
+    Aucun verrou : le lecteur ne lit que les emplacements écrits avant le
+    compteur qu'il a relu. S'il prend plus de capacity points de retard, les
+    plus anciens sont sautés (ils restent comptés dans les statistiques).
+    """
+
+    def __init__(self, capacity: int = RING_CAPACITY, name: Optional[str] = None):
+        """
+        Crée le tampon, ou s'y attache s'il existe déjà
+
+        Args:
+            capacity (int): Le nombre d'emplacements. Defaults to RING_CAPACITY.
+            name (str, optional): Le nom du segment de mémoire partagée auquel
+                s'attacher (côté worker). Defaults to None (création).
+        """
+        self.capacity = capacity
+        size = HEADER_SIZE + 17 * capacity
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            # Le segment appartient au processus qui l'a créé : pas de suivi ici
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        # Défini tant que le segment n'est pas fermé
+        buffer = cast(memoryview, self.shm.buf)
+        self.header = buffer[:HEADER_SIZE].cast('Q')
+        self.xs = buffer[HEADER_SIZE:HEADER_SIZE + 8 * capacity].cast('d')
+        self.ys = buffer[HEADER_SIZE + 8 * capacity:HEADER_SIZE + 16 * capacity].cast('d')
+        self.flags = buffer[HEADER_SIZE + 16 * capacity:size]
+        # Position du lecteur (côté GUI uniquement)
+        self.read_points = 0
+        self.read_inside = 0
+
+    @property
+    def name(self) -> str:
+        """
+        Le nom du segment, à transmettre au worker
+        """
+        return self.shm.name
+
+    def __reduce__(self):
+        # Un tampon transmis à un processus s'y rattache par son nom
+        return (PointRing, (self.capacity, self.name))
+
+    def write(self, xs, ys, inside_flags, inside_count: int) -> None:
+        """
+        Ajoute un bloc de points (côté worker) : les colonnes d'un PointBlock
+
+        Args:
+            xs: Les abscisses (array('d') ou tableau numpy float64)
+            ys: Les ordonnées
+            inside_flags: Les indicateurs (bytearray ou tableau numpy de booléens)
+            inside_count (int): Le nombre de points du bloc dans le quadrant
+        """
+        n = len(xs)
+        written = self.header[0]
+        xs, ys = memoryview(xs), memoryview(ys)
+        inside_flags = memoryview(inside_flags).cast('B')
+        # Seuls les capacity derniers points du bloc peuvent être conservés
+        first = max(0, n - self.capacity)
+        start = (written + first) % self.capacity
+        while first < n:
+            count = min(n - first, self.capacity - start)
+            self.xs[start:start + count] = xs[first:first + count]
+            self.ys[start:start + count] = ys[first:first + count]
+            self.flags[start:start + count] = inside_flags[first:first + count]
+            first += count
+            start = 0
+        # Compteurs publiés après les points : le lecteur ne voit que des emplacements écrits
+        self.header[1] += inside_count
+        self.header[0] = written + n
+
+    def read(self) -> Tuple[List[Tuple["memoryview[float]", "memoryview[float]", "memoryview[int]"]], int, int]:
+        """
+        Retourne les points écrits depuis la dernière lecture (côté GUI), sans copie
+
+        Returns:
+            Tuple (blocs, nouveaux points, nouveaux points dans le quadrant), où
+            chaque bloc est un triplet de vues (xs, ys, inside_flags) sur le
+            tampon, valables jusqu'à ce que le worker en fasse le tour
+        """
+        written = self.header[0]
+        inside = self.header[1]
+        new_points, new_inside = written - self.read_points, inside - self.read_inside
+        blocks = []
+        position = max(self.read_points, written - self.capacity)
+        while position < written:
+            start = position % self.capacity
+            end = min(self.capacity, start + written - position)
+            blocks.append((self.xs[start:end], self.ys[start:end], self.flags[start:end]))
+            position += end - start
+        self.read_points, self.read_inside = written, inside
+        return blocks, new_points, new_inside
+
+    def close(self, unlink: bool = False) -> None:
+        """
+        Libère les vues et détache le segment
+
+        Args:
+            unlink (bool): Supprime aussi le segment (côté créateur). Defaults to False.
+        """
+        for view in (self.header, self.xs, self.ys, self.flags):
+            view.release()
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
@@ -0,0 +1,208 @@
+import math
+import importlib
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : les régions intégrées ont aussi une version Python
+    np = None  # type: ignore[assignment]
+
+
+class Region(ABC):
+    """
+    Région de l'hypercube unité [0, 1]^dimension dont on estime la mesure par
+    la proportion de points tirés qui y tombent. La quantité rapportée vaut
+    scale fois cette proportion.
+
+    Une région évalue toujours des lots de points entiers : contains() reçoit un
+    bloc numpy (moteur numpy) et count_points() un lot de tuples (moteur python).
+    Seul contains() est obligatoire ; la version Python par défaut convertit le
+    lot en tableau numpy.
+    """
+
+    # Dimension des points tirés
+    dimension: int = 2
+    # Facteur entre la proportion de points dans la région et la quantité rapportée
+    scale: float = 1.0
+    # Nom de la quantité rapportée dans les résultats
+    label: str = "mesure"
+    # Valeur exacte de la quantité, si elle est connue (comparaisons d'erreur)
+    exact: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        """
+        Identifiant de la région, accepté par make_region (module:Classe pour un plugin)
+        """
+        return f"{type(self).__module__}:{type(self).__qualname__}"
+
+    @abstractmethod
+    def contains(self, points):
+        """
+        Teste l'appartenance d'un bloc de points à la région
+
+        Args:
+            points (np.ndarray): Les points, de forme (n, dimension). Le tableau
+                n'est plus utilisé après l'appel et peut être modifié sur place.
+
+        Returns:
+            np.ndarray: Un tableau de booléens de forme (n,)
+        """
+        ...
+
+    def count_block(self, points) -> int:
+        """
+        Compte les points d'un bloc numpy qui sont dans la région
+        """
+        return int(np.count_nonzero(self.contains(points)))
+
+    def count_points(self, points: Iterable[Sequence[float]]) -> int:
+        """
+        Compte les points d'un lot (itérable de tuples) qui sont dans la région
+
+        Args:
+            points: Les points, chacun un tuple de dimension coordonnées
+
+        Returns:
+            int: Le nombre de points dans la région
+        """
+        if np is None:
+            raise RuntimeError(f"La région {self.name} n'a pas de version Python : numpy est nécessaire")
+        block = np.array(list(points), dtype=float).reshape(-1, self.dimension)
+        return self.count_block(block)
+
+
+class Hypersphere(Region):
+    """
+    Partie de la boule unité de dimension d contenue dans [0, 1]^d (un orthant).
+    La quantité rapportée est le volume de la boule entière, 2^d fois la proportion.
+    """
+
+    def __init__(self, dimension: int = 2):
+        if dimension < 1:
+            raise ValueError(f"La dimension doit être >= 1 (reçu {dimension})")
+        self.dimension = dimension
+        self.scale = float(2 ** dimension)
+        self.label = f"V_{dimension}"
+        self.exact = math.pi ** (dimension / 2) / math.gamma(dimension / 2 + 1)
+
+    @property
+    def name(self) -> str:
+        # Nom court pour la classe intégrée seulement : un plugin qui en hérite
+        # garde son chemin module:Classe et est reconstruit tel quel
+        return "hypersphere" if type(self) is Hypersphere else super().name
+
+    def contains(self, points):
+        np.square(points, out=points)
+        return points.sum(axis=1) <= 1.0
+
+    def count_points(self, points: Iterable[Sequence[float]]) -> int:
+        count = 0
+        for point in points:
+            if sum(c * c for c in point) <= 1.0:
+                count += 1
+        return count
+
+
+class Quadrant(Hypersphere):
+    """
+    Quart de disque unité dans le carré [0, 1]^2 : la quantité rapportée est π
+    """
+
+    def __init__(self, dimension: int = 2):
+        if dimension != 2:
+            raise ValueError(f"Le quadrant est une région de dimension 2 (reçu {dimension})")
+        super().__init__(2)
+        self.label = "π"
+
+    @property
+    def name(self) -> str:
+        return "quadrant" if type(self) is Quadrant else super().name
+
+    def count_points(self, points: Iterable[Sequence[float]]) -> int:
+        count = 0
+        for x, y in points:
+            if x * x + y * y <= 1:
+                count += 1
+        return count
+
+
+class Integrand(Region):
+    """
+    Base des intégrales ordinaires : l'intégrale sur [0, 1]^k d'une fonction f à
+    valeurs dans [0, bound] est estimée par la méthode du rejet. La région est
+    le dessous du graphe de f / bound dans [0, 1]^(k + 1), la dernière coordonnée
+    jouant le rôle d'ordonnée, et l'intégrale vaut bound fois sa proportion.
+
+    Les sous-classes définissent evaluate(), vectorisée, et éventuellement bound.
+    """
+
+    # Majorant de f sur [0, 1]^k
+    bound: float = 1.0
+    label = "intégrale"
+
+    def __init__(self, dimension: int = 2):
+        """
+        Args:
+            dimension (int): La dimension des points tirés, k + 1 pour un domaine
+                d'intégration de dimension k. Defaults to 2.
+        """
+        if dimension < 2:
+            raise ValueError(f"La dimension doit être >= 2 (reçu {dimension})")
+        self.dimension = dimension
+        self.scale = float(self.bound)
+
+    @abstractmethod
+    def evaluate(self, xs):
+        """
+        Évalue f sur un bloc de points du domaine
+
+        Args:
+            xs (np.ndarray): Les points, de forme (n, k)
+
+        Returns:
+            np.ndarray: Les valeurs de f, de forme (n,)
+        """
+        ...
+
+    def contains(self, points):
+        return points[:, -1] * self.bound <= self.evaluate(points[:, :-1])
+
+
+# Régions intégrées, utilisables par leur nom
+REGIONS = {"quadrant": Quadrant, "hypersphere": Hypersphere}
+
+
+def make_region(region: Union[str, Region] = "quadrant", dimension: Optional[int] = None) -> Region:
+    """
+    Construit une région à partir de son nom
+
+    Args:
+        region (str | Region): Un nom de région intégrée ("quadrant", "hypersphere"),
+            le chemin module:Classe d'un plugin (sous-classe de Region), ou une
+            région déjà construite, retournée telle quelle
+        dimension (int, optional): La dimension passée au constructeur. Defaults
+            to None (dimension par défaut de la région).
+
+    Returns:
+        Region: La région
+    """
+    if isinstance(region, Region):
+        if dimension is not None and dimension != region.dimension:
+            raise ValueError(f"La région {region.name} est de dimension {region.dimension}, pas {dimension}")
+        return region
+    if region in REGIONS:
+        region_class = REGIONS[region]
+    elif ":" in region:
+        module_name, _, class_name = region.partition(":")
+        try:
+            region_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Région introuvable: {region} ({e})") from e
+        if not (isinstance(region_class, type) and issubclass(region_class, Region)):
+            raise ValueError(f"{region} n'est pas une sous-classe de Region")
+    else:
+        raise ValueError(f"Région inconnue: {region} (choix possibles: {', '.join(REGIONS)} "
+                         f"ou module:Classe)")
+    return region_class() if dimension is None else region_class(dimension)
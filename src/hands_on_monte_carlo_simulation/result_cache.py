@@ -0,0 +1,105 @@
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, Optional
+
+# Version du format des entrées du cache
+CACHE_VERSION = 1
+
+# Taille maximale du cache sur disque par défaut (octets)
+CACHE_SIZE = 64 * 1024 * 1024
+
+
+class ResultCache:
+    """
+    Cache sur disque des compteurs par shard (worker ou paquet) des exécutions
+    à graine fixée. Une entrée est identifiée par l'empreinte de sa
+    configuration (graine, échantillonneur, moteur, région, découpage en shards)
+    et contient, pour chaque shard, ses compteurs cumulés et, s'il peut encore
+    être prolongé, l'état de son générateur. Les entrées les moins récemment
+    utilisées sont supprimées quand le cache dépasse max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_SIZE):
+        """
+        Args:
+            directory (str): Le répertoire du cache, créé si besoin
+            max_bytes (int): La taille maximale du cache. Defaults to CACHE_SIZE.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(config: Dict) -> str:
+        """
+        Retourne l'empreinte d'une configuration (nom du fichier de l'entrée)
+        """
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def path(self, config: Dict) -> str:
+        return os.path.join(self.directory, self.key(config) + ".json")
+
+    def get(self, config: Dict) -> Optional[Dict]:
+        """
+        Lit l'entrée d'une configuration et la marque comme récemment utilisée
+
+        Returns:
+            dict: {"shards": {id: [total, inside]}, "states": {id: état}}, ou None
+        """
+        path = self.path(config)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION or data.get("config") != config:
+            return None
+        os.utime(path)
+        return {"shards": data["shards"], "states": data["states"]}
+
+    def put(self, config: Dict, shards: Dict[str, list], states: Dict[str, dict]) -> None:
+        """
+        Écrit l'entrée d'une configuration de façon atomique puis applique la
+        limite de taille
+
+        Args:
+            config (dict): La configuration
+            shards (dict): Les compteurs [total, inside] de chaque shard
+            states (dict): L'état du générateur des shards prolongeables
+        """
+        data = {"version": CACHE_VERSION, "config": config, "shards": shards, "states": states}
+        path = self.path(config)
+        fd, tmp_path = tempfile.mkstemp(prefix=".cache-", dir=self.directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict(keep=path)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à ce que le
+        cache tienne dans max_bytes
+
+        Args:
+            keep (str, optional): Une entrée à ne jamais supprimer (celle qui
+                vient d'être écrite). Defaults to None.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                os.unlink(path)
+                total -= size
@@ -0,0 +1,21 @@
+import hashlib
+from typing import Optional
+
+
+def derive_seed(seed: Optional[int], stream_id: int) -> Optional[int]:
+    """
+    Dérive la graine d'un flux indépendant à partir de la graine globale et de
+    l'indice du flux (typiquement l'indice du worker). Contrairement à
+    seed + stream_id, deux graines globales voisines ne partagent aucun flux.
+
+    Args:
+        seed (int, optional): La graine globale de la simulation
+        stream_id (int): L'indice du flux
+
+    Returns:
+        int: Une graine sur 64 bits, ou None si aucune graine globale n'est fournie
+    """
+    if seed is None:
+        return None
+    digest = hashlib.blake2b(f"{seed}:{stream_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
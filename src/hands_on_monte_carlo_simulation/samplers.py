@@ -0,0 +1,457 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : les échantillonneurs ont aussi une version Python
+    np = None  # type: ignore[assignment]
+
+
+# Échantillonneurs disponibles : pseudo-aléatoire et quasi-Monte Carlo
+SAMPLERS = ("random", "philox", "halton", "sobol")
+
+# Échantillonneurs pseudo-aléatoires, dont les points sont indépendants : l'erreur
+# type binomiale s'applique (mode précision cible)
+PSEUDO_RANDOM_SAMPLERS = ("random", "philox")
+
+# Nombre de bits de précision des points quasi-aléatoires (mantisse d'un double)
+QMC_BITS = 52
+
+# Longueur du segment de la suite attribué à chaque worker quand le nombre de
+# tirages n'est pas connu à l'avance (mode précision cible)
+QMC_SEGMENT = 1 << 40
+
+# Constantes de Philox4x64-10 (Salmon et al., 2011) : multiplicateurs des deux
+# mots pairs, incréments de la clé entre deux tours, nombre de tours
+PHILOX_MULTIPLIERS = (0xD2E7470EE14C6C93, 0xCA5A826395121157)
+PHILOX_KEY_INCREMENTS = (0x9E3779B97F4A7C15, 0xBB67AE8584CAA73B)
+PHILOX_ROUNDS = 10
+
+# Masque d'un mot de 64 bits
+MASK_64 = (1 << 64) - 1
+
+# Conversion d'un mot de 64 bits en flottant de [0, 1) : les 53 bits de poids
+# fort, comme numpy.random.Generator.random
+DOUBLE_SCALE = 1.0 / (1 << 53)
+
+
+def require_numpy() -> None:
+    """
+    Lève une erreur explicite si numpy, nécessaire aux méthodes block(), est absent
+    """
+    if np is None:
+        raise RuntimeError("Le moteur numpy nécessite numpy, qui n'est pas installé")
+
+
+class Sampler(ABC):
+    """
+    Source de points dans l'hypercube unité de dimension dimension (le carré de
+    côté 1 par défaut). Les moteurs python et numpy consomment la même suite :
+    points() la parcourt point par point, block() par blocs.
+    """
+
+    dimension = 2
+
+    @abstractmethod
+    def points(self, n: int) -> Iterator[Tuple[float, ...]]:
+        """
+        Génère les n points suivants un par un
+
+        Args:
+            n (int): Le nombre de points
+
+        Returns:
+            Iterator de tuples (x, y) (dimension coordonnées)
+        """
+        ...
+
+    @abstractmethod
+    def block(self, n: int):
+        """
+        Génère les n points suivants d'un seul bloc (moteur numpy)
+
+        Args:
+            n (int): Le nombre de points
+
+        Returns:
+            np.ndarray de forme (n, dimension)
+        """
+        ...
+
+    @abstractmethod
+    def get_state(self) -> dict:
+        """
+        Retourne la position courante dans la suite, sérialisable en JSON
+        """
+        ...
+
+    @abstractmethod
+    def set_state(self, state: dict) -> None:
+        """
+        Replace l'échantillonneur à une position obtenue par get_state
+        """
+        ...
+
+
+class RandomSampler(Sampler):
+    """
+    Échantillonnage pseudo-aléatoire uniforme, avec un générateur privé
+    """
+
+    def __init__(self, seed: Optional[int], dimension: int = 2):
+        self.seed = seed
+        self.dimension = dimension
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed) if np is not None else None
+
+    def points(self, n: int) -> Iterator[Tuple[float, ...]]:
+        uniform = self.rng.uniform
+        if self.dimension == 2:
+            for _ in range(n):
+                yield uniform(0, 1), uniform(0, 1)
+            return
+        coordinates = range(self.dimension)
+        for _ in range(n):
+            yield tuple(uniform(0, 1) for _ in coordinates)
+
+    def block(self, n: int):
+        require_numpy()
+        return self.np_rng.random((n, self.dimension))
+
+    def raw_block(self, n: int):
+        """
+        Tire n entiers bruts de 64 bits (moteur integer), sans conversion en flottant
+
+        Returns:
+            np.ndarray de forme (n,) et de type uint64
+        """
+        require_numpy()
+        return self.np_rng.bit_generator.random_raw(n)
+
+    def get_state(self) -> dict:
+        version, internal_state, gauss_next = self.rng.getstate()
+        return {
+            "random": [version, list(internal_state), gauss_next],
+            "numpy": self.np_rng.bit_generator.state if self.np_rng is not None else None,
+        }
+
+    def set_state(self, state: dict) -> None:
+        version, internal_state, gauss_next = state["random"]
+        self.rng.setstate((version, tuple(internal_state), gauss_next))
+        if self.np_rng is not None and state["numpy"] is not None:
+            self.np_rng.bit_generator.state = state["numpy"]
+
+
+class SequenceSampler(Sampler):
+    """
+    Base des suites quasi-aléatoires : la position se résume à l'indice du
+    prochain point
+    """
+
+    index = 0
+
+    def get_state(self) -> dict:
+        return {"index": self.index}
+
+    def set_state(self, state: dict) -> None:
+        self.index = state["index"]
+
+
+def first_primes(count: int) -> List[int]:
+    """
+    Retourne les count premiers nombres premiers (bases de la suite de Halton)
+    """
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+class HaltonSampler(SequenceSampler):
+    """
+    Suite de Halton en bases 2, 3, 5, ... (un nombre premier par dimension),
+    brouillée par permutations aléatoires des chiffres (une permutation par base
+    et par position de chiffre). Le point d'indice i ne dépend que de i : la
+    suite peut démarrer à n'importe quel offset.
+    """
+
+    def __init__(self, seed: Optional[int], offset: int = 0, dimension: int = 2):
+        self.index = offset
+        self.dimension = dimension
+        rng = random.Random(seed)
+        self.dimensions = []
+        for base in first_primes(dimension):
+            # Nombre de chiffres tel que base^digits tienne dans la mantisse d'un double
+            digits = 0
+            while base ** (digits + 1) <= 1 << QMC_BITS:
+                digits += 1
+            perms = []
+            for _ in range(digits):
+                perm = list(range(base))
+                rng.shuffle(perm)
+                perms.append(perm)
+            weights = [base ** (digits - 1 - j) for j in range(digits)]
+            # tails[j] : contribution des chiffres nuls aux positions >= j
+            tails = [0] * (digits + 1)
+            for j in range(digits - 1, -1, -1):
+                tails[j] = tails[j + 1] + perms[j][0] * weights[j]
+            self.dimensions.append((base, perms, weights, tails, float(base ** digits)))
+
+    @staticmethod
+    def _radical_inverse(i: int, base: int, perms: List[List[int]], weights: List[int],
+                         tails: List[int], scale: float) -> float:
+        numerator = 0
+        j = 0
+        while i:
+            i, digit = divmod(i, base)
+            numerator += perms[j][digit] * weights[j]
+            j += 1
+        return (numerator + tails[j]) / scale
+
+    def points(self, n: int) -> Iterator[Tuple[float, ...]]:
+        start = self.index
+        self.index += n
+        if self.dimension != 2:
+            for i in range(start, start + n):
+                yield tuple(self._radical_inverse(i, *dim) for dim in self.dimensions)
+            return
+        (dim_x, dim_y) = self.dimensions
+        for i in range(start, start + n):
+            yield self._radical_inverse(i, *dim_x), self._radical_inverse(i, *dim_y)
+
+    def block(self, n: int):
+        require_numpy()
+        indices = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        result = np.empty((n, self.dimension))
+        for column, (base, perms, weights, tails, scale) in enumerate(self.dimensions):
+            remaining = indices.copy()
+            numerator = np.zeros(n, dtype=np.uint64)
+            # Comme dans _radical_inverse : on ne parcourt que les chiffres non
+            # nuls de l'indice maximal, la suite étant ajoutée via tails
+            j = 0
+            while remaining.any():
+                digit = remaining % np.uint64(base)
+                remaining //= np.uint64(base)
+                perm = np.array(perms[j], dtype=np.uint64)
+                numerator += perm[digit] * np.uint64(weights[j])
+                j += 1
+            numerator += np.uint64(tails[j])
+            result[:, column] = numerator / scale
+        return result
+
+
+class SobolSampler(SequenceSampler):
+    """
+    Suite de Sobol en dimension 2, brouillée par brouillage matriciel linéaire
+    et décalage digital aléatoires (méthode LMS + digital shift). Le point
+    d'indice i est calculé directement à partir des bits de i. Seuls les nombres
+    directeurs des deux premières dimensions sont disponibles.
+    """
+
+    def __init__(self, seed: Optional[int], offset: int = 0, dimension: int = 2):
+        if dimension != 2:
+            raise ValueError(f"La suite de Sobol n'est disponible qu'en dimension 2 (reçu {dimension}), "
+                             f"utiliser halton")
+        self.index = offset
+        rng = random.Random(seed)
+        # Nombres directeurs : dimension 1 = van der Corput (m_k = 1),
+        # dimension 2 = polynôme primitif x + 1 (m_k = 2 m_{k-1} xor m_{k-1})
+        m_x = [1] * QMC_BITS
+        m_y = [1]
+        for _ in range(QMC_BITS - 1):
+            m_y.append((m_y[-1] << 1) ^ m_y[-1])
+        self.directions = []
+        self.shifts = []
+        for m in (m_x, m_y):
+            directions = [m_k << (QMC_BITS - k) for k, m_k in enumerate(m, start=1)]
+            self.directions.append(self._scramble(directions, rng))
+            self.shifts.append(rng.getrandbits(QMC_BITS))
+        self.scale = float(1 << QMC_BITS)
+
+    @staticmethod
+    def _scramble(directions: List[int], rng: random.Random) -> List[int]:
+        """
+        Applique une matrice binaire triangulaire inférieure aléatoire (diagonale
+        unité) aux nombres directeurs, le chiffre de poids fort étant le premier.
+        """
+        masks = []
+        for j in range(QMC_BITS):
+            lower = rng.getrandbits(j) if j else 0
+            # Bits des chiffres 0..j-1 (poids forts) plus le chiffre j lui-même
+            masks.append(((lower << 1) | 1) << (QMC_BITS - 1 - j))
+        scrambled = []
+        for v in directions:
+            new_v = 0
+            for j, mask in enumerate(masks):
+                if (v & mask).bit_count() & 1:
+                    new_v |= 1 << (QMC_BITS - 1 - j)
+            scrambled.append(new_v)
+        return scrambled
+
+    def points(self, n: int) -> Iterator[Tuple[float, float]]:
+        (directions_x, directions_y) = self.directions
+        shift_x, shift_y = self.shifts
+        start = self.index
+        self.index += n
+        for i in range(start, start + n):
+            x, y = shift_x, shift_y
+            k = 0
+            while i:
+                if i & 1:
+                    x ^= directions_x[k]
+                    y ^= directions_y[k]
+                i >>= 1
+                k += 1
+            yield x / self.scale, y / self.scale
+
+    def block(self, n: int):
+        require_numpy()
+        indices = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        nb_bits = int(self.index - 1).bit_length() if n else 0
+        result = np.empty((n, 2))
+        for column, (directions, shift) in enumerate(zip(self.directions, self.shifts)):
+            values = np.full(n, shift, dtype=np.uint64)
+            for k in range(nb_bits):
+                bit_set = ((indices >> np.uint64(k)) & np.uint64(1)).astype(bool)
+                values[bit_set] ^= np.uint64(directions[k])
+            result[:, column] = values / self.scale
+        return result
+
+
+def philox_round_keys(key: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Retourne la clé de chaque tour de Philox4x64-10 (la clé est incrémentée
+    entre deux tours), calculées une fois par générateur
+    """
+    k0, k1 = key
+    w0, w1 = PHILOX_KEY_INCREMENTS
+    round_keys = []
+    for _ in range(PHILOX_ROUNDS):
+        round_keys.append((k0, k1))
+        k0, k1 = (k0 + w0) & MASK_64, (k1 + w1) & MASK_64
+    return round_keys
+
+
+def philox4x64(counter: int, round_keys: List[Tuple[int, int]]) -> Tuple[int, int, int, int]:
+    """
+    Chiffre un compteur de 256 bits par Philox4x64-10 : le bloc obtenu est
+    formé de 4 mots de 64 bits pseudo-aléatoires
+
+    Args:
+        counter (int): Le compteur, pris modulo 2^256
+        round_keys (list): Les clés des tours (voir philox_round_keys)
+
+    Returns:
+        Tuple des 4 mots du bloc
+    """
+    c0, c1, c2, c3 = counter & MASK_64, counter >> 64 & MASK_64, counter >> 128 & MASK_64, counter >> 192 & MASK_64
+    m0, m1 = PHILOX_MULTIPLIERS
+    for k0, k1 in round_keys:
+        p0, p1 = m0 * c0, m1 * c2
+        c0, c1, c2, c3 = (p1 >> 64) ^ c1 ^ k0, p1 & MASK_64, (p0 >> 64) ^ c3 ^ k1, p0 & MASK_64
+    return c0, c1, c2, c3
+
+
+class PhiloxSampler(SequenceSampler):
+    """
+    Générateur pseudo-aléatoire à compteur (Philox4x64-10) : le mot de 64 bits
+    d'indice k est le mot k % 4 du chiffrement du compteur k // 4 par une clé
+    tirée de la graine, et le point d'indice i est formé des mots i * dimension
+    à (i + 1) * dimension - 1. Le point ne dépend que de i : comme les suites
+    quasi-aléatoires, chaque worker démarre directement à son offset, en temps
+    constant, et le résultat ne dépend pas du découpage entre workers.
+    Le moteur numpy utilise numpy.random.Philox, qui produit les mêmes mots.
+    """
+
+    def __init__(self, seed: Optional[int], offset: int = 0, dimension: int = 2):
+        self.index = offset
+        self.dimension = dimension
+        key = random.Random(seed).getrandbits(128)
+        self.key = (key & MASK_64, key >> 64)
+        self.round_keys = philox_round_keys(self.key)
+        self.bit_generator = np.random.Philox(key=key) if np is not None else None
+
+    def _words(self, start: int) -> Iterator[int]:
+        """
+        Parcourt les mots du flux à partir de l'indice start
+        """
+        counter, position = divmod(start, 4)
+        while True:
+            yield from philox4x64(counter, self.round_keys)[position:]
+            counter += 1
+            position = 0
+
+    def points(self, n: int) -> Iterator[Tuple[float, ...]]:
+        start = self.index
+        self.index += n
+        if self.dimension == 2:
+            # Deux points par bloc de 4 mots : le point i est la moitié i % 2 du bloc i // 2
+            round_keys = self.round_keys
+            counter, position = divmod(start, 2)
+            while n > 0:
+                w0, w1, w2, w3 = philox4x64(counter, round_keys)
+                if position == 0:
+                    yield (w0 >> 11) * DOUBLE_SCALE, (w1 >> 11) * DOUBLE_SCALE
+                    n -= 1
+                if n > 0:
+                    yield (w2 >> 11) * DOUBLE_SCALE, (w3 >> 11) * DOUBLE_SCALE
+                    n -= 1
+                counter += 1
+                position = 0
+            return
+        words = self._words(start * self.dimension)
+        coordinates = range(self.dimension)
+        for _ in range(n):
+            yield tuple((next(words) >> 11) * DOUBLE_SCALE for _ in coordinates)
+
+    def block(self, n: int):
+        require_numpy()
+        counter, position = divmod(self.index * self.dimension, 4)
+        self.index += n
+        # numpy incrémente le compteur avant de le chiffrer : on le place juste
+        # avant le bloc voulu, tampon vide, puis on saute le début du bloc
+        counter = (counter - 1) & ((1 << 256) - 1)
+        self.bit_generator.state = {
+            "bit_generator": "Philox",
+            "state": {"counter": np.array([counter >> (64 * j) & MASK_64 for j in range(4)], dtype=np.uint64),
+                      "key": np.array(self.key, dtype=np.uint64)},
+            "buffer": np.zeros(4, dtype=np.uint64),
+            "buffer_pos": 4,
+            "has_uint32": 0,
+            "uinteger": 0,
+        }
+        if position:
+            self.bit_generator.random_raw(position)
+        raw = self.bit_generator.random_raw(n * self.dimension)
+        raw >>= np.uint64(11)
+        return (raw * DOUBLE_SCALE).reshape(n, self.dimension)
+
+
+def make_sampler(name: str, seed: Optional[int], offset: int = 0, dimension: int = 2) -> Sampler:
+    """
+    Construit un échantillonneur à partir de son nom
+
+    Args:
+        name (str): "random", "philox", "halton" ou "sobol"
+        seed (int, optional): La graine du générateur (random, philox) ou du brouillage (halton, sobol)
+        offset (int): L'indice du premier point de la suite, ignoré pour random. Defaults to 0.
+        dimension (int): La dimension des points. Defaults to 2.
+
+    Returns:
+        Sampler: L'échantillonneur
+    """
+    if name == "random":
+        return RandomSampler(seed, dimension)
+    if name == "philox":
+        return PhiloxSampler(seed, offset, dimension)
+    if name == "halton":
+        return HaltonSampler(seed, offset, dimension)
+    if name == "sobol":
+        return SobolSampler(seed, offset, dimension)
+    raise ValueError(f"Échantillonneur inconnu: {name} (choix possibles: {', '.join(SAMPLERS)})")
@@ -0,0 +1,594 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+import functools
+import socketserver
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .distributed import compute_shard
+from .monte_carlo_simulation import MonteCarloSimulation
+from .regions import REGIONS, make_region
+from .samplers import PSEUDO_RANDOM_SAMPLERS
+from .threading_manager import gil_enabled, make_worker_generator
+
+
+# Interface d'écoute du mode serve : le service n'est joignable que localement
+SERVE_HOST = "127.0.0.1"
+
+# Port HTTP par défaut du mode serve
+SERVE_PORT = 8765
+
+# Nombre de tirages par shard d'une requête (unité de partage des workers entre requêtes)
+SERVE_SHARD_SIZE = 100_000
+
+# Nombre de tirages à partir duquel un lot soumis à un worker n'accueille plus
+# de shards d'autres requêtes : les petites requêtes sont regroupées jusque-là
+BATCH_DRAWS = 100_000
+
+# Nombre de lots soumis d'avance à chaque worker : le suivant attend déjà dans
+# le pool quand un lot se termine, le worker n'attend pas le répartiteur
+BATCHES_PER_WORKER = 2
+
+# Nombre maximal de tirages d'une requête (aussi le plafond du mode précision cible)
+MAX_DRAWS = 10 ** 9
+
+# Nombre maximal de requêtes en attente ou en cours, au-delà duquel le service
+# répond 503 plutôt que de laisser la file grossir
+MAX_PENDING = 1000
+
+# Bornes (en secondes) de l'histogramme Prometheus des latences
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# Nombre de requêtes récentes sur lesquelles sont calculés les quantiles de latence
+LATENCY_WINDOW = 1000
+
+# Champs acceptés dans une requête POST /estimate (paramètres de EstimationService.submit)
+REQUEST_FIELDS = ("draws", "seed", "engine", "sampler", "region", "dimension", "target_stderr")
+
+
+class ServiceBusy(RuntimeError):
+    """
+    Levée quand la file du service est pleine (MAX_PENDING requêtes)
+    """
+
+
+def compute_shards(shards: List[dict]) -> List[Tuple[int, int]]:
+    """
+    Calcule un lot de shards, éventuellement de requêtes différentes, dans un
+    seul aller-retour avec le worker
+
+    Args:
+        shards (list): Les shards (voir distributed.compute_shard)
+
+    Returns:
+        list: Les compteurs (total_points, inside_points) de chaque shard
+    """
+    return [compute_shard(shard) for shard in shards]
+
+
+class EstimationJob:
+    """
+    Requête d'estimation en cours : ses shards sont distribués aux workers par
+    le service, qui en fusionne les compteurs
+    """
+
+    def __init__(self, draws: int, seed: int, engine: str, sampler: str, region: str,
+                 dimension: Optional[int], shard_size: int, target_stderr: Optional[float],
+                 callback: Optional[Callable[["EstimationJob"], None]] = None):
+        self.draws = draws
+        self.shard = {"seed": seed, "engine": engine, "sampler": sampler, "segment_size": shard_size,
+                      "region": region, "dimension": dimension}
+        self.shard_size = shard_size
+        self.nb_shards = -(-draws // shard_size)
+        shape = make_region(region, dimension)
+        self.scale = shape.scale
+        self.label = shape.label
+        self.target_stderr = target_stderr
+        self.next_shard = 0
+        # Shards soumis dont le résultat n'est pas encore arrivé
+        self.pending = 0
+        self.total_points = 0
+        self.inside_points = 0
+        self.start_time = time.perf_counter()
+        self.latency: Optional[float] = None
+        self.error: Optional[str] = None
+        self.callback = callback
+        self.done = threading.Event()
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Indique si tous les shards de la requête ont été soumis
+        """
+        return self.next_shard >= self.nb_shards
+
+    def take_shard(self) -> dict:
+        """
+        Retourne le message du prochain shard à calculer
+        """
+        shard_id = self.next_shard
+        self.next_shard += 1
+        self.pending += 1
+        return dict(self.shard, shard_id=shard_id,
+                    draws=min(self.shard_size, self.draws - shard_id * self.shard_size))
+
+    def reached(self) -> bool:
+        """
+        Indique si l'erreur type visée est atteinte
+        """
+        return self.target_stderr is not None and 0 < self.inside_points < self.total_points and \
+            MonteCarloSimulation.standard_error(self.total_points, self.inside_points, self.scale) \
+            <= self.target_stderr
+
+    def response(self) -> dict:
+        """
+        Retourne la réponse de la requête terminée
+        """
+        if self.error is not None:
+            raise RuntimeError(self.error)
+        low, high = MonteCarloSimulation.confidence_interval(self.total_points, self.inside_points,
+                                                             scale=self.scale)
+        return {
+            "label": self.label,
+            "estimate": MonteCarloSimulation.estimate_pi(self.total_points, self.inside_points, self.scale),
+            "stderr": MonteCarloSimulation.standard_error(self.total_points, self.inside_points, self.scale),
+            "confidence_interval": [low, high],
+            "total_points": self.total_points,
+            "inside_points": self.inside_points,
+            "latency_seconds": self.latency,
+        }
+
+
+class EstimationService:
+    """
+    Service d'estimation à pool de workers chaud : les processus (ou threads)
+    sont démarrés et ont importé leurs modules avant la première requête.
+
+    Les requêtes sont découpées en shards de shard_size tirages. Un thread
+    répartiteur forme chaque lot en prenant un shard par requête active, à
+    tour de rôle : une grosse requête n'affame pas les petites, et les petites
+    requêtes sont regroupées dans un même lot (jusqu'à batch_draws tirages) pour
+    amortir l'aller-retour avec le worker. Au plus BATCHES_PER_WORKER lots par
+    worker sont en cours.
+    À graine fixée, le résultat d'une requête ne dépend que de shard_size (les
+    shards sont ceux du coordinateur réparti et de l'API asynchrone).
+    """
+
+    def __init__(self, workers: int = 1, backend: str = "process", shard_size: int = SERVE_SHARD_SIZE,
+                 batch_draws: int = BATCH_DRAWS, max_draws: int = MAX_DRAWS, max_pending: int = MAX_PENDING,
+                 allow_plugin_regions: bool = False):
+        """
+        Args:
+            workers (int): Le nombre de workers. Defaults to 1.
+            backend (str): "thread", "process" ou "auto" (processus sauf sur un
+                interpréteur sans GIL). Defaults to "process".
+            shard_size (int): Le nombre de tirages par shard. Defaults to SERVE_SHARD_SIZE.
+            batch_draws (int): Le nombre de tirages visé par lot. Defaults to BATCH_DRAWS.
+            max_draws (int): Le nombre maximal de tirages d'une requête. Defaults to MAX_DRAWS.
+            max_pending (int): Le nombre maximal de requêtes en attente ou en cours. Defaults to MAX_PENDING.
+            allow_plugin_regions (bool): Accepte les régions module:Classe. Construire
+                une telle région importe son module, dont le code s'exécute dans le
+                service : à réserver aux requêtes de confiance. Defaults to False
+                (régions intégrées seulement).
+        """
+        if backend == "auto":
+            backend = "process" if workers > 1 and gil_enabled() else "thread"
+        self.workers = workers
+        self.backend = backend
+        self.shard_size = shard_size
+        self.batch_draws = batch_draws
+        self.max_draws = max_draws
+        self.max_pending = max_pending
+        self.allow_plugin_regions = allow_plugin_regions
+        executor = ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+        self.executor = executor(max_workers=workers)
+        # Démarrage et imports des workers avant la première requête
+        warmup = {"shard_id": 0, "draws": 1, "seed": 0, "engine": "python", "sampler": "random",
+                  "segment_size": 1, "region": "quadrant", "dimension": None}
+        for future in [self.executor.submit(compute_shards, [warmup]) for _ in range(workers)]:
+            future.result()
+
+        self.condition = threading.Condition()
+        # Requêtes dont il reste des shards à soumettre, servies à tour de rôle
+        self.queue: deque = deque()
+        self.jobs_in_progress = 0
+        self.in_flight = 0
+        self.closed = False
+
+        # Compteurs exposés par stats() et prometheus_text()
+        self.start_time = time.monotonic()
+        self.requests_total = 0
+        self.requests_failed = 0
+        self.requests_rejected = 0
+        self.draws_total = 0
+        self.batches_total = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.recent_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+        self.dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self.dispatcher.start()
+
+    def submit(self, draws: Optional[int] = None, seed: Optional[int] = None, engine: str = "python",
+               sampler: str = "random", region: str = "quadrant", dimension: Optional[int] = None,
+               target_stderr: Optional[float] = None,
+               callback: Optional[Callable[[EstimationJob], None]] = None) -> EstimationJob:
+        """
+        Met une requête en file
+
+        Args:
+            draws (int, optional): Le nombre de tirages, plafond du mode précision
+                cible. Defaults to None (max_draws, précision cible obligatoire).
+            seed (int, optional): La graine. Defaults to None.
+            engine (str): Le moteur de calcul. Defaults to "python".
+            sampler (str): L'échantillonneur. Defaults to "random".
+            region (str): La région évaluée. Defaults to "quadrant".
+            dimension (int, optional): La dimension de la région. Defaults to None.
+            target_stderr (float, optional): Arrêt dès que l'erreur type passe sous
+                cette valeur. Defaults to None.
+            callback (callable, optional): Appelée avec la requête à sa fin, par le
+                thread qui la termine et avec le verrou du service : elle ne doit
+                pas bloquer. Defaults to None.
+
+        Returns:
+            EstimationJob: La requête, dont done est levé à la fin
+
+        Raises:
+            ValueError: Si la requête est invalide
+            ServiceBusy: Si la file est pleine
+        """
+        if draws is None and target_stderr is None:
+            raise ValueError("Il faut un nombre de tirages ou une erreur type visée")
+        draws = self.max_draws if draws is None else draws
+        # bool est une sous-classe de int : "draws": true ne vaut pas un tirage
+        if isinstance(draws, bool) or not isinstance(draws, int) or not 1 <= draws <= self.max_draws:
+            raise ValueError(f"Le nombre de tirages doit être un entier entre 1 et {self.max_draws}")
+        if not isinstance(engine, str) or not isinstance(sampler, str):
+            raise ValueError("Le moteur et l'échantillonneur doivent être des noms")
+        if dimension is not None and (isinstance(dimension, bool) or not isinstance(dimension, int)):
+            raise ValueError("La dimension doit être un entier")
+        if target_stderr is not None:
+            if isinstance(target_stderr, bool) or not isinstance(target_stderr, (int, float)) \
+                    or target_stderr <= 0:
+                raise ValueError("L'erreur type visée doit être > 0")
+            if sampler not in PSEUDO_RANDOM_SAMPLERS:
+                raise ValueError("Le mode précision cible nécessite un échantillonneur pseudo-aléatoire "
+                                 "(random ou philox)")
+        if seed is None:
+            # Tous les shards de la requête partagent la graine (brouillage QMC commun)
+            seed = random.SystemRandom().getrandbits(63)
+        elif isinstance(seed, bool) or not isinstance(seed, int):
+            raise ValueError("La graine doit être un entier")
+        if not isinstance(region, str):
+            raise ValueError("La région doit être un nom (quadrant, hypersphere ou module:Classe)")
+        if region not in REGIONS and not self.allow_plugin_regions:
+            raise ValueError(f"Région refusée: {region} (régions acceptées: {', '.join(REGIONS)} ; "
+                             f"les plugins module:Classe nécessitent --allow-plugin-regions)")
+        # Construire le générateur d'un shard valide moteur, échantillonneur et région
+        # avant la mise en file : une requête invalide est refusée sans occuper de worker
+        make_worker_generator(0, seed, engine, sampler, segment_size=self.shard_size,
+                              region=region, dimension=dimension)
+        job = EstimationJob(draws, seed, engine, sampler, region, dimension, self.shard_size,
+                            target_stderr, callback)
+
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Le service est arrêté")
+            if self.jobs_in_progress >= self.max_pending:
+                self.requests_rejected += 1
+                raise ServiceBusy(f"File pleine ({self.max_pending} requêtes en cours)")
+            self.jobs_in_progress += 1
+            self.queue.append(job)
+            self.condition.notify_all()
+        return job
+
+    def estimate(self, **kwargs) -> dict:
+        """
+        Exécute une requête et attend son résultat (voir submit pour les paramètres)
+
+        Returns:
+            dict: L'estimation, son erreur type, son intervalle de confiance à
+            95 %, les compteurs et la latence de la requête
+        """
+        job = self.submit(**kwargs)
+        job.done.wait()
+        return job.response()
+
+    def _next_batch(self) -> List[Tuple[EstimationJob, dict]]:
+        """
+        Forme le prochain lot : un shard par requête active, à tour de rôle,
+        jusqu'à batch_draws tirages. Appelée avec le verrou.
+        """
+        batch = []
+        draws = 0
+        for _ in range(len(self.queue)):
+            job = self.queue.popleft()
+            shard = job.take_shard()
+            batch.append((job, shard))
+            draws += shard["draws"]
+            if not job.exhausted:
+                self.queue.append(job)
+            if draws >= self.batch_draws:
+                break
+        return batch
+
+    def _dispatch(self) -> None:
+        """
+        Boucle du thread répartiteur : soumet un lot dès qu'un worker a moins de
+        BATCHES_PER_WORKER lots en cours
+        """
+        while True:
+            with self.condition:
+                while not self.closed and (self.in_flight >= self.workers * BATCHES_PER_WORKER
+                                              or not self.queue):
+                    self.condition.wait()
+                if self.closed:
+                    return
+                batch = self._next_batch()
+                self.in_flight += 1
+                self.batches_total += 1
+            try:
+                future = self.executor.submit(compute_shards, [shard for _, shard in batch])
+            except RuntimeError as e:  # pool arrêté pendant la soumission
+                with self.condition:
+                    self.in_flight -= 1
+                    for job, _ in batch:
+                        job.pending -= 1
+                        self._finish(job, error=str(e))
+                return
+            future.add_done_callback(functools.partial(self._complete, batch))
+
+    def _complete(self, batch: List[Tuple[EstimationJob, dict]], future) -> None:
+        """
+        Fusionne les compteurs d'un lot terminé dans ses requêtes
+        """
+        try:
+            results = future.result()
+            error = None
+        except BaseException as e:
+            results = [None] * len(batch)
+            error = f"Erreur du worker: {e}"
+        with self.condition:
+            self.in_flight -= 1
+            for (job, _), result in zip(batch, results):
+                job.pending -= 1
+                if job.done.is_set():
+                    # Requête déjà terminée (précision atteinte) : shard surnuméraire ignoré
+                    continue
+                if result is None:
+                    self._finish(job, error=error)
+                    continue
+                job.total_points += result[0]
+                job.inside_points += result[1]
+                self.draws_total += result[0]
+                if job.reached() or (job.exhausted and job.pending == 0):
+                    self._finish(job)
+            self.condition.notify_all()
+
+    def _finish(self, job: EstimationJob, error: Optional[str] = None) -> None:
+        """
+        Termine une requête et met à jour les compteurs du service. Appelée avec le verrou.
+        """
+        if job.done.is_set():
+            return
+        if job in self.queue:
+            self.queue.remove(job)
+        job.latency = time.perf_counter() - job.start_time
+        job.error = error
+        self.jobs_in_progress -= 1
+        self.requests_total += 1
+        if error is not None:
+            self.requests_failed += 1
+        self.latency_sum += job.latency
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if job.latency <= bound:
+                self.latency_buckets[i] += 1
+        self.recent_latencies.append(job.latency)
+        job.done.set()
+        if job.callback is not None:
+            job.callback(job)
+
+    def stats(self) -> Dict:
+        """
+        Retourne les compteurs du service : requêtes, tirages, débit et latences
+        (moyenne depuis le démarrage, quantiles sur les LATENCY_WINDOW dernières requêtes)
+        """
+        with self.condition:
+            uptime = time.monotonic() - self.start_time
+            latencies = sorted(self.recent_latencies)
+
+            def quantile(q: float) -> Optional[float]:
+                return latencies[min(int(q * len(latencies)), len(latencies) - 1)] if latencies else None
+
+            return {
+                "uptime_seconds": uptime,
+                "workers": self.workers,
+                "backend": self.backend,
+                "requests_total": self.requests_total,
+                "requests_failed": self.requests_failed,
+                "requests_rejected": self.requests_rejected,
+                "requests_in_progress": self.jobs_in_progress,
+                "requests_queued": len(self.queue),
+                "batches_total": self.batches_total,
+                "draws_total": self.draws_total,
+                "draws_per_second": self.draws_total / uptime if uptime > 0 else 0.0,
+                "requests_per_second": self.requests_total / uptime if uptime > 0 else 0.0,
+                "latency_mean_seconds": self.latency_sum / self.requests_total if self.requests_total else None,
+                "latency_p50_seconds": quantile(0.5),
+                "latency_p99_seconds": quantile(0.99),
+            }
+
+    def prometheus_text(self) -> str:
+        """
+        Retourne les compteurs du service au format texte Prometheus
+        """
+        stats = self.stats()
+        with self.condition:
+            buckets = list(self.latency_buckets)
+            latency_sum = self.latency_sum
+        lines = []
+
+        def metric(name: str, kind: str, description: str, samples) -> None:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                if value is not None:
+                    lines.append(f"{name}{labels} {value}")
+
+        metric("monte_carlo_serve_requests_total", "counter", "Estimation requests completed.",
+               [("", stats["requests_total"])])
+        metric("monte_carlo_serve_requests_failed_total", "counter", "Estimation requests that failed.",
+               [("", stats["requests_failed"])])
+        metric("monte_carlo_serve_requests_rejected_total", "counter", "Requests rejected because the queue was full.",
+               [("", stats["requests_rejected"])])
+        metric("monte_carlo_serve_requests_in_progress", "gauge", "Requests queued or running.",
+               [("", stats["requests_in_progress"])])
+        metric("monte_carlo_serve_batches_total", "counter", "Batches of shards handed to the workers.",
+               [("", stats["batches_total"])])
+        metric("monte_carlo_serve_draws_total", "counter", "Points drawn for the requests.",
+               [("", stats["draws_total"])])
+        metric("monte_carlo_serve_draws_per_second", "gauge", "Average throughput since startup.",
+               [("", stats["draws_per_second"])])
+        metric("monte_carlo_serve_request_latency_seconds", "histogram", "Request latency.",
+               [(f'_bucket{{le="{bound}"}}', count) for bound, count in zip(LATENCY_BUCKETS, buckets)]
+               + [('_bucket{le="+Inf"}', stats["requests_total"]), ("_sum", latency_sum),
+                  ("_count", stats["requests_total"])])
+        return "\n".join(lines) + "\n"
+
+    def close(self) -> None:
+        """
+        Arrête le répartiteur et les workers ; les requêtes en cours échouent
+        """
+        with self.condition:
+            self.closed = True
+            for job in list(self.queue):
+                self._finish(job, error="Le service est arrêté")
+            self.condition.notify_all()
+        self.dispatcher.join()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _serve_handler(service: EstimationService):
+    """
+    Construit le gestionnaire HTTP du service : POST /estimate (requête JSON),
+    GET /stats (compteurs JSON) et GET /metrics (format Prometheus)
+    """
+
+    class EstimationHandler(BaseHTTPRequestHandler):
+        # Connexions persistantes : un client envoie ses requêtes sur la même connexion
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            self._send(status, json.dumps(payload).encode(), "application/json")
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._send(200, service.prometheus_text().encode(), "text/plain; version=0.0.4; charset=utf-8")
+            elif self.path == "/stats":
+                self._send_json(200, service.stats())
+            else:
+                self._send_json(404, {"error": f"Chemin inconnu: {self.path}"})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length)
+            if self.path != "/estimate":
+                self._send_json(404, {"error": f"Chemin inconnu: {self.path}"})
+                return
+            try:
+                request = json.loads(body or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("La requête doit être un objet JSON")
+                unknown = sorted(set(request) - set(REQUEST_FIELDS))
+                if unknown:
+                    raise ValueError(f"Champs inconnus: {', '.join(unknown)} "
+                                     f"(champs possibles: {', '.join(REQUEST_FIELDS)})")
+                response = service.estimate(**request)
+            except ServiceBusy as e:
+                self._send_json(503, {"error": str(e)})
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+            except RuntimeError as e:
+                self._send_json(500, {"error": str(e)})
+            except Exception as e:
+                # Une erreur imprévue répond 500 au lieu de couper la connexion sans réponse
+                logging.error(f"Erreur lors du traitement de la requête: {e}", exc_info=True)
+                self._send_json(500, {"error": str(e)})
+            else:
+                self._send_json(200, response)
+
+        def address_string(self) -> str:
+            # Sur un socket Unix, client_address est une chaîne vide
+            return self.client_address[0] if self.client_address else "unix"
+
+        def log_message(self, format, *args):
+            logging.debug(f"{self.address_string()} {format % args}")
+
+    return EstimationHandler
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serveur HTTP sur un socket Unix, un thread par connexion
+    """
+
+    daemon_threads = True
+
+
+def make_server(service: EstimationService, port: int = SERVE_PORT,
+                unix_socket: Optional[str] = None) -> Union[ThreadingHTTPServer, UnixHTTPServer]:
+    """
+    Construit le serveur HTTP du service, sur SERVE_HOST ou sur un socket Unix
+
+    Args:
+        service (EstimationService): Le service
+        port (int): Le port TCP, 0 pour un port libre quelconque. Defaults to SERVE_PORT.
+        unix_socket (str, optional): Le chemin du socket Unix, qui remplace le
+            port TCP. Defaults to None.
+
+    Returns:
+        Le serveur, à lancer avec serve_forever()
+    """
+    handler = _serve_handler(service)
+    if unix_socket is not None:
+        return UnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((SERVE_HOST, port), handler)
+
+
+def run_serve_mode(args) -> None:
+    """
+    Exécute la commande serve jusqu'à son interruption
+
+    Args:
+        args: Arguments parsés par parse_serve_arguments
+    """
+    service = EstimationService(workers=args.workers, backend=args.backend, shard_size=args.shard_size,
+                                batch_draws=args.batch_draws, max_draws=args.max_draws,
+                                max_pending=args.max_pending, allow_plugin_regions=args.allow_plugin_regions)
+    server = make_server(service, args.port, args.unix_socket)
+    if isinstance(server, UnixHTTPServer):
+        logging.info(f"Service d'estimation sur le socket Unix {args.unix_socket} "
+                     f"({service.workers} worker(s) {service.backend})")
+    else:
+        logging.info(f"Service d'estimation sur http://{SERVE_HOST}:{server.server_port} "
+                     f"({service.workers} worker(s) {service.backend})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.close()
+        if args.unix_socket is not None and os.path.exists(args.unix_socket):
+            os.unlink(args.unix_socket)
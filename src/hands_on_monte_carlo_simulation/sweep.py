@@ -0,0 +1,251 @@
+import sys
+import csv
+import json
+import time
+import queue
+import logging
+import functools
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+from .server import REQUEST_FIELDS, EstimationJob, EstimationService
+
+
+# Formats des fichiers de configurations et de résultats
+SWEEP_FORMATS = ("csv", "jsonl")
+
+# Colonnes d'une ligne de résultat : numéro de la configuration (ordre du
+# fichier ou de la grille), ses paramètres puis son résultat
+SWEEP_FIELDS = ("config",) + REQUEST_FIELDS + ("label", "estimate", "stderr", "ci_low", "ci_high",
+                                               "total_points", "inside_points", "latency_seconds", "error")
+
+# Paramètres d'une configuration qui ne les précise pas (ceux de EstimationService.submit)
+CONFIG_DEFAULTS = {"draws": None, "seed": None, "engine": "python", "sampler": "random",
+                   "region": "quadrant", "dimension": None, "target_stderr": None}
+
+# Conversion des champs numériques d'un fichier de configurations CSV
+CSV_FIELD_TYPES = {"draws": int, "seed": int, "dimension": int, "target_stderr": float}
+
+
+def sweep_grid(draws: List[Optional[int]], seeds: List[Optional[int]], engines: List[str],
+               samplers: List[str], regions: List[str], dimensions: List[Optional[int]],
+               target_stderrs: List[Optional[float]]) -> List[Dict]:
+    """
+    Retourne les configurations du produit cartésien des paramètres
+
+    Returns:
+        list: Une configuration (paramètres de EstimationService.submit) par combinaison
+    """
+    return [dict(zip(REQUEST_FIELDS, values))
+            for values in itertools.product(draws, seeds, engines, samplers, regions, dimensions,
+                                            target_stderrs)]
+
+
+def load_configs(path: str, config_format: Optional[str] = None) -> List[Dict]:
+    """
+    Lit un fichier de configurations : un objet JSON par ligne, ou un CSV dont
+    l'en-tête nomme les paramètres (cellule vide : valeur par défaut)
+
+    Args:
+        path (str): Le fichier
+        config_format (str, optional): "csv" ou "jsonl". Defaults to None (csv
+            si le fichier se termine par .csv, jsonl sinon).
+
+    Returns:
+        list: Les configurations, dans l'ordre du fichier
+
+    Raises:
+        ValueError: Si une ligne n'est pas une configuration valide
+    """
+    if config_format is None:
+        config_format = "csv" if path.endswith(".csv") else "jsonl"
+    if config_format not in SWEEP_FORMATS:
+        raise ValueError(f"Format inconnu: {config_format} (choix possibles: {', '.join(SWEEP_FORMATS)})")
+    configs = []
+    with open(path, newline='') as f:
+        if config_format == "csv":
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    configs.append({field: CSV_FIELD_TYPES.get(field, str)(value)
+                                    for field, value in row.items() if value not in ("", None)})
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"{path}:{line}: valeur invalide ({e})") from e
+        else:
+            for line, text in enumerate(f, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    config = json.loads(text)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line}: JSON invalide ({e})") from e
+                if not isinstance(config, dict):
+                    raise ValueError(f"{path}:{line}: une configuration doit être un objet JSON")
+                configs.append(config)
+    for config in configs:
+        unknown = sorted(set(config) - set(REQUEST_FIELDS))
+        if unknown:
+            raise ValueError(f"{path}: champs inconnus: {', '.join(unknown)} "
+                             f"(champs possibles: {', '.join(REQUEST_FIELDS)})")
+    return configs
+
+
+class SweepWriter:
+    """
+    Écrit une ligne de résultat (CSV ou JSON lines) par configuration, vidée
+    aussitôt : le fichier peut être suivi pendant le balayage
+    """
+
+    def __init__(self, path: str, output_format: Optional[str] = None):
+        """
+        Args:
+            path (str): Le fichier de résultats, - pour la sortie standard
+            output_format (str, optional): "csv" ou "jsonl". Defaults to None (csv
+                si le fichier se termine par .csv, jsonl sinon).
+        """
+        if output_format is None:
+            output_format = "csv" if path.endswith(".csv") else "jsonl"
+        if output_format not in SWEEP_FORMATS:
+            raise ValueError(f"Format inconnu: {output_format} (choix possibles: {', '.join(SWEEP_FORMATS)})")
+        self.output_format = output_format
+        self.file = sys.stdout if path == '-' else open(path, 'w', newline='')
+        self.csv = csv.writer(self.file, lineterminator="\n") if output_format == "csv" else None
+        if self.csv is not None:
+            self.csv.writerow(SWEEP_FIELDS)
+
+    def write(self, index: int, config: Dict, job: Optional[EstimationJob] = None,
+              error: Optional[str] = None) -> None:
+        """
+        Écrit le résultat d'une configuration
+
+        Args:
+            index (int): Le numéro de la configuration
+            config (dict): La configuration
+            job (EstimationJob, optional): La requête terminée. Defaults to None
+                (configuration refusée, voir error).
+            error (str, optional): L'erreur d'une configuration refusée. Defaults to None.
+        """
+        row = dict.fromkeys(SWEEP_FIELDS)
+        row.update(CONFIG_DEFAULTS, **config, config=index, error=error)
+        if job is not None:
+            # Graine effective : tirée au hasard si la configuration n'en donne pas
+            row["seed"] = job.shard["seed"]
+            if job.error is not None:
+                row["error"] = job.error
+            else:
+                response = job.response()
+                row["ci_low"], row["ci_high"] = response.pop("confidence_interval")
+                row.update(response)
+        if self.csv is not None:
+            self.csv.writerow([row[field] for field in SWEEP_FIELDS])
+        else:
+            self.file.write(json.dumps(row) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Ferme le fichier (pas la sortie standard)
+        """
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def _job_finished(completed: queue.SimpleQueue[Tuple[int, EstimationJob]], index: int,
+                  job: EstimationJob) -> None:
+    """
+    Rappel de fin de requête : transmet au balayage la requête terminée et le
+    numéro de sa configuration
+    """
+    completed.put((index, job))
+
+
+def run_sweep(configs: List[Dict], service: EstimationService, writer: SweepWriter) -> Dict:
+    """
+    Exécute toutes les configurations sur le pool de workers du service. Jusqu'à
+    max_pending configurations sont en file à la fois : le service les sert à
+    tour de rôle, shard par shard, et regroupe les shards des petites dans un
+    même lot, si bien qu'une grosse configuration n'en retarde pas de petites
+    et que les workers ne manquent jamais de travail. Chaque résultat est écrit
+    dès que sa configuration se termine (ordre d'achèvement, colonne config pour
+    l'ordre d'origine) et la configuration suivante est aussitôt mise en file.
+
+    Args:
+        configs (list): Les configurations (paramètres de EstimationService.submit)
+        service (EstimationService): Le service dont le pool exécute le balayage
+        writer (SweepWriter): La destination des résultats
+
+    Returns:
+        dict: configs, failed (configurations refusées ou en erreur), draws,
+        elapsed_seconds et draws_per_second
+    """
+    # Alimentée par le rappel de fin de requête, appelé avec le verrou du service
+    completed: queue.SimpleQueue[Tuple[int, EstimationJob]] = queue.SimpleQueue()
+    start = time.perf_counter()
+    next_config = 0
+    running = 0
+    failed = 0
+    draws = 0
+    while next_config < len(configs) or running:
+        while next_config < len(configs) and running < service.max_pending:
+            index = next_config
+            next_config += 1
+            try:
+                service.submit(**configs[index], callback=functools.partial(_job_finished, completed, index))
+            except (TypeError, ValueError) as e:
+                logging.warning(f"Configuration {index} refusée: {e}")
+                writer.write(index, configs[index], error=str(e))
+                failed += 1
+            else:
+                running += 1
+        if running:
+            index, job = completed.get()
+            running -= 1
+            writer.write(index, configs[index], job)
+            if job.error is not None:
+                logging.warning(f"Configuration {index} en erreur: {job.error}")
+                failed += 1
+            draws += job.total_points
+            logging.debug(f"Configuration {index} terminée en {job.latency:.3f}s")
+
+    elapsed = time.perf_counter() - start
+    return {
+        "configs": len(configs),
+        "failed": failed,
+        "draws": draws,
+        "elapsed_seconds": elapsed,
+        "draws_per_second": draws / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def run_sweep_mode(args) -> int:
+    """
+    Exécute la commande sweep : configurations d'un fichier ou d'une grille,
+    exécutées sur un seul pool de workers
+
+    Args:
+        args: Arguments parsés par parse_sweep_arguments
+
+    Returns:
+        int: Le code de sortie (1 si une configuration est refusée ou en erreur)
+    """
+    if args.configs is not None:
+        configs = load_configs(args.configs)
+    else:
+        configs = sweep_grid(args.draws, args.seeds, args.engines, args.samplers, args.regions,
+                             args.dimensions, args.target_stderrs)
+    logging.info(f"Balayage de {len(configs)} configuration(s)")
+
+    service = EstimationService(workers=args.workers, backend=args.backend, shard_size=args.shard_size,
+                                batch_draws=args.batch_draws, max_draws=args.max_draws,
+                                max_pending=args.max_pending, allow_plugin_regions=True)
+    writer = SweepWriter(args.output, args.format)
+    try:
+        summary = run_sweep(configs, service, writer)
+    finally:
+        writer.close()
+        service.close()
+
+    logging.info(f"{summary['configs']} configuration(s) en {summary['elapsed_seconds']:.2f}s "
+                 f"({summary['draws_per_second']:.0f} tirages/s, {summary['failed']} en erreur)")
+    if args.output != '-':
+        logging.info(f"Résultats écrits dans {args.output}")
+    return 1 if summary["failed"] else 0
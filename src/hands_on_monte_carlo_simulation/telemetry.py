@@ -0,0 +1,193 @@
+import json
+import math
+import time
+import threading
+from typing import List, Optional, TextIO, Tuple
+
+from .monte_carlo_simulation import MonteCarloSimulation
+
+
+# Période (en secondes) entre deux échantillons de télémétrie par défaut
+TELEMETRY_INTERVAL = 1.0
+
+
+class Telemetry:
+    """
+    Échantillonne pendant l'exécution les compteurs publiés par les workers
+    (débit par worker et global, estimation courante de π ou de la quantité
+    estimée par la région, ETA, utilisation des workers). Chaque échantillon est écrit comme une ligne JSON sur un flux et
+    peut être exposé au format texte Prometheus sur localhost.
+
+    Les workers ne font que publier leurs compteurs après chaque paquet, sans
+    verrou : c'est le gestionnaire qui appelle sample() à la période voulue.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = TELEMETRY_INTERVAL,
+                 metrics_port: Optional[int] = None):
+        """
+        Initialise la télémétrie et démarre le serveur Prometheus si demandé
+
+        Args:
+            stream (TextIO, optional): Le flux des lignes JSON. Defaults to None (aucun).
+            interval (float): Secondes entre deux échantillons. Defaults to TELEMETRY_INTERVAL.
+            metrics_port (int, optional): Le port HTTP de l'endpoint /metrics sur
+                127.0.0.1, 0 pour un port libre quelconque. Defaults to None (pas d'endpoint).
+        """
+        self.stream = stream
+        self.interval = interval
+        self.latest: Optional[dict] = None
+        self.start_time = time.monotonic()
+        self.previous_time = self.start_time
+        self.previous: List[Tuple[int, int, float]] = []
+        self.scale = 4.0
+        self.server = None
+        self.address = None
+        if metrics_port is not None:
+            # http.server n'est chargé que si l'endpoint est demandé (démarrage du CLI)
+            from http.server import ThreadingHTTPServer
+            self.server = ThreadingHTTPServer(("127.0.0.1", metrics_port), _metrics_handler(self))
+            self.address = self.server.server_address[:2]
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def begin(self, workers: List[Tuple[int, int, float]], scale: float = 4.0) -> None:
+        """
+        Démarre la mesure d'une exécution
+
+        Args:
+            workers (list): Les compteurs initiaux (total_points, inside_points,
+                temps CPU) de chaque worker, non nuls en cas de reprise
+            scale (float): Le facteur de la région (Region.scale). Defaults to 4.0 (pi).
+        """
+        self.start_time = self.previous_time = time.monotonic()
+        self.previous = list(workers)
+        self.scale = scale
+
+    def sample(self, workers: List[Tuple[int, int, float]],
+               planned_points: Optional[int] = None) -> dict:
+        """
+        Calcule un échantillon à partir des compteurs courants des workers et le publie
+
+        Args:
+            workers (list): Les compteurs (total_points, inside_points, temps CPU) de chaque worker
+            planned_points (int, optional): Le nombre total de tirages prévu, pour
+                la progression et l'ETA. Defaults to None (inconnu).
+
+        Returns:
+            dict: L'échantillon
+        """
+        now = time.monotonic()
+        interval = now - self.previous_time
+        previous = self.previous if len(self.previous) == len(workers) else [(0, 0, 0.0)] * len(workers)
+
+        worker_records = []
+        for worker_id, ((total, _, cpu_time), (last_total, _, last_cpu_time)) in \
+                enumerate(zip(workers, previous)):
+            worker_records.append({
+                "worker": worker_id,
+                "total_points": total,
+                "points_per_sec": (total - last_total) / interval if interval > 0 else 0.0,
+                # Temps CPU du worker par seconde écoulée : < 1 si le worker attend (GIL, E/S)
+                "utilization": (cpu_time - last_cpu_time) / interval if interval > 0 else 0.0,
+            })
+
+        total_points = sum(worker[0] for worker in workers)
+        inside_points = sum(worker[1] for worker in workers)
+        points_per_sec = sum(record["points_per_sec"] for record in worker_records)
+        eta = None
+        if planned_points is not None:
+            remaining = max(planned_points - total_points, 0)
+            if remaining == 0:
+                eta = 0.0
+            elif points_per_sec > 0:
+                eta = remaining / points_per_sec
+        stderr = MonteCarloSimulation.standard_error(total_points, inside_points, self.scale)
+
+        record = {
+            "timestamp": time.time(),
+            "elapsed": now - self.start_time,
+            "total_points": total_points,
+            "inside_points": inside_points,
+            "points_per_sec": points_per_sec,
+            "estimate": MonteCarloSimulation.estimate_pi(total_points, inside_points, self.scale),
+            "stderr": stderr if math.isfinite(stderr) else None,
+            "progress": min(total_points / planned_points, 1.0) if planned_points else None,
+            "eta_seconds": eta,
+            "workers": worker_records,
+        }
+        self.previous_time = now
+        self.previous = list(workers)
+        self.latest = record
+        if self.stream is not None:
+            self.stream.write(json.dumps(record) + "\n")
+            self.stream.flush()
+        return record
+
+    def prometheus_text(self) -> str:
+        """
+        Retourne le dernier échantillon au format texte Prometheus
+        """
+        record = self.latest
+        if record is None:
+            return ""
+        lines = []
+
+        def metric(name: str, kind: str, description: str, samples) -> None:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                if value is not None:
+                    lines.append(f"{name}{labels} {value}")
+
+        metric("monte_carlo_points_total", "counter", "Points drawn so far.",
+               [("", record["total_points"])])
+        metric("monte_carlo_inside_points_total", "counter", "Points drawn inside the quadrant.",
+               [("", record["inside_points"])])
+        metric("monte_carlo_points_per_second", "gauge", "Aggregate throughput.",
+               [("", record["points_per_sec"])])
+        metric("monte_carlo_estimate", "gauge", "Current estimate (pi for the default quadrant region).",
+               [("", record["estimate"])])
+        metric("monte_carlo_stderr", "gauge", "Standard error of the estimate.",
+               [("", record["stderr"])])
+        metric("monte_carlo_eta_seconds", "gauge", "Estimated remaining time.",
+               [("", record["eta_seconds"])])
+        metric("monte_carlo_worker_points_total", "counter", "Points drawn by each worker.",
+               [(f'{{worker="{w["worker"]}"}}', w["total_points"]) for w in record["workers"]])
+        metric("monte_carlo_worker_points_per_second", "gauge", "Throughput of each worker.",
+               [(f'{{worker="{w["worker"]}"}}', w["points_per_sec"]) for w in record["workers"]])
+        metric("monte_carlo_worker_utilization", "gauge", "CPU seconds per second of each worker.",
+               [(f'{{worker="{w["worker"]}"}}', w["utilization"]) for w in record["workers"]])
+        return "\n".join(lines) + "\n"
+
+    def close(self) -> None:
+        """
+        Arrête le serveur Prometheus
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def _metrics_handler(telemetry: Telemetry):
+    """
+    Construit le gestionnaire HTTP de l'endpoint /metrics
+    """
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = telemetry.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Pas de journal d'accès sur stderr (réservé aux lignes de télémétrie)
+            pass
+
+    return MetricsHandler
@@ -1,14 +1,133 @@
+import sys
+import math
+import time
+import queue
+import random
+import logging
 import threading
-from typing import List, Tuple, Callable, Optional
-from .monte_carlo_simulation import PointGenerator
+import multiprocessing
+import multiprocessing.queues
+import multiprocessing.synchronize
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Tuple, Callable, Optional, Union
+from .monte_carlo_simulation import PointGenerator, MonteCarloSimulation, BLOCK_SIZE
+from .rng import derive_seed
+from .samplers import SAMPLERS, PSEUDO_RANDOM_SAMPLERS, QMC_SEGMENT, make_sampler
+from .checkpoint import save_checkpoint
+from .telemetry import Telemetry
+from .regions import Region, make_region
+from .tracing import TraceWriter
+from .point_ring import PointRing
+from .result_cache import ResultCache
+from .estimators import Estimator, make_estimator
+
+
+# Backends d'exécution disponibles pour run_parallel
+BACKENDS = ("thread", "process", "auto")
+
+# Nombre de tirages entre deux publications des compteurs en mode précision cible
+CHUNK_SIZE = 100_000
+
+# Nombre de points livrés au GUI par appel de batch_callback
+GUI_BATCH_SIZE = 1000
+
+# Période (en secondes) à laquelle le gestionnaire relit les compteurs des workers
+POLL_INTERVAL = 0.01
+
+# Période (en secondes) entre deux écritures du fichier de reprise
+CHECKPOINT_INTERVAL = 60.0
+
+def gil_enabled() -> bool:
+    """
+    Indique si l'interpréteur a un GIL. Sur une version sans GIL (python3.13t),
+    les threads tournent vraiment en parallèle et le backend auto les préfère
+    aux processus.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
 
 class ThreadResult:
     """
-    Classe pour stocker les résultats d'un thread (compteurs uniquement)
+    Classe pour stocker les résultats d'un thread (compteurs uniquement). Chaque
+    worker a la sienne et il en est le seul écrivain : aucun verrou ni compteur
+    partagé n'est nécessaire. Le gestionnaire lit aussi les compteurs pendant
+    l'exécution (surveillance : précision cible, télémétrie), sans verrou : les
+    deux compteurs n'étant pas publiés ensemble, une lecture peut mêler deux
+    paquets. Les fichiers de reprise utilisent snapshot, publié d'un bloc, et le
+    résultat final est fusionné après join.
     """
     def __init__(self):
         self.total_points = 0
         self.inside_points = 0
+        # Temps CPU consommé par le worker, publié en fin de paquet (télémétrie)
+        self.cpu_time = 0.0
+        # Dernier état cohérent (total_points, inside_points, état du générateur),
+        # publié en fin de paquet quand la reprise est activée
+        self.snapshot: Optional[Tuple[int, int, dict]] = None
+
+
+def make_worker_generator(thread_id: int, seed: Optional[int], engine: str,
+                          sampler: str = "random", segment_size: int = QMC_SEGMENT,
+                          block_size: int = BLOCK_SIZE, region: Union[str, Region] = "quadrant",
+                          dimension: Optional[int] = None) -> PointGenerator:
+    """
+    Construit le générateur d'un worker. En pseudo-aléatoire (random), chaque
+    worker a son propre flux dérivé de la graine ; avec philox et en
+    quasi-Monte Carlo, tous les workers partagent la même suite (même clé ou
+    même brouillage) et chacun en parcourt un segment disjoint.
+
+    Args:
+        thread_id (int): L'indice du worker
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul
+        sampler (str): L'échantillonneur ("random", "philox", "halton" ou "sobol"). Defaults to "random".
+        segment_size (int): La longueur du segment de suite par worker. Defaults to QMC_SEGMENT.
+        block_size (int): Nombre de points par bloc du moteur numpy. Defaults to BLOCK_SIZE.
+        region (str | Region): La région évaluée (voir make_region). Defaults to "quadrant".
+        dimension (int, optional): La dimension de la région. Defaults to None.
+
+    Returns:
+        PointGenerator: Le générateur du worker
+    """
+    region = make_region(region, dimension)
+    if sampler == "random":
+        worker_seed = derive_seed(seed, thread_id)
+        return PointGenerator(worker_seed, engine=engine, block_size=block_size, region=region,
+                              sampler=make_sampler(sampler, worker_seed, dimension=region.dimension))
+    return PointGenerator(seed, engine=engine, block_size=block_size, region=region,
+                          sampler=make_sampler(sampler, seed, offset=thread_id * segment_size,
+                                               dimension=region.dimension))
+
+
+def generate_traced_batch(generator: PointGenerator, n: int, total_points: int, inside_points: int,
+                          thread_id: int, trace_every: int,
+                          records: List[Tuple[int, int, int]]) -> Tuple[int, int]:
+    """
+    Tire n points comme generator.generate_batch(n), en s'arrêtant à chaque
+    multiple de trace_every tirages cumulés du worker pour y noter ses compteurs.
+    Les tirages sont les mêmes qu'en un seul appel.
+
+    Args:
+        generator (PointGenerator): Le générateur du worker
+        n (int): Le nombre de points à générer
+        total_points (int): Les tirages déjà effectués par le worker
+        inside_points (int): Les points déjà comptés dans la région
+        thread_id (int): L'indice du worker
+        trace_every (int): Le nombre de tirages entre deux points de trace
+        records (list): La liste à laquelle ajouter les points (thread_id, total, inside)
+
+    Returns:
+        Tuple (n, inside_points du paquet)
+    """
+    done = inside = 0
+    while done < n:
+        step = min(n - done, trace_every - (total_points + done) % trace_every)
+        inside += generator.generate_batch(step)[1]
+        done += step
+        if (total_points + done) % trace_every == 0:
+            records.append((thread_id, total_points + done, inside_points + inside))
+    return n, inside
 
 
 class MonteCarloThread(threading.Thread):
@@ -16,28 +135,96 @@ class MonteCarloThread(threading.Thread):
     Classe de threading pour exécuter la simulation de Monte Carlo en parallèle
     """
 
-    def __init__(self, thread_id: int, nb_draws: int, seed: int,
-                 result_container: ThreadResult, callback: Optional[Callable] = None):
+    def __init__(self, thread_id: int, nb_draws: Optional[int], seed: Optional[int],
+                 result_container: ThreadResult, callback: Optional[Callable] = None,
+                 engine: str = "python", stop_event: Optional[threading.Event] = None,
+                 chunk_size: int = CHUNK_SIZE, batch_callback: Optional[Callable] = None,
+                 batch_size: int = GUI_BATCH_SIZE, sampler: str = "random",
+                 segment_size: int = QMC_SEGMENT, block_size: int = BLOCK_SIZE,
+                 resume: Optional[dict] = None, publish_state: bool = False,
+                 region: Union[str, Region] = "quadrant", dimension: Optional[int] = None,
+                 trace_queue=None, trace_every: Optional[int] = None):
         super().__init__()
         self.thread_id = thread_id
         self.nb_draws = nb_draws
         self.callback = callback
+        self.batch_callback = batch_callback
+        self.batch_size = batch_size
+        self.stop_event = stop_event
+        self.chunk_size = chunk_size
         self.result_container = result_container
-        self.seed = (seed + thread_id) if seed is not None else None
-        self.generator = PointGenerator(self.seed)
+        # Flux aléatoire privé dérivé de la graine globale et de l'indice du thread
+        self.generator = make_worker_generator(thread_id, seed, engine, sampler, segment_size,
+                                               block_size, region, dimension)
+        self.seed = self.generator.calculator.seed
+        self.publish_state = publish_state
+        # Points de trace envoyés par lots dans trace_queue (None : pas de trace)
+        self.trace_queue = trace_queue
+        self.trace_every = trace_every
+        if resume is not None:
+            # Reprise : compteurs et générateur repartent de l'état sauvegardé
+            self.generator.set_state(resume["state"])
+            self.result_container.total_points = resume["total_points"]
+            self.result_container.inside_points = resume["inside_points"]
+        if publish_state:
+            self.result_container.snapshot = (self.result_container.total_points,
+                                              self.result_container.inside_points,
+                                              self.generator.get_state())
 
     def run(self):
-        if self.callback is not None:
-            # Mode GUI : génère les points un par un
-            for _ in range(self.nb_draws):
-                points, inside = self.generator.generate_points_with_details(1)
-                if points:
-                    x, y, is_inside = points[0]
+        if self.batch_callback is not None:
+            # Mode GUI par blocs : un appel (donc un verrou côté GUI) par bloc de points
+            remaining = self.nb_draws
+            while remaining > 0:
+                n = min(self.batch_size, remaining)
+                block, inside = self.generator.generate_points_with_details(n)
+                self.batch_callback(block.xs, block.ys, block.inside_flags, inside)
+                if self.result_container is not None:
+                    self.result_container.inside_points += inside
+                    self.result_container.total_points += n
+                remaining -= n
+        elif self.callback is not None:
+            # Mode GUI point par point : les points sont tirés par blocs en
+            # colonnes puis livrés un par un
+            remaining = self.nb_draws
+            while remaining > 0:
+                n = min(self.batch_size, remaining)
+                block, inside = self.generator.generate_points_with_details(n)
+                for x, y, is_inside in block:
                     self.callback(x, y, is_inside)
-                    if self.result_container is not None:
-                        self.result_container.total_points += 1
-                        if is_inside:
-                            self.result_container.inside_points += 1
+                if self.result_container is not None:
+                    self.result_container.total_points += n
+                    self.result_container.inside_points += inside
+                remaining -= n
+        elif self.stop_event is not None:
+            # Mode par paquets (précision cible, reprise) : tirages jusqu'à l'arrêt
+            # demandé ou jusqu'à nb_draws (None = pas de limite)
+            result = self.result_container
+            cpu_start = time.thread_time()
+            while not self.stop_event.is_set():
+                n = self.chunk_size
+                if self.nb_draws is not None:
+                    n = min(n, self.nb_draws - result.total_points)
+                    if n <= 0:
+                        break
+                if self.trace_queue is not None:
+                    records = []
+                    total, inside = generate_traced_batch(self.generator, n, result.total_points,
+                                                          result.inside_points, self.thread_id,
+                                                          self.trace_every, records)
+                    if records:
+                        self.trace_queue.put(records)
+                else:
+                    total, inside = self.generator.generate_batch(n)
+                result.inside_points += inside
+                result.total_points += total
+                result.cpu_time = time.thread_time() - cpu_start
+                if self.publish_state:
+                    result.snapshot = (result.total_points, result.inside_points,
+                                       self.generator.get_state())
+            if self.trace_queue is not None and result.total_points % self.trace_every:
+                # Dernier point de trace : les compteurs finaux du worker
+                self.trace_queue.put([(self.thread_id, result.total_points, result.inside_points)])
         else:
             # Mode CLI : comptage uniquement, aucun stockage des coordonnées
             total, inside = self.generator.generate_batch(self.nb_draws)
@@ -46,24 +233,382 @@ class MonteCarloThread(threading.Thread):
                 self.result_container.inside_points += inside
 
 
+def run_worker_process(thread_id: int, nb_draws: int, seed: Optional[int], engine: str,
+                       sampler: str = "random", block_size: int = BLOCK_SIZE,
+                       region: Union[str, Region] = "quadrant",
+                       dimension: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Point d'entrée d'un worker du backend processus. Seuls les compteurs sont
+    renvoyés au processus parent, jamais les points.
+
+    Args:
+        thread_id (int): L'indice du worker
+        nb_draws (int): Le nombre de tirages à effectuer
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul
+        sampler (str): L'échantillonneur. Defaults to "random".
+        block_size (int): Nombre de points par bloc du moteur numpy. Defaults to BLOCK_SIZE.
+        region (str | Region): La région évaluée. Defaults to "quadrant".
+        dimension (int, optional): La dimension de la région. Defaults to None.
+
+    Returns:
+        Tuple (total_points, inside_points)
+    """
+    generator = make_worker_generator(thread_id, seed, engine, sampler, segment_size=nb_draws,
+                                      block_size=block_size, region=region, dimension=dimension)
+    return generator.generate_batch(nb_draws)
+
+
+def run_worker_to_ring(thread_id: int, nb_draws: int, seed: Optional[int], engine: str, ring: PointRing,
+                       batch_size: int = GUI_BATCH_SIZE, sampler: str = "random",
+                       block_size: int = BLOCK_SIZE) -> Tuple[int, int]:
+    """
+    Point d'entrée d'un worker processus en mode GUI : les points sont écrits
+    par blocs dans le tampon partagé du worker, que le GUI lit sans copie.
+
+    Args:
+        thread_id (int): L'indice du worker
+        nb_draws (int): Le nombre de tirages à effectuer
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul
+        ring (PointRing): Le tampon du worker
+        batch_size (int): Le nombre de points par bloc. Defaults to GUI_BATCH_SIZE.
+        sampler (str): L'échantillonneur. Defaults to "random".
+        block_size (int): Nombre de points par bloc du moteur numpy. Defaults to BLOCK_SIZE.
+
+    Returns:
+        Tuple (total_points, inside_points)
+    """
+    generator = make_worker_generator(thread_id, seed, engine, sampler, segment_size=nb_draws,
+                                      block_size=block_size)
+    total_points = inside_points = 0
+    try:
+        while total_points < nb_draws:
+            n = min(batch_size, nb_draws - total_points)
+            block, inside = generator.generate_points_with_details(n)
+            ring.write(block.xs, block.ys, block.inside_flags, inside)
+            total_points += n
+            inside_points += inside
+    finally:
+        ring.close()
+    return total_points, inside_points
+
+
+def run_estimator_worker(thread_id: int, nb_draws: int, seed: Optional[int], engine: str,
+                         sampler: str, block_size: int, estimator: str) -> Estimator:
+    """
+    Point d'entrée d'un worker en mode estimateur (threads ou processus) : les
+    points du worker alimentent son propre estimateur, fusionné par le gestionnaire
+
+    Args:
+        thread_id (int): L'indice du worker
+        nb_draws (int): Le nombre de tirages à effectuer
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul (python ou numpy)
+        sampler (str): L'échantillonneur
+        block_size (int): Nombre de points par bloc du moteur numpy
+        estimator (str): Le nom de l'estimateur (voir ESTIMATORS)
+
+    Returns:
+        Estimator: L'estimateur du worker
+    """
+    generator = make_worker_generator(thread_id, seed, engine, sampler, segment_size=nb_draws,
+                                      block_size=block_size)
+    return generator.generate_estimate(make_estimator(estimator), nb_draws)
+
+
+def extend_shard(shard_id: int, draws: int, state: Optional[dict], seed: Optional[int], engine: str,
+                 sampler: str, segment_size: int, block_size: int,
+                 region: Union[str, Region]) -> Tuple[int, int, dict]:
+    """
+    Tire draws points d'un shard (worker ou paquet), depuis le début de son flux
+    ou depuis l'état où une exécution précédente l'a laissé
+
+    Args:
+        shard_id (int): L'indice du shard
+        draws (int): Le nombre de tirages à ajouter
+        state (dict, optional): L'état du générateur à poursuivre, None pour un shard neuf
+        seed (int): La graine globale
+        engine (str): Le moteur de calcul
+        sampler (str): L'échantillonneur
+        segment_size (int): La longueur du segment de suite QMC par shard
+        block_size (int): Nombre de points par bloc du moteur numpy
+        region (str | Region): La région évaluée
+
+    Returns:
+        Tuple (total_points, inside_points, état du générateur) des tirages ajoutés
+    """
+    generator = make_worker_generator(shard_id, seed, engine, sampler, segment_size=segment_size,
+                                      block_size=block_size, region=region)
+    if state is not None:
+        generator.set_state(state)
+    total, inside = generator.generate_batch(draws)
+    return total, inside, generator.get_state()
+
+
+# État partagé d'un processus worker en mode par paquets, installé par
+# _init_process_worker (les primitives multiprocessing ne peuvent être transmises
+# qu'à la création du processus)
+_process_state: dict = {}
+
+
+def _init_process_worker(counters, stop_event, snapshots=None, cpu_times=None,
+                         trace_queue=None, chunk_counter=None) -> None:
+    _process_state["counters"] = counters
+    _process_state["stop_event"] = stop_event
+    _process_state["snapshots"] = snapshots
+    _process_state["cpu_times"] = cpu_times
+    _process_state["trace_queue"] = trace_queue
+    _process_state["chunk_counter"] = chunk_counter
+
+
+def next_chunk(chunk_counter, total_draws: int, chunk_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Réserve le prochain paquet du budget de tirages
+
+    Args:
+        chunk_counter: Le compteur partagé (multiprocessing.Value) du prochain indice de paquet
+        total_draws (int): Le budget total de tirages
+        chunk_size (int): Le nombre de tirages par paquet
+
+    Returns:
+        Tuple (indice du paquet, nombre de tirages), ou None si le budget est épuisé
+    """
+    with chunk_counter.get_lock():
+        chunk_id = chunk_counter.value
+        chunk_counter.value += 1
+    start = chunk_id * chunk_size
+    if start >= total_draws:
+        return None
+    return chunk_id, min(chunk_size, total_draws - start)
+
+
+def run_scheduled_worker(thread_id: int, total_draws: int, chunk_size: int, seed: Optional[int],
+                         engine: str, sampler: str, block_size: int, region: Union[str, Region],
+                         chunk_counter, stop_event,
+                         publish: Callable[[int, int, float], None]) -> Tuple[int, int]:
+    """
+    Boucle d'un worker en mode planifié : tant qu'il reste des paquets, le
+    worker prend le suivant dès qu'il est libre. Le générateur d'un paquet ne
+    dépend que de son indice (flux dérivé de la graine, ou segment de la suite
+    QMC) : le résultat ne dépend pas du worker qui a calculé chaque paquet.
+
+    Args:
+        thread_id (int): L'indice du worker
+        total_draws (int): Le budget total de tirages
+        chunk_size (int): Le nombre de tirages par paquet
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul
+        sampler (str): L'échantillonneur
+        block_size (int): Nombre de points par bloc du moteur numpy
+        region (str | Region): La région évaluée
+        chunk_counter: Le compteur partagé du prochain indice de paquet
+        stop_event: L'événement d'arrêt anticipé
+        publish: Appelée après chaque paquet avec (total_points, inside_points, temps CPU) du worker
+
+    Returns:
+        Tuple (total_points, inside_points) du worker
+    """
+    total_points = inside_points = 0
+    cpu_start = time.thread_time()
+    while not stop_event.is_set():
+        chunk = next_chunk(chunk_counter, total_draws, chunk_size)
+        if chunk is None:
+            break
+        chunk_id, draws = chunk
+        generator = make_worker_generator(chunk_id, seed, engine, sampler, segment_size=chunk_size,
+                                          block_size=block_size, region=region)
+        total, inside = generator.generate_batch(draws)
+        total_points += total
+        inside_points += inside
+        publish(total_points, inside_points, time.thread_time() - cpu_start)
+    return total_points, inside_points
+
+
+def run_scheduled_process(thread_id: int, total_draws: int, chunk_size: int, seed: Optional[int],
+                          engine: str, sampler: str, block_size: int,
+                          region: Union[str, Region]) -> Tuple[int, int]:
+    """
+    Point d'entrée d'un worker processus en mode planifié (voir run_scheduled_worker).
+    Les compteurs sont publiés dans les tableaux partagés après chaque paquet.
+    """
+    counters = _process_state["counters"]
+    cpu_times = _process_state["cpu_times"]
+
+    def publish(total_points: int, inside_points: int, cpu_time: float) -> None:
+        counters[2 * thread_id + 1] = inside_points
+        counters[2 * thread_id] = total_points
+        cpu_times[thread_id] = cpu_time
+
+    return run_scheduled_worker(thread_id, total_draws, chunk_size, seed, engine, sampler, block_size,
+                                region, _process_state["chunk_counter"], _process_state["stop_event"],
+                                publish)
+
+
+def run_worker_until_stopped(thread_id: int, nb_draws: Optional[int], seed: Optional[int], engine: str,
+                             chunk_size: int, sampler: str = "random",
+                             block_size: int = BLOCK_SIZE,
+                             resume: Optional[dict] = None,
+                             region: Union[str, Region] = "quadrant",
+                             dimension: Optional[int] = None,
+                             trace_every: Optional[int] = None) -> Tuple[int, int, dict]:
+    """
+    Point d'entrée d'un worker processus en mode par paquets. Les compteurs
+    sont publiés dans le tableau partagé après chaque paquet de chunk_size tirages,
+    jusqu'à ce que le gestionnaire demande l'arrêt. Si un dictionnaire partagé de
+    snapshots a été installé, l'état du générateur y est aussi publié pour la reprise ;
+    si une file de trace a été installée, les points de trace y sont envoyés par paquet.
+
+    Args:
+        thread_id (int): L'indice du worker
+        nb_draws (int, optional): Le nombre maximal de tirages, None pour aucune limite
+        seed (int, optional): La graine globale de la simulation
+        engine (str): Le moteur de calcul
+        chunk_size (int): Le nombre de tirages par paquet
+        sampler (str): L'échantillonneur. Defaults to "random".
+        block_size (int): Nombre de points par bloc du moteur numpy. Defaults to BLOCK_SIZE.
+        resume (dict, optional): L'état sauvegardé du worker à reprendre. Defaults to None.
+        region (str | Region): La région évaluée. Defaults to "quadrant".
+        dimension (int, optional): La dimension de la région. Defaults to None.
+        trace_every (int, optional): Le nombre de tirages entre deux points de trace. Defaults to None.
+
+    Returns:
+        Tuple (total_points, inside_points, état du générateur)
+    """
+    counters = _process_state["counters"]
+    stop_event = _process_state["stop_event"]
+    snapshots = _process_state["snapshots"]
+    cpu_times = _process_state["cpu_times"]
+    trace_queue = _process_state["trace_queue"]
+    generator = make_worker_generator(thread_id, seed, engine, sampler,
+                                      segment_size=nb_draws if nb_draws is not None else QMC_SEGMENT,
+                                      block_size=block_size, region=region, dimension=dimension)
+    total_points = inside_points = 0
+    if resume is not None:
+        generator.set_state(resume["state"])
+        total_points, inside_points = resume["total_points"], resume["inside_points"]
+    cpu_start = time.thread_time()
+    while not stop_event.is_set():
+        n = chunk_size if nb_draws is None else min(chunk_size, nb_draws - total_points)
+        if n <= 0:
+            break
+        if trace_queue is not None and trace_every is not None:
+            records: List[Tuple[int, int, int]] = []
+            total, inside = generate_traced_batch(generator, n, total_points, inside_points,
+                                                  thread_id, trace_every, records)
+            if records:
+                trace_queue.put(records)
+        else:
+            total, inside = generator.generate_batch(n)
+        inside_points += inside
+        total_points += total
+        counters[2 * thread_id + 1] = inside_points
+        counters[2 * thread_id] = total_points
+        if cpu_times is not None:
+            cpu_times[thread_id] = time.thread_time() - cpu_start
+        if snapshots is not None:
+            snapshots[thread_id] = (total_points, inside_points, generator.get_state())
+    if trace_queue is not None and trace_every is not None and total_points % trace_every:
+        trace_queue.put([(thread_id, total_points, inside_points)])
+    return total_points, inside_points, generator.get_state()
+
+
 class ThreadingManager:
     """
     Gestionnaire de threads pour la simulation Monte Carlo
     """
 
-    def __init__(self, nb_threads: int, nb_draws_per_thread: int, seed: int):
+    def __init__(self, nb_threads: int, nb_draws_per_thread: int, seed: Optional[int],
+                 engine: str = "python", backend: str = "thread", sampler: str = "random",
+                 block_size: int = BLOCK_SIZE, telemetry: Optional[Telemetry] = None,
+                 region: Union[str, Region] = "quadrant", dimension: Optional[int] = None,
+                 trace: Optional[TraceWriter] = None, total_draws: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend inconnu: {backend} (choix possibles: {', '.join(BACKENDS)})")
+        if sampler not in SAMPLERS:
+            raise ValueError(f"Échantillonneur inconnu: {sampler} (choix possibles: {', '.join(SAMPLERS)})")
         self.nb_threads = nb_threads
         self.nb_draws_per_thread = nb_draws_per_thread
         self.seed = seed
+        self.engine = engine
+        self.backend = backend
+        self.sampler = sampler
+        self.block_size = block_size
+        # Région évaluée par les workers (le quadrant : estimation de pi)
+        self.region = make_region(region, dimension)
+        # Avec la télémétrie ou la trace, les exécutions passent par le mode par
+        # paquets pour que les compteurs soient publiés en cours de route
+        self.telemetry = telemetry
+        self.trace = trace
+        # Budget total réparti dynamiquement par paquets de chunk_size tirages
+        # (None : nb_draws_per_thread tirages fixes par worker)
+        self.total_draws = total_draws
+        self.chunk_size = chunk_size
         self.threads: List[MonteCarloThread] = []
         self.results: List[ThreadResult] = []
+        self.stop_event: Optional[Union[threading.Event, multiprocessing.synchronize.Event]] = None
+        # Shards lus, prolongés et calculés par le dernier run_cached
+        self.cache_stats: Optional[dict] = None
 
-    def run_parallel(self, callback: Optional[Callable] = None) -> Tuple[int, int]:
+    def stop(self) -> None:
         """
-        Exécute les threads en parallèle et collecte les résultats.
+        Demande l'arrêt d'une exécution par paquets en cours (précision cible,
+        reprise) : chaque worker s'arrête à la fin de son paquet courant et les
+        compteurs partiels sont retournés.
+        """
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def worker_seed(self) -> Optional[int]:
+        """
+        Retourne la graine transmise aux workers. Sans graine, les workers
+        philox et quasi-Monte Carlo doivent tout de même partager la même clé ou
+        le même brouillage : une graine est alors tirée une fois pour toute l'exécution.
+        """
+        if self.seed is None and self.sampler != "random":
+            return random.SystemRandom().getrandbits(64)
+        return self.seed
+
+    def resolve_backend(self, callback: Optional[Callable] = None,
+                        batch_callback: Optional[Callable] = None) -> str:
+        """
+        Choisit le backend effectivement utilisé. Le mode GUI (callback) ne peut
+        tourner qu'avec des threads, le callback n'étant pas partageable entre processus.
+        Le backend auto choisit des processus pour plusieurs workers, sauf sur un
+        interpréteur sans GIL où les threads passent à l'échelle sans leur coût.
 
         Args:
             callback: Fonction de rappel optionnelle pour le mode GUI. Defaults to None.
+            batch_callback: Fonction de rappel par blocs pour le mode GUI. Defaults to None.
+
+        Returns:
+            str: "thread" ou "process"
+        """
+        if callback is not None or batch_callback is not None:
+            if self.backend == "process":
+                logging.warning("Le mode GUI nécessite le backend thread, utilisation des threads")
+            return "thread"
+        if self.backend == "auto":
+            return "process" if self.nb_threads > 1 and gil_enabled() else "thread"
+        return self.backend
+
+    def run_parallel(self, callback: Optional[Callable] = None,
+                     batch_callback: Optional[Callable] = None,
+                     batch_size: int = GUI_BATCH_SIZE,
+                     rings: Optional[List[PointRing]] = None) -> Tuple[int, int]:
+        """
+        Exécute les threads en parallèle et collecte les résultats.
+
+        Args:
+            callback: Fonction de rappel optionnelle pour le mode GUI, appelée pour chaque
+                point avec (x, y, is_inside). Defaults to None.
+            batch_callback: Fonction de rappel par blocs pour le mode GUI, appelée avec
+                (xs, ys, inside_flags, inside_count) pour chaque bloc de batch_size points.
+                Defaults to None.
+            batch_size: Le nombre de points par bloc. Defaults to GUI_BATCH_SIZE.
+            rings: Un tampon partagé par worker (mode GUI avec des processus) dans
+                lequel chaque worker écrit ses blocs de points. Defaults to None.
 
         Returns:
             Tuple (total_points, inside_points)
@@ -71,6 +616,17 @@ class ThreadingManager:
         self.threads = []
         self.results = []
 
+        seed = self.worker_seed()
+        if rings is not None:
+            return self._run_processes_to_rings(seed, rings, batch_size)
+        if self.total_draws is not None and callback is None and batch_callback is None:
+            return self._run_scheduled(self.total_draws, seed)
+        if (self.telemetry is not None or self.trace is not None) \
+                and callback is None and batch_callback is None:
+            return self._run_chunked(seed, self.chunk_size, self.nb_draws_per_thread)
+        if self.resolve_backend(callback, batch_callback) == "process":
+            return self._run_processes(seed)
+
         for i in range(self.nb_threads):
             result_container = ThreadResult()
             self.results.append(result_container)
@@ -78,9 +634,16 @@ class ThreadingManager:
             thread = MonteCarloThread(
                 thread_id=i,
                 nb_draws=self.nb_draws_per_thread,
-                seed=self.seed,
+                seed=seed,
                 callback=callback,
-                result_container=result_container
+                result_container=result_container,
+                engine=self.engine,
+                batch_callback=batch_callback,
+                batch_size=batch_size,
+                sampler=self.sampler,
+                segment_size=self.nb_draws_per_thread,
+                block_size=self.block_size,
+                region=self.region
             )
             self.threads.append(thread)
 
@@ -93,4 +656,566 @@ class ThreadingManager:
         total_points = sum(result.total_points for result in self.results)
         inside_points = sum(result.inside_points for result in self.results)
 
-        return total_points, inside_points
\ No newline at end of file
+        return total_points, inside_points
+
+    def _run_processes(self, seed: Optional[int]) -> Tuple[int, int]:
+        """
+        Exécute les workers dans un pool de processus pour contourner le GIL.
+
+        Args:
+            seed (int, optional): La graine transmise aux workers
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        with ProcessPoolExecutor(max_workers=self.nb_threads) as pool:
+            futures = [
+                pool.submit(run_worker_process, i, self.nb_draws_per_thread, seed, self.engine,
+                            self.sampler, self.block_size, self.region)
+                for i in range(self.nb_threads)
+            ]
+            for future in futures:
+                result_container = ThreadResult()
+                result_container.total_points, result_container.inside_points = future.result()
+                self.results.append(result_container)
+
+        total_points = sum(result.total_points for result in self.results)
+        inside_points = sum(result.inside_points for result in self.results)
+
+        return total_points, inside_points
+
+    def _run_processes_to_rings(self, seed: Optional[int], rings: List[PointRing],
+                                batch_size: int) -> Tuple[int, int]:
+        """
+        Exécute les workers dans un pool de processus qui écrivent leurs points
+        dans les tampons partagés lus par le GUI.
+
+        Args:
+            seed (int, optional): La graine transmise aux workers
+            rings (list): Un tampon par worker
+            batch_size (int): Le nombre de points par bloc
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        if len(rings) != self.nb_threads:
+            raise ValueError(f"Il faut un tampon par worker ({self.nb_threads}), reçu {len(rings)}")
+        with ProcessPoolExecutor(max_workers=self.nb_threads) as pool:
+            futures = [
+                pool.submit(run_worker_to_ring, i, self.nb_draws_per_thread, seed, self.engine, ring,
+                            batch_size, self.sampler, self.block_size)
+                for i, ring in enumerate(rings)
+            ]
+            for future in futures:
+                result_container = ThreadResult()
+                result_container.total_points, result_container.inside_points = future.result()
+                self.results.append(result_container)
+
+        total_points = sum(result.total_points for result in self.results)
+        inside_points = sum(result.inside_points for result in self.results)
+
+        return total_points, inside_points
+
+    def _run_scheduled(self, total_draws: int, seed: Optional[int]) -> Tuple[int, int]:
+        """
+        Répartit total_draws tirages en paquets de chunk_size que les workers
+        prennent au fur et à mesure : un worker lent (cœur plus lent, voisin
+        bruyant) calcule simplement moins de paquets au lieu de retarder toute
+        l'exécution. Les compteurs de chaque worker sont publiés après chaque
+        paquet pour la télémétrie.
+
+        Args:
+            total_draws (int): Le budget total de tirages (self.total_draws)
+            seed (int, optional): La graine transmise aux workers
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        if self.trace is not None:
+            # Les trajectoires par worker dépendraient de la répartition des paquets
+            raise ValueError("La trace de convergence n'est pas disponible avec un budget total de tirages")
+        self.threads = []
+        self.results = []
+        chunk_counter = multiprocessing.Value('q', 0)
+        args = (total_draws, self.chunk_size, seed, self.engine, self.sampler, self.block_size,
+                self.region)
+
+        if self.resolve_backend() == "process":
+            counters = multiprocessing.Array('q', 2 * self.nb_threads, lock=False)
+            cpu_times = multiprocessing.Array('d', self.nb_threads, lock=False)
+            stop_event: Union[threading.Event, multiprocessing.synchronize.Event] = multiprocessing.Event()
+            self.stop_event = stop_event
+
+            def read_workers():
+                return [(counters[2 * i], counters[2 * i + 1], cpu_times[i])
+                        for i in range(self.nb_threads)]
+
+            with ProcessPoolExecutor(max_workers=self.nb_threads, initializer=_init_process_worker,
+                                     initargs=(counters, stop_event, None, cpu_times, None,
+                                               chunk_counter)) as pool:
+                futures = [pool.submit(run_scheduled_process, i, *args) for i in range(self.nb_threads)]
+                self._monitor(
+                    read_counters=lambda: (sum(counters[0::2]), sum(counters[1::2])),
+                    is_running=lambda: not all(future.done() for future in futures),
+                    stop_event=stop_event,
+                    telemetry=self.telemetry,
+                    read_workers=read_workers,
+                    planned_points=lambda total_points, inside_points: total_draws,
+                    scale=self.region.scale,
+                )
+                final = [future.result() for future in futures]
+            for total, inside in final:
+                result_container = ThreadResult()
+                result_container.total_points, result_container.inside_points = total, inside
+                self.results.append(result_container)
+        else:
+            stop_event = self.stop_event = threading.Event()
+            threads = []
+            for i in range(self.nb_threads):
+                result_container = ThreadResult()
+                self.results.append(result_container)
+
+                def publish(total_points, inside_points, cpu_time, result=result_container):
+                    result.inside_points = inside_points
+                    result.total_points = total_points
+                    result.cpu_time = cpu_time
+
+                threads.append(threading.Thread(target=run_scheduled_worker,
+                                                args=(i, *args, chunk_counter, stop_event, publish)))
+
+            def read_workers():
+                return [(result.total_points, result.inside_points, result.cpu_time)
+                        for result in self.results]
+
+            for thread in threads:
+                thread.start()
+            self._monitor(
+                read_counters=lambda: (sum(result.total_points for result in self.results),
+                                       sum(result.inside_points for result in self.results)),
+                is_running=lambda: any(thread.is_alive() for thread in threads),
+                stop_event=stop_event,
+                telemetry=self.telemetry,
+                read_workers=read_workers,
+                planned_points=lambda total_points, inside_points: total_draws,
+                scale=self.region.scale,
+            )
+            for thread in threads:
+                thread.join()
+
+        total_points = sum(result.total_points for result in self.results)
+        inside_points = sum(result.inside_points for result in self.results)
+        if self.telemetry is not None:
+            # Dernier échantillon : les compteurs définitifs
+            self.telemetry.sample(read_workers(), total_draws)
+        return total_points, inside_points
+
+    def cache_config(self) -> dict:
+        """
+        Retourne la configuration qui identifie une entrée du cache de résultats :
+        tout ce dont dépendent les flux des shards, mais pas le nombre de tirages.
+        En découpage par worker, le flux pseudo-aléatoire d'un worker ne dépend
+        que de son indice ; le segment QMC d'un worker dépend en revanche du
+        nombre de tirages par worker.
+        """
+        segment_size: Optional[int]
+        if self.total_draws is not None:
+            layout, segment_size = "chunk", self.chunk_size
+        else:
+            layout = "worker"
+            segment_size = self.nb_draws_per_thread if self.sampler != "random" else None
+        return {
+            "seed": self.seed,
+            "engine": self.engine,
+            "sampler": self.sampler,
+            "block_size": self.block_size,
+            "region": self.region.name,
+            "dimension": self.region.dimension,
+            "layout": layout,
+            "segment_size": segment_size,
+        }
+
+    def run_cached(self, cache: ResultCache) -> Tuple[int, int]:
+        """
+        Exécute la simulation en réutilisant le cache de résultats : les shards
+        déjà calculés sont lus, ceux qui ont déjà tiré une partie de leurs points
+        sont poursuivis depuis l'état sauvegardé, et seuls les tirages manquants
+        sont effectués. Le résultat est exactement celui d'une exécution neuve.
+
+        Args:
+            cache (ResultCache): Le cache
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        if self.seed is None:
+            logging.warning("Sans graine, l'exécution n'est pas reproductible : cache ignoré")
+            return self.run_parallel()
+        config = self.cache_config()
+        if self.total_draws is not None:
+            nb_chunks = -(-self.total_draws // self.chunk_size)
+            targets = [min(self.chunk_size, self.total_draws - i * self.chunk_size) for i in range(nb_chunks)]
+        else:
+            targets = [self.nb_draws_per_thread] * self.nb_threads
+        segment_size = config["segment_size"] or QMC_SEGMENT
+
+        entry = cache.get(config) or {"shards": {}, "states": {}}
+        shards, states = entry["shards"], entry["states"]
+        counts = {}
+        tasks = []
+        for shard_id, target in enumerate(targets):
+            key = str(shard_id)
+            cached = shards.get(key)
+            if cached is not None and cached[0] == target:
+                counts[shard_id] = tuple(cached)
+            elif cached is not None and cached[0] < target and key in states:
+                tasks.append((shard_id, target - cached[0], states[key], cached))
+            else:
+                tasks.append((shard_id, target, None, None))
+
+        self.cache_stats = {"hits": len(counts),
+                            "extended": sum(1 for task in tasks if task[2] is not None),
+                            "computed": sum(1 for task in tasks if task[2] is None)}
+        logging.info(f"Cache: {self.cache_stats['hits']} shard(s) lus, "
+                     f"{self.cache_stats['extended']} prolongé(s), {self.cache_stats['computed']} calculé(s)")
+        if tasks:
+            executor = ProcessPoolExecutor if self.resolve_backend() == "process" else ThreadPoolExecutor
+            with executor(max_workers=self.nb_threads) as pool:
+                futures = [pool.submit(extend_shard, shard_id, draws, state, self.seed, self.engine,
+                                       self.sampler, segment_size, self.block_size, self.region)
+                           for shard_id, draws, state, _ in tasks]
+                for (shard_id, _, _, cached), future in zip(tasks, futures):
+                    total, inside, state = future.result()
+                    if cached is not None:
+                        total, inside = cached[0] + total, cached[1] + inside
+                    counts[shard_id] = (total, inside)
+                    key = str(shard_id)
+                    if key in shards and shards[key][0] > total:
+                        # L'entrée contient déjà plus de tirages pour ce shard : on la garde
+                        continue
+                    shards[key] = [total, inside]
+                    if config["layout"] == "worker" or total < self.chunk_size:
+                        states[key] = state
+                    else:
+                        # Un paquet complet ne sera jamais prolongé
+                        states.pop(key, None)
+            cache.put(config, shards, states)
+
+        total_points = sum(total for total, _ in counts.values())
+        inside_points = sum(inside for _, inside in counts.values())
+        return total_points, inside_points
+
+    def run_estimator(self, estimator: str) -> Estimator:
+        """
+        Exécute les workers avec un estimateur de pi à variance réduite (ou
+        hit-or-miss) : chaque worker alimente son propre estimateur avec ses
+        nb_draws_per_thread points, puis les estimateurs sont fusionnés.
+
+        Args:
+            estimator (str): Le nom de l'estimateur (voir ESTIMATORS)
+
+        Returns:
+            Estimator: L'estimateur fusionné, qui fournit estimation et erreur type
+        """
+        merged = make_estimator(estimator)
+        if self.region.name != "quadrant":
+            raise ValueError("Les estimateurs ne sont disponibles que pour le quadrant (estimation de pi)")
+        if self.sampler not in PSEUDO_RANDOM_SAMPLERS:
+            # Comme en mode précision cible : l'erreur type empirique suppose des points indépendants
+            raise ValueError("Les estimateurs nécessitent un échantillonneur pseudo-aléatoire (random ou philox)")
+        seed = self.worker_seed()
+        executor = ProcessPoolExecutor if self.resolve_backend() == "process" else ThreadPoolExecutor
+        with executor(max_workers=self.nb_threads) as pool:
+            futures = [pool.submit(run_estimator_worker, i, self.nb_draws_per_thread, seed, self.engine,
+                                   self.sampler, self.block_size, estimator)
+                       for i in range(self.nb_threads)]
+            for future in futures:
+                merged.merge(future.result())
+        return merged
+
+    def run_until_precision(self, target_stderr: float, chunk_size: int = CHUNK_SIZE,
+                            max_draws_per_thread: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Exécute les workers jusqu'à ce que l'erreur type de l'estimation de pi,
+        calculée en continu sur les compteurs de tous les workers, passe sous
+        target_stderr. Tous les workers sont alors arrêtés à la fin de leur paquet.
+
+        Args:
+            target_stderr (float): L'erreur type visée sur pi
+            chunk_size (int): Le nombre de tirages entre deux publications des compteurs. Defaults to CHUNK_SIZE.
+            max_draws_per_thread (int, optional): Limite de tirages par worker. Defaults to None (aucune).
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        return self._run_chunked(self.worker_seed(), chunk_size, max_draws_per_thread,
+                                 target_stderr=target_stderr)
+
+    def checkpoint_config(self, seed: Optional[int]) -> dict:
+        """
+        Retourne la configuration enregistrée dans les fichiers de reprise
+
+        Args:
+            seed (int, optional): La graine effectivement transmise aux workers
+        """
+        return {
+            "nb_threads": self.nb_threads,
+            "nb_draws_per_thread": self.nb_draws_per_thread,
+            "seed": seed,
+            "engine": self.engine,
+            "sampler": self.sampler,
+            "block_size": self.block_size,
+            "region": self.region.name,
+            "dimension": self.region.dimension,
+        }
+
+    def run_with_checkpoints(self, checkpoint_path: str, checkpoint_interval: float = CHECKPOINT_INTERVAL,
+                             chunk_size: int = CHUNK_SIZE, resume: Optional[dict] = None,
+                             target_stderr: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Exécute les workers par paquets en écrivant périodiquement leurs compteurs
+        et l'état de leur générateur dans un fichier de reprise. Une exécution
+        reprise depuis ce fichier donne exactement les mêmes compteurs finaux
+        qu'une exécution ininterrompue.
+
+        Args:
+            checkpoint_path (str): Le fichier de reprise à écrire
+            checkpoint_interval (float): Secondes entre deux écritures. Defaults to CHECKPOINT_INTERVAL.
+            chunk_size (int): Le nombre de tirages par paquet. Defaults to CHUNK_SIZE.
+            resume (dict, optional): Le contenu d'un fichier de reprise (load_checkpoint)
+                à poursuivre. Defaults to None.
+            target_stderr (float, optional): Arrêt anticipé à cette erreur type. Defaults to None.
+
+        Returns:
+            Tuple (total_points, inside_points)
+        """
+        if resume is not None:
+            seed = resume["config"]["seed"]
+            if self.checkpoint_config(seed) != resume["config"] or self.seed not in (None, seed):
+                raise ValueError("La configuration ne correspond pas à celle du fichier de reprise")
+        else:
+            seed = self.worker_seed()
+        max_draws = self.nb_draws_per_thread if target_stderr is None else None
+        return self._run_chunked(seed, chunk_size, max_draws, target_stderr=target_stderr,
+                                 checkpoint_path=checkpoint_path,
+                                 checkpoint_interval=checkpoint_interval,
+                                 resume_workers=resume["workers"] if resume is not None else None)
+
+    def _run_chunked(self, seed: Optional[int], chunk_size: int, max_draws_per_thread: Optional[int],
+                     target_stderr: Optional[float] = None, checkpoint_path: Optional[str] = None,
+                     checkpoint_interval: float = CHECKPOINT_INTERVAL,
+                     resume_workers: Optional[List[Optional[dict]]] = None) -> Tuple[int, int]:
+        """
+        Exécute les workers par paquets pendant que le gestionnaire surveille leurs
+        compteurs (arrêt à la précision cible, écriture des fichiers de reprise).
+        """
+        if target_stderr is not None and self.sampler not in PSEUDO_RANDOM_SAMPLERS:
+            # Les points QMC ne sont pas indépendants : l'erreur type binomiale
+            # n'a pas de sens et ne peut pas servir de critère d'arrêt
+            raise ValueError("Le mode précision cible nécessite un échantillonneur pseudo-aléatoire (random ou philox)")
+        if self.total_draws is not None:
+            # Les paquets sont ici par worker : le budget total serait ignoré
+            raise ValueError("Les paquets par worker ne sont pas disponibles avec un budget total de tirages")
+        self.threads = []
+        self.results = []
+        segment_size = max_draws_per_thread or QMC_SEGMENT
+        if resume_workers is None:
+            resume_workers = [None] * self.nb_threads
+        publish_state = checkpoint_path is not None
+
+        def write_checkpoint(snapshots) -> None:
+            if checkpoint_path is None or any(snapshot is None for snapshot in snapshots):
+                # Un worker n'a pas encore publié d'état : on attend la prochaine période
+                return
+            workers = [
+                {"total_points": total, "inside_points": inside, "state": state}
+                for total, inside, state in snapshots
+            ]
+            save_checkpoint(checkpoint_path, self.checkpoint_config(seed), workers)
+
+        def planned_points(total_points: int, inside_points: int) -> Optional[int]:
+            # Nombre de tirages prévu : fixe, ou extrapolé de l'erreur type visée
+            if max_draws_per_thread is not None:
+                return max_draws_per_thread * self.nb_threads
+            if target_stderr is not None and 0 < inside_points < total_points:
+                ratio = inside_points / total_points
+                return math.ceil(self.region.scale ** 2 * ratio * (1.0 - ratio) / target_stderr ** 2)
+            return None
+
+        if self.resolve_backend() == "process":
+            counters = multiprocessing.Array('q', 2 * self.nb_threads, lock=False)
+            cpu_times = multiprocessing.Array('d', self.nb_threads, lock=False)
+            trace_queue: Optional[Union[multiprocessing.queues.Queue, queue.SimpleQueue]] = \
+                multiprocessing.Queue() if self.trace is not None else None
+            stop_event: Union[threading.Event, multiprocessing.synchronize.Event] = multiprocessing.Event()
+            self.stop_event = stop_event
+            # Un emplacement par worker, écrasé à chaque paquet : rien ne
+            # s'accumule côté workers, quel que soit l'intervalle de reprise
+            sync_manager = multiprocessing.Manager() if publish_state else None
+            shared_snapshots = sync_manager.dict() if sync_manager is not None else None
+            snapshots: List[Optional[Tuple[int, int, dict]]] = [None] * self.nb_threads
+            for i, resume in enumerate(resume_workers):
+                if resume is not None:
+                    counters[2 * i] = resume["total_points"]
+                    counters[2 * i + 1] = resume["inside_points"]
+                    snapshots[i] = (resume["total_points"], resume["inside_points"], resume["state"])
+
+            def read_workers():
+                return [(counters[2 * i], counters[2 * i + 1], cpu_times[i])
+                        for i in range(self.nb_threads)]
+
+            def read_snapshots():
+                for thread_id, snapshot in shared_snapshots.items():
+                    snapshots[thread_id] = snapshot
+                return snapshots
+
+            if self.trace is not None:
+                self.trace.start(trace_queue, [(counters[2 * i], counters[2 * i + 1])
+                                               for i in range(self.nb_threads)], self.region.scale)
+            try:
+                with ProcessPoolExecutor(max_workers=self.nb_threads, initializer=_init_process_worker,
+                                         initargs=(counters, stop_event, shared_snapshots,
+                                                   cpu_times, trace_queue)) as pool:
+                    futures = [
+                        pool.submit(run_worker_until_stopped, i, max_draws_per_thread, seed,
+                                    self.engine, chunk_size, self.sampler, self.block_size, resume,
+                                    self.region, None,
+                                    self.trace.every if self.trace is not None else None)
+                        for i, resume in enumerate(resume_workers)
+                    ]
+
+                    self._monitor(
+                        read_counters=lambda: (sum(counters[0::2]), sum(counters[1::2])),
+                        is_running=lambda: not all(future.done() for future in futures),
+                        stop_event=stop_event,
+                        target_stderr=target_stderr,
+                        write_checkpoint=(lambda: write_checkpoint(read_snapshots()))
+                        if publish_state else None,
+                        checkpoint_interval=checkpoint_interval,
+                        telemetry=self.telemetry,
+                        read_workers=read_workers,
+                        planned_points=planned_points,
+                        scale=self.region.scale,
+                    )
+
+                    final: List[Tuple[int, int, Optional[dict]]] = [future.result() for future in futures]
+            finally:
+                if sync_manager is not None:
+                    sync_manager.shutdown()
+                if self.trace is not None:
+                    # Les workers ont terminé : tous leurs lots sont dans la file
+                    self.trace.stop()
+
+            for total, inside, _ in final:
+                result_container = ThreadResult()
+                result_container.total_points, result_container.inside_points = total, inside
+                self.results.append(result_container)
+        else:
+            stop_event = self.stop_event = threading.Event()
+            trace_queue = queue.SimpleQueue() if self.trace is not None else None
+            for i, resume in enumerate(resume_workers):
+                result_container = ThreadResult()
+                self.results.append(result_container)
+                self.threads.append(MonteCarloThread(
+                    thread_id=i,
+                    nb_draws=max_draws_per_thread,
+                    seed=seed,
+                    result_container=result_container,
+                    engine=self.engine,
+                    stop_event=stop_event,
+                    chunk_size=chunk_size,
+                    sampler=self.sampler,
+                    segment_size=segment_size,
+                    block_size=self.block_size,
+                    resume=resume,
+                    publish_state=publish_state,
+                    region=self.region,
+                    trace_queue=trace_queue,
+                    trace_every=self.trace.every if self.trace is not None else None
+                ))
+
+            def read_workers():
+                return [(result.total_points, result.inside_points, result.cpu_time)
+                        for result in self.results]
+
+            if self.trace is not None:
+                self.trace.start(trace_queue, [(result.total_points, result.inside_points)
+                                               for result in self.results], self.region.scale)
+
+            for thread in self.threads:
+                thread.start()
+
+            self._monitor(
+                read_counters=lambda: (sum(result.total_points for result in self.results),
+                                       sum(result.inside_points for result in self.results)),
+                is_running=lambda: any(thread.is_alive() for thread in self.threads),
+                stop_event=stop_event,
+                target_stderr=target_stderr,
+                write_checkpoint=(lambda: write_checkpoint([result.snapshot for result in self.results]))
+                if publish_state else None,
+                checkpoint_interval=checkpoint_interval,
+                telemetry=self.telemetry,
+                read_workers=read_workers,
+                planned_points=planned_points,
+                scale=self.region.scale,
+            )
+
+            for thread in self.threads:
+                thread.join()
+
+            if self.trace is not None:
+                self.trace.stop()
+
+            final = [(result.total_points, result.inside_points,
+                      thread.generator.get_state() if publish_state else None)
+                     for result, thread in zip(self.results, self.threads)]
+
+        total_points = sum(result.total_points for result in self.results)
+        inside_points = sum(result.inside_points for result in self.results)
+
+        if self.telemetry is not None:
+            # Dernier échantillon : les compteurs définitifs
+            self.telemetry.sample(read_workers(), planned_points(total_points, inside_points))
+
+        if publish_state:
+            # Fichier de reprise final : une reprise depuis ce fichier ne tire plus rien
+            write_checkpoint(final)
+
+        return total_points, inside_points
+
+    @staticmethod
+    def _monitor(read_counters: Callable[[], Tuple[int, int]], is_running: Callable[[], bool],
+                 stop_event, read_workers: Callable[[], List[Tuple[int, int, float]]],
+                 planned_points: Callable[[int, int], Optional[int]],
+                 target_stderr: Optional[float] = None,
+                 write_checkpoint: Optional[Callable[[], None]] = None,
+                 checkpoint_interval: float = CHECKPOINT_INTERVAL,
+                 telemetry: Optional[Telemetry] = None,
+                 scale: float = 4.0) -> None:
+        """
+        Relit périodiquement les compteurs des workers tant qu'ils tournent :
+        demande l'arrêt dès que l'erreur type passe sous la cible (une estimation
+        dégénérée, sans point ou avec tous les points du même côté, ne déclenche
+        jamais l'arrêt), écrit le fichier de reprise toutes les checkpoint_interval
+        secondes et échantillonne la télémétrie à sa période. scale est le facteur
+        de la région (Region.scale) appliqué à l'erreur type.
+        """
+        last_checkpoint = time.monotonic()
+        if telemetry is not None:
+            telemetry.begin(read_workers(), scale)
+            last_sample = time.monotonic()
+        while is_running():
+            if telemetry is not None and time.monotonic() - last_sample >= telemetry.interval:
+                workers = read_workers()
+                telemetry.sample(workers, planned_points(sum(worker[0] for worker in workers),
+                                                         sum(worker[1] for worker in workers)))
+                last_sample = time.monotonic()
+            if target_stderr is not None:
+                total_points, inside_points = read_counters()
+                if 0 < inside_points < total_points and \
+                        MonteCarloSimulation.standard_error(total_points, inside_points, scale) <= target_stderr:
+                    stop_event.set()
+                    return
+            if write_checkpoint is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                write_checkpoint()
+                last_checkpoint = time.monotonic()
+            time.sleep(POLL_INTERVAL)
@@ -0,0 +1,121 @@
+import os
+import json
+import math
+import queue
+import threading
+import multiprocessing.queues
+from typing import List, Optional, Tuple, Union
+
+# Nombre de tirages d'un worker entre deux points de la trace par défaut
+TRACE_EVERY = 10_000
+
+# Taille du tampon d'écriture du fichier de trace (octets)
+BUFFER_SIZE = 1 << 20
+
+# Formats de trace disponibles
+TRACE_FORMATS = ("csv", "jsonl")
+
+# Colonnes d'un enregistrement de trace
+TRACE_FIELDS = ("points", "inside", "estimate", "stderr", "worker", "worker_points", "worker_inside")
+
+
+class TraceWriter:
+    """
+    Écrit la trajectoire de convergence d'une exécution : chaque worker note ses
+    compteurs tous les every tirages et envoie ces points de trace par lots (un
+    lot par paquet de tirages) dans une file. Un thread d'écriture dédié vide la
+    file, calcule les compteurs cumulés de tous les workers et écrit les
+    enregistrements (CSV ou JSON lines) dans un fichier tamponné : les workers
+    ne font jamais d'entrée/sortie et rien n'est conservé en mémoire au-delà
+    du dernier point de chaque worker.
+    """
+
+    def __init__(self, path: str, trace_format: Optional[str] = None, every: int = TRACE_EVERY,
+                 append: bool = False, buffer_size: int = BUFFER_SIZE):
+        """
+        Ouvre le fichier de trace
+
+        Args:
+            path (str): Le fichier de trace
+            trace_format (str, optional): "csv" ou "jsonl". Defaults to None (csv
+                si le fichier se termine par .csv, jsonl sinon).
+            every (int): Le nombre de tirages d'un worker entre deux points. Defaults to TRACE_EVERY.
+            append (bool): Complète un fichier existant (reprise) au lieu de l'écraser. Defaults to False.
+            buffer_size (int): La taille du tampon d'écriture. Defaults to BUFFER_SIZE.
+        """
+        if trace_format is None:
+            trace_format = "csv" if path.endswith(".csv") else "jsonl"
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Format de trace inconnu: {trace_format} (choix possibles: {', '.join(TRACE_FORMATS)})")
+        if every < 1:
+            raise ValueError("L'intervalle de trace doit être >= 1")
+        self.path = path
+        self.trace_format = trace_format
+        self.every = every
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self.file = open(path, 'a' if append else 'w', buffering=buffer_size)
+        if trace_format == "csv" and write_header:
+            self.file.write(",".join(TRACE_FIELDS) + "\n")
+        self.thread: Optional[threading.Thread] = None
+        self.queue: Optional[Union[queue.SimpleQueue, multiprocessing.queues.Queue]] = None
+
+    def start(self, trace_queue, workers: List[Tuple[int, int]], scale: float = 4.0) -> None:
+        """
+        Démarre le thread d'écriture
+
+        Args:
+            trace_queue: La file (queue.SimpleQueue ou multiprocessing.Queue) dans
+                laquelle les workers envoient leurs lots de points de trace
+            workers (list): Les compteurs initiaux (total_points, inside_points) de
+                chaque worker, non nuls en cas de reprise
+            scale (float): Le facteur de la région (Region.scale). Defaults to 4.0 (pi).
+        """
+        self.queue = trace_queue
+        self.thread = threading.Thread(target=self._drain, args=(trace_queue, list(workers), scale), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Attend que tous les lots envoyés avant l'appel soient écrits puis arrête
+        le thread d'écriture
+        """
+        if self.thread is not None and self.queue is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+            self.queue = None
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Arrête l'écriture et ferme le fichier
+        """
+        self.stop()
+        self.file.close()
+
+    def _drain(self, trace_queue, workers: List[Tuple[int, int]], scale: float) -> None:
+        latest = workers
+        total_points = sum(total for total, _ in latest)
+        inside_points = sum(inside for _, inside in latest)
+        csv = self.trace_format == "csv"
+        while True:
+            batch = trace_queue.get()
+            if batch is None:
+                break
+            lines = []
+            for worker, worker_points, worker_inside in batch:
+                last_points, last_inside = latest[worker]
+                total_points += worker_points - last_points
+                inside_points += worker_inside - last_inside
+                latest[worker] = (worker_points, worker_inside)
+                ratio = inside_points / total_points
+                estimate = scale * ratio
+                stderr = scale * math.sqrt(ratio * (1.0 - ratio) / total_points)
+                if csv:
+                    lines.append(f"{total_points},{inside_points},{estimate!r},{stderr!r},"
+                                 f"{worker},{worker_points},{worker_inside}\n")
+                else:
+                    lines.append(json.dumps(dict(zip(TRACE_FIELDS, (
+                        total_points, inside_points, estimate, stderr,
+                        worker, worker_points, worker_inside)))) + "\n")
+            self.file.write("".join(lines))
@@ -4,6 +4,7 @@ import time
 
 from hands_on_monte_carlo_simulation.monte_carlo_simulation import MonteCarloSimulation
 from hands_on_monte_carlo_simulation.threading_manager import ThreadingManager
+from hands_on_monte_carlo_simulation.regions import Hypersphere, Integrand
 
 
 def test_monte_carlo_module():
@@ -145,4 +146,1242 @@ def test_performance():
         assert duration < 10, f"Trop lent: {duration:.2f}s"
         assert total == nb_threads * nb_draws
 
-    print("Tests de performance: OK\n")
\ No newline at end of file
+    print("Tests de performance: OK\n")
+
+def test_numpy_engine():
+    """Test du moteur vectorisé numpy"""
+    print("=" * 60)
+    print("TEST 6: Moteur numpy")
+    print("=" * 60)
+
+    import pytest
+    from hands_on_monte_carlo_simulation import monte_carlo_simulation
+    from hands_on_monte_carlo_simulation.monte_carlo_simulation import PointGenerator
+
+    if monte_carlo_simulation.np is None:
+        pytest.skip("numpy n'est pas installé")
+
+    # Blocs plus petits que n pour vérifier le découpage
+    calc = MonteCarloSimulation(seed=42, engine="numpy", block_size=1000)
+    inside = calc.count_inside(10_500)
+    pi_est = MonteCarloSimulation.estimate_pi(10_500, inside)
+    print(f"✓ 10500 points (blocs de 1000): {inside} inside, π≈{pi_est:.4f}")
+    assert 3.0 < pi_est < 3.3, "Estimation de π aberrante"
+
+    # Le résultat ne dépend pas de la taille des blocs
+    calc2 = MonteCarloSimulation(seed=42, engine="numpy", block_size=4096)
+    assert calc2.count_inside(10_500) == inside, "Le découpage en blocs change le résultat"
+
+    total, inside_batch = PointGenerator(seed=42, engine="numpy").generate_batch(10_500)
+    assert (total, inside_batch) == (10_500, inside)
+    print("✓ generate_batch utilise le moteur numpy")
+
+    manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=5000, seed=42, engine="numpy")
+    total, inside = manager.run_parallel()
+    assert total == 10_000 and 0 < inside < total
+
+    print("Moteur numpy: OK\n")
+
+
+def test_numpy_engine_fallback(monkeypatch):
+    """Le moteur python est utilisé si numpy n'est pas disponible"""
+    from hands_on_monte_carlo_simulation import monte_carlo_simulation
+
+    monkeypatch.setattr(monte_carlo_simulation, "np", None)
+    calc = MonteCarloSimulation(seed=42, engine="numpy")
+    assert calc.engine == "python"
+    assert 0 < calc.count_inside(100) <= 100
+
+
+def test_process_backend():
+    """Test du backend processus"""
+    print("=" * 60)
+    print("TEST 7: Backend processus")
+    print("=" * 60)
+
+    from hands_on_monte_carlo_simulation.threading_manager import run_worker_process
+
+    manager = ThreadingManager(nb_threads=3, nb_draws_per_thread=200, seed=7, backend="process")
+    assert manager.resolve_backend() == "process"
+    total, inside = manager.run_parallel()
+    print(f"✓ 3 processus, 200 points chacun: total={total}, inside={inside}")
+    assert total == 600
+    assert len(manager.results) == 3
+
+    # Chaque processus renvoie exactement les compteurs de son worker
+    expected = sum(run_worker_process(i, 200, 7, "python")[1] for i in range(3))
+    assert inside == expected, "Les compteurs des processus ne correspondent pas"
+
+    # auto choisit les threads en mode GUI ou avec un seul worker
+    assert ThreadingManager(4, 10, None, backend="auto").resolve_backend() == "process"
+    assert ThreadingManager(1, 10, None, backend="auto").resolve_backend() == "thread"
+    assert ThreadingManager(4, 10, None, backend="auto").resolve_backend(callback=print) == "thread"
+
+    print("Backend processus: OK\n")
+
+
+def test_worker_streams():
+    """Chaque worker a son propre flux aléatoire dérivé de la graine"""
+    print("=" * 60)
+    print("TEST 8: Flux aléatoires par worker")
+    print("=" * 60)
+
+    from hands_on_monte_carlo_simulation.rng import derive_seed
+
+    assert derive_seed(None, 3) is None
+    assert derive_seed(42, 0) == derive_seed(42, 0)
+    # seed + thread_id faisait partager le flux (42, 1) et (43, 0)
+    assert derive_seed(42, 1) != derive_seed(43, 0)
+
+    # Même graine et même découpage : résultats identiques, quel que soit le backend
+    results = {
+        ThreadingManager(nb_threads=4, nb_draws_per_thread=500, seed=42, backend=backend).run_parallel()
+        for backend in ("thread", "thread", "process")
+    }
+    print(f"✓ Résultats thread/process: {results}")
+    assert len(results) == 1, "Les résultats dépendent de l'ordonnancement"
+
+    # Le générateur global n'est plus modifié par la simulation
+    import random
+    random.seed(0)
+    state = random.getstate()
+    MonteCarloSimulation(seed=1).count_inside(10)
+    assert random.getstate() == state
+
+    print("Flux aléatoires par worker: OK\n")
+
+
+def test_target_precision():
+    """Test du mode précision cible"""
+    print("=" * 60)
+    print("TEST 9: Précision cible")
+    print("=" * 60)
+
+    assert MonteCarloSimulation.standard_error(0, 0) == float("inf")
+    low, high = MonteCarloSimulation.confidence_interval(10_000, 7854)
+    assert low < 3.1416 < high
+
+    target = 0.01
+    for backend in ("thread", "process"):
+        manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=None, seed=1, backend=backend)
+        total, inside = manager.run_until_precision(target, chunk_size=1000)
+        stderr = MonteCarloSimulation.standard_error(total, inside)
+        print(f"✓ {backend}: {total} points, erreur type {stderr:.4f}")
+        assert stderr <= target
+        # L'arrêt intervient tôt : ~27 000 points suffisent pour une erreur type de 0.01
+        assert total < 200_000, "Les workers n'ont pas été arrêtés"
+
+    # La limite de tirages par worker est respectée même si la cible n'est pas atteinte
+    manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=None, seed=1)
+    total, _ = manager.run_until_precision(1e-9, chunk_size=300, max_draws_per_thread=1000)
+    assert total == 2000
+
+    print("Précision cible: OK\n")
+
+
+def test_batch_callback():
+    """Test de la livraison des points par blocs pour le GUI"""
+    print("=" * 60)
+    print("TEST 10: Livraison par blocs")
+    print("=" * 60)
+
+    import threading
+
+    batches = []
+    lock = threading.Lock()
+
+    def batch_callback(xs, ys, inside_flags, inside_count):
+        with lock:
+            batches.append((len(xs), sum(1 for flag in inside_flags if flag), inside_count))
+
+    manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=2500, seed=3)
+    total, inside = manager.run_parallel(batch_callback=batch_callback, batch_size=1000)
+    print(f"✓ {len(batches)} blocs reçus pour {total} points")
+    assert total == 5000
+    assert sorted(size for size, _, _ in batches) == [500, 500, 1000, 1000, 1000, 1000]
+    assert all(flags == count for _, flags, count in batches)
+    assert sum(count for _, _, count in batches) == inside
+
+    # Les blocs consomment le même flux que le comptage seul
+    headless = ThreadingManager(nb_threads=2, nb_draws_per_thread=2500, seed=3).run_parallel()
+    assert headless == (total, inside)
+
+    print("Livraison par blocs: OK\n")
+
+
+def test_ui_batch_callback(monkeypatch):
+    """SimulationUI met à jour ses statistiques par bloc"""
+    import pytest
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pytest.importorskip("pygame")
+    from hands_on_monte_carlo_simulation.Simulation import SimulationUI
+
+    ui = SimulationUI(width=200, height=200, bg_color="white", circle_color="black")
+    try:
+        ui.add_points_callback([0.1, 0.9], [0.1, 0.9], bytearray([1, 0]), 1)
+        assert (ui.total_points, ui.inside_points) == (2, 1)
+        assert sum(len(xs) for xs, _, _ in ui.points_to_draw) == 2
+        ui.update()
+        # Les points dessinés restent sur la surface persistante
+        assert ui.points_to_draw == []
+        assert ui.points_surface.get_at(ui.math_to_screen(0.1, 0.1))[:3] == (0, 255, 0)
+        ui.add_points_callback([0.5], [0.5], bytearray([1]), 1)
+        ui.update()
+        assert ui.points_surface.get_at(ui.math_to_screen(0.1, 0.1))[:3] == (0, 255, 0)
+
+        # Les blocs numpy sont dessinés sans conversion préalable en tuples
+        np = pytest.importorskip("numpy")
+        ui.add_points_callback(np.array([0.9]), np.array([0.9]), np.array([False]), 0)
+        ui.add_point_callback(0.3, 0.2, True)
+        ui.update()
+        assert ui.points_surface.get_at(ui.math_to_screen(0.9, 0.9))[:3] == (255, 0, 0)
+        assert ui.points_surface.get_at(ui.math_to_screen(0.3, 0.2))[:3] == (0, 255, 0)
+        assert (ui.total_points, ui.inside_points) == (5, 3)
+    finally:
+        ui.close()
+
+
+def test_qmc_samplers():
+    """Test des échantillonneurs quasi-Monte Carlo"""
+    print("=" * 60)
+    print("TEST 11: Échantillonneurs Halton / Sobol")
+    print("=" * 60)
+
+    import math
+    import pytest
+    from hands_on_monte_carlo_simulation.samplers import make_sampler
+
+    for name in ("halton", "sobol"):
+        points = list(make_sampler(name, seed=5).points(1000))
+        assert all(0 <= x < 1 and 0 <= y < 1 for x, y in points)
+
+        # Un segment démarrant à un offset prolonge exactement la suite
+        tail = list(make_sampler(name, seed=5, offset=600).points(400))
+        assert tail == points[600:]
+
+        # Les moteurs python et numpy parcourent la même suite
+        from hands_on_monte_carlo_simulation import samplers
+        if samplers.np is None:
+            pytest.skip("numpy n'est pas installé")
+        block = make_sampler(name, seed=5).block(1000)
+        assert [tuple(row) for row in block.tolist()] == points
+
+        # À budget égal, l'erreur QMC est bien plus faible que l'erreur pseudo-aléatoire
+        manager = ThreadingManager(nb_threads=4, nb_draws_per_thread=4096, seed=5, sampler=name)
+        total, inside = manager.run_parallel()
+        error = abs(MonteCarloSimulation.estimate_pi(total, inside) - math.pi)
+        print(f"✓ {name}: erreur {error:.2e} avec {total} points")
+        assert total == 4 * 4096
+        assert error < 5e-3
+
+        # Les workers se partagent des segments disjoints du début de la suite
+        single = ThreadingManager(nb_threads=1, nb_draws_per_thread=4 * 4096, seed=5, sampler=name)
+        assert single.run_parallel() == (total, inside)
+
+    # L'erreur type binomiale ne s'applique pas aux suites QMC : le mode
+    # précision cible les refuse
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=None, seed=5,
+                         sampler="sobol").run_until_precision(0.01)
+
+    print("Échantillonneurs Halton / Sobol: OK\n")
+
+
+def test_benchmark():
+    """Test du module de benchmark"""
+    print("=" * 60)
+    print("TEST 12: Benchmark")
+    print("=" * 60)
+
+    from hands_on_monte_carlo_simulation.benchmark import run_benchmarks, find_regressions
+
+    # La taille de bloc n'est pas balayée pour le moteur python (cas identiques)
+    results = run_benchmarks(["python"], ["thread"], [1, 2], [1000], [1024, 65536],
+                             repeat=2, warmup=1)
+    assert [result["workers"] for result in results] == [1, 2]
+    assert all(result["block_size"] is None for result in results)
+    for result in results:
+        print(f"✓ {result['workers']} worker(s): {result['points_per_sec']:.0f} points/s")
+        assert result["total_points"] == 1000 * result["workers"]
+        assert result["points_per_sec"] > 0 and result["wall_time"] > 0
+
+    # Comparaison à une référence : seul un débit trop faible est signalé
+    faster = [dict(result, points_per_sec=result["points_per_sec"] * 2) for result in results]
+    assert find_regressions(results, results, tolerance=0.1) == []
+    assert len(find_regressions(results, faster, tolerance=0.1)) == 2
+    assert find_regressions(results, faster[:1], tolerance=0.6) == []
+
+    # La sortie standard de la commande bench doit être du JSON pur (pas de bannière pygame)
+    import json
+    import os
+    import subprocess
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    command = ("import sys; from hands_on_monte_carlo_simulation.main import main; "
+               "sys.argv = ['monte-carlo-simulation', 'bench', '--engines', 'python', "
+               "'--draws', '1000', '--repeat', '1', '--warmup', '0', '-v']; main()")
+    completed = subprocess.run([sys.executable, "-c", command], env=env,
+                               capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    report = json.loads(completed.stdout)
+    assert report["results"][0]["total_points"] == 1000
+    assert report["results"][0]["peak_rss_kb"] >= 0
+    print("✓ Sortie JSON de bench valide")
+
+    print("Benchmark: OK\n")
+
+
+def test_checkpoint_resume(tmp_path):
+    """Test de la reprise depuis un fichier de reprise"""
+    print("=" * 60)
+    print("TEST 13: Reprise")
+    print("=" * 60)
+
+    import os
+    import threading
+    import pytest
+    from hands_on_monte_carlo_simulation.checkpoint import load_checkpoint
+
+    path = str(tmp_path / "run.ckpt")
+    cases = [("thread", "python", "random"), ("process", "python", "random"),
+             ("thread", "numpy", "random"), ("thread", "python", "sobol")]
+    for backend, engine, sampler in cases:
+        def make_manager():
+            return ThreadingManager(nb_threads=2, nb_draws_per_thread=100_000, seed=11,
+                                    engine=engine, backend=backend, sampler=sampler)
+
+        expected = make_manager().run_parallel()
+
+        # Exécution interrompue dès le premier fichier de reprise écrit
+        if os.path.exists(path):
+            os.remove(path)
+        interrupted = make_manager()
+        runner = threading.Thread(target=interrupted.run_with_checkpoints, args=(path,),
+                                  kwargs={"checkpoint_interval": 0.001, "chunk_size": 100})
+        runner.start()
+        while not os.path.exists(path) and runner.is_alive():
+            time.sleep(0.001)
+        interrupted.stop()
+        runner.join()
+        checkpoint = load_checkpoint(path)
+        done = sum(worker["total_points"] for worker in checkpoint["workers"])
+        assert done < 200_000, "L'exécution n'a pas été interrompue"
+
+        resumed = make_manager().run_with_checkpoints(path, chunk_size=700, resume=checkpoint)
+        print(f"✓ {backend}/{engine}/{sampler}: reprise après {done} points {resumed}, "
+              f"sans interruption {expected}")
+        assert resumed == expected, "La reprise ne donne pas les mêmes compteurs"
+        assert sum(worker["total_points"] for worker in load_checkpoint(path)["workers"]) == 200_000
+
+        # Avec l'intervalle par défaut, seul le fichier final est écrit
+        os.remove(path)
+        assert make_manager().run_with_checkpoints(path, chunk_size=1000) == expected
+        assert sum(worker["total_points"] for worker in load_checkpoint(path)["workers"]) == 200_000
+
+    # Une configuration différente de celle du fichier est refusée
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=3, nb_draws_per_thread=100_000, seed=11).run_with_checkpoints(
+            path, resume=load_checkpoint(path))
+
+    print("Reprise: OK\n")
+
+
+def test_distributed():
+    """Test du coordinateur et des workers TCP"""
+    print("=" * 60)
+    print("TEST 14: Exécution répartie")
+    print("=" * 60)
+
+    import os
+    import socket
+    import subprocess
+    import threading
+    from hands_on_monte_carlo_simulation.distributed import (Coordinator, send_message,
+                                                             receive_message)
+    from hands_on_monte_carlo_simulation.threading_manager import make_worker_generator
+
+    total_draws, shard_size = 50_000, 4_000
+    coordinator = Coordinator(total_draws, shard_size=shard_size, seed=5)
+    host, port = coordinator.address
+    results = []
+    runner = threading.Thread(target=lambda: results.append(coordinator.run()))
+    runner.start()
+
+    # Un worker défaillant prend un shard puis se déconnecte sans rendre de résultat
+    with socket.create_connection((host, port)) as faulty, faulty.makefile("rwb") as stream:
+        send_message(stream, {"type": "ready"})
+        lost_shard = receive_message(stream)
+        assert lost_shard["type"] == "shard"
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    command = ("import sys; from hands_on_monte_carlo_simulation.main import main; "
+               f"sys.argv = ['monte-carlo-simulation', 'worker', '--connect', '{host}:{port}']; main()")
+    workers = [subprocess.Popen([sys.executable, "-c", command], env=env) for _ in range(3)]
+    for worker in workers:
+        assert worker.wait(timeout=120) == 0
+    runner.join(timeout=30)
+
+    # Le résultat ne dépend ni du nombre de workers ni de la réattribution
+    expected_inside = sum(
+        make_worker_generator(shard_id, 5, "python", segment_size=shard_size)
+        .generate_batch(min(shard_size, total_draws - shard_id * shard_size))[1]
+        for shard_id in range(-(-total_draws // shard_size)))
+    assert results == [(total_draws, expected_inside)]
+    assert coordinator.reassigned == 1
+    print(f"✓ {total_draws} points fusionnés, shard {lost_shard['shard_id']} réattribué")
+
+    # Combinaison invalide refusée avant l'écoute, pas à l'échec d'un worker
+    try:
+        Coordinator(1000, sampler="sobol", region="hypersphere", dimension=3)
+        assert False, "Sobol en dimension 3 accepté"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    print("Exécution répartie: OK\n")
+
+
+def test_telemetry():
+    """Test de la télémétrie en cours d'exécution"""
+    print("=" * 60)
+    print("TEST 15: Télémétrie")
+    print("=" * 60)
+
+    import io
+    import json
+    import urllib.request
+    from hands_on_monte_carlo_simulation.telemetry import Telemetry
+
+    expected = ThreadingManager(nb_threads=2, nb_draws_per_thread=300_000, seed=3).run_parallel()
+    for backend in ("thread", "process"):
+        stream = io.StringIO()
+        telemetry = Telemetry(stream, interval=0.0, metrics_port=0)
+        try:
+            manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=300_000, seed=3,
+                                       backend=backend, telemetry=telemetry)
+            # Les compteurs sont publiés par paquets sans changer le résultat
+            assert manager.run_parallel() == expected
+
+            samples = [json.loads(line) for line in stream.getvalue().splitlines()]
+            assert len(samples) >= 2, "Aucun échantillon intermédiaire"
+            totals = [sample["total_points"] for sample in samples]
+            assert totals == sorted(totals)
+            last = samples[-1]
+            assert (last["total_points"], last["inside_points"]) == expected
+            assert last["progress"] == 1.0 and last["eta_seconds"] == 0.0
+            assert [worker["total_points"] for worker in last["workers"]] == [300_000, 300_000]
+
+            host, port = telemetry.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                metrics = response.read().decode()
+            assert f"monte_carlo_points_total {expected[0]}" in metrics
+            assert 'monte_carlo_worker_points_total{worker="1"} 300000' in metrics
+        finally:
+            telemetry.close()
+        print(f"✓ {backend}: {len(samples)} échantillons, endpoint Prometheus OK")
+
+    # Les compteurs sont publiés tous les chunk_size tirages configurés
+    stream = io.StringIO()
+    telemetry = Telemetry(stream, interval=0.0)
+    try:
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=200_000, seed=3, chunk_size=20_000,
+                         telemetry=telemetry).run_parallel()
+    finally:
+        telemetry.close()
+    totals = {json.loads(line)["total_points"] for line in stream.getvalue().splitlines()}
+    assert all(total % 20_000 == 0 for total in totals) and totals - {0, 100_000, 200_000}
+
+    print("Télémétrie: OK\n")
+
+
+class Parabola(Integrand):
+    """Intégrale de x² sur [0, 1] (plugin de test, vaut 1/3)"""
+
+    def evaluate(self, xs):
+        return xs[:, 0] ** 2
+
+    def count_points(self, points):
+        return sum(1 for x, y in points if y <= x * x)
+
+
+class Octant(Hypersphere):
+    """Boule unité de dimension 3 (plugin de test dérivé d'une région intégrée)"""
+
+    def __init__(self, dimension: int = 3):
+        super().__init__(dimension)
+
+
+def test_regions():
+    """Test des régions et des intégrandes"""
+    print("=" * 60)
+    print("TEST 16: Régions")
+    print("=" * 60)
+
+    import math
+    import pytest
+    from hands_on_monte_carlo_simulation.regions import make_region, Hypersphere
+    from hands_on_monte_carlo_simulation.monte_carlo_simulation import np
+
+    # Le quadrant par défaut est l'hypersphère de dimension 2
+    quadrant = make_region()
+    assert (quadrant.dimension, quadrant.scale, quadrant.exact) == (2, 4.0, math.pi)
+    assert abs(Hypersphere(3).exact - 4 / 3 * math.pi) < 1e-12
+
+    # Même backend, même rapport : seule la région change
+    for region, dimension in (("hypersphere", 3), ("hypersphere", 5), ("test_monte_carlo:Parabola", None)):
+        for backend in ("thread", "process"):
+            manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=50_000, seed=8,
+                                       backend=backend, region=region, dimension=dimension)
+            total, inside = manager.run_parallel()
+            estimate = MonteCarloSimulation.estimate_pi(total, inside, manager.region.scale)
+            stderr = MonteCarloSimulation.standard_error(total, inside, manager.region.scale)
+            exact = manager.region.exact if manager.region.exact is not None else 1 / 3
+            assert abs(estimate - exact) < 5 * stderr, f"{region}: {estimate} au lieu de {exact}"
+        print(f"✓ {manager.region.label} ({manager.region.name}, d={manager.region.dimension}): {estimate:.4f}")
+
+    # Les suites quasi-aléatoires suivent la dimension de la région
+    manager = ThreadingManager(nb_threads=1, nb_draws_per_thread=20_000, seed=8, sampler="halton",
+                               region="hypersphere", dimension=4)
+    total, inside = manager.run_parallel()
+    assert abs(MonteCarloSimulation.estimate_pi(total, inside, 16.0) - manager.region.exact) < 0.05
+
+    with pytest.raises(ValueError):
+        make_region("quadrant", 3)
+    with pytest.raises(ValueError):
+        make_region("inconnue")
+
+    # Une région intégrée garde son nom court, un plugin qui en dérive son chemin
+    assert (make_region().name, make_region("hypersphere", 4).name) == ("quadrant", "hypersphere")
+    octant = make_region("test_monte_carlo:Octant")
+    assert octant.name == "test_monte_carlo:Octant"
+    assert type(make_region(octant.name)) is Octant
+
+    if np is not None:
+        # Mêmes points (suite de Halton), même comptage par lot python et par bloc numpy
+        counts = [ThreadingManager(nb_threads=2, nb_draws_per_thread=30_000, seed=2, engine=engine,
+                                   sampler="halton", region="hypersphere", dimension=4).run_parallel()
+                  for engine in ("python", "numpy")]
+        assert counts[0] == counts[1]
+        print("✓ Moteurs python et numpy identiques")
+
+    print("Régions: OK\n")
+
+
+def test_trace(tmp_path):
+    """Test de la trace de convergence"""
+    print("=" * 60)
+    print("TEST 17: Trace de convergence")
+    print("=" * 60)
+
+    import csv
+    import json
+    from hands_on_monte_carlo_simulation.tracing import TraceWriter
+
+    expected = ThreadingManager(nb_threads=2, nb_draws_per_thread=25_500, seed=6).run_parallel()
+    worker_traces = []
+    for backend, trace_format in (("thread", "csv"), ("process", "jsonl")):
+        path = str(tmp_path / f"trace.{trace_format}")
+        trace = TraceWriter(path, every=1000)
+        try:
+            manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=25_500, seed=6,
+                                       backend=backend, trace=trace)
+            assert manager.run_parallel() == expected
+        finally:
+            trace.close()
+
+        with open(path) as f:
+            if trace_format == "csv":
+                records = [{key: float(value) for key, value in row.items()} for row in csv.DictReader(f)]
+            else:
+                records = [json.loads(line) for line in f]
+        # 25 points par worker aux multiples de 1000, plus les compteurs finaux
+        assert len(records) == 2 * 26
+        points = [record["points"] for record in records]
+        assert points == sorted(points) and points[-1] == 51_000
+        assert (records[-1]["points"], records[-1]["inside"]) == expected
+        assert abs(records[-1]["estimate"] - MonteCarloSimulation.estimate_pi(*expected)) < 1e-12
+        # La trajectoire de chaque worker ne dépend pas du backend
+        worker_traces.append(sorted((record["worker"], record["worker_points"], record["worker_inside"])
+                                    for record in records))
+        print(f"✓ {backend} ({trace_format}): {len(records)} points de trace")
+    assert worker_traces[0] == worker_traces[1]
+
+    print("Trace de convergence: OK\n")
+
+
+def test_async_api():
+    """Test de l'API asyncio"""
+    print("=" * 60)
+    print("TEST 18: API asyncio")
+    print("=" * 60)
+
+    import asyncio
+    import pytest
+    from hands_on_monte_carlo_simulation.async_api import SimulationPool, estimate_pi_async
+    from hands_on_monte_carlo_simulation.distributed import compute_shard
+
+    shard = {"seed": 8, "engine": "python", "sampler": "random", "segment_size": 50_000,
+             "region": "quadrant", "dimension": 2}
+    expected = [compute_shard(dict(shard, shard_id=i, draws=50_000 if i < 3 else 20_000)) for i in range(4)]
+    expected = (sum(t for t, _ in expected), sum(i for _, i in expected))
+
+    async def scenario(pool):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticking = asyncio.create_task(ticker())
+        # Requêtes concurrentes sur un pool de 2 processus : résultats indépendants de l'ordonnancement
+        results = await asyncio.gather(*(estimate_pi_async(170_000, pool=pool, seed=8, shard_size=50_000)
+                                         for _ in range(3)))
+        for result in results:
+            assert (result.total_points, result.inside_points) == expected and result.done
+        assert ticks > 0, "La boucle ne doit pas être bloquée par les tirages"
+        print(f"✓ 3 requêtes concurrentes identiques ({results[0]})")
+
+        progress = [p async for p in pool.stream(170_000, seed=8, shard_size=50_000)]
+        assert len(progress) == 4 and progress[-1].progress == 1.0
+        assert [p.total_points for p in progress] == sorted(p.total_points for p in progress)
+
+        # Annulation : le pool est libéré dès que les shards en cours se terminent
+        task = asyncio.create_task(pool.estimate(10 ** 12, seed=1, shard_size=20_000))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        start = time.perf_counter()
+        result = await pool.estimate(40_000, seed=1, shard_size=20_000)
+        assert result.total_points == 40_000
+        assert time.perf_counter() - start < 5
+        print(f"✓ Annulation prise en compte en {time.perf_counter() - start:.2f}s")
+
+        result = await pool.estimate(None, target_stderr=0.01, shard_size=20_000)
+        assert result.stderr <= 0.01
+        with pytest.raises(ValueError):
+            await pool.estimate(0)
+        ticking.cancel()
+
+        # Un seul processus : chaque attente vide les shards en cours, il en reste à soumettre
+        single = SimulationPool(max_workers=1)
+        try:
+            result = await single.estimate(170_000, seed=8, shard_size=50_000)
+            assert (result.total_points, result.inside_points) == expected
+        finally:
+            single.shutdown()
+
+    pool = SimulationPool(max_workers=2)
+    try:
+        asyncio.run(scenario(pool))
+    finally:
+        pool.shutdown()
+
+    print("API asyncio: OK\n")
+
+
+def test_scheduled_chunks():
+    """Test de la répartition dynamique des paquets"""
+    print("=" * 60)
+    print("TEST 19: Budget total réparti par paquets")
+    print("=" * 60)
+
+    from hands_on_monte_carlo_simulation.telemetry import Telemetry
+    from hands_on_monte_carlo_simulation.threading_manager import make_worker_generator
+
+    # Le générateur d'un paquet ne dépend que de son indice
+    chunks = [make_worker_generator(i, 4, "python", segment_size=40_000).generate_batch(
+        40_000 if i < 6 else 10_000) for i in range(7)]
+    expected = (sum(t for t, _ in chunks), sum(i for _, i in chunks))
+    assert expected[0] == 250_000
+
+    for backend, nb_threads in (("thread", 1), ("thread", 3), ("process", 2)):
+        telemetry = Telemetry()
+        manager = ThreadingManager(nb_threads=nb_threads, nb_draws_per_thread=1, seed=4, backend=backend,
+                                   total_draws=250_000, chunk_size=40_000, telemetry=telemetry)
+        assert manager.run_parallel() == expected
+        assert sum(result.total_points for result in manager.results) == 250_000
+        assert telemetry.latest["total_points"] == 250_000 and telemetry.latest["progress"] == 1.0
+        print(f"✓ {backend} x{nb_threads}: {[result.total_points for result in manager.results]}")
+
+    # Quasi-Monte Carlo : les paquets couvrent des segments contigus de la suite
+    halton = [ThreadingManager(nb_threads=n, nb_draws_per_thread=1, seed=4, sampler="halton",
+                               total_draws=100_000, chunk_size=30_000).run_parallel() for n in (1, 4)]
+    assert halton[0] == halton[1]
+
+    # Budget total en ligne de commande
+    import os
+    import subprocess
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    command = ("import sys; from hands_on_monte_carlo_simulation.main import main; "
+               "sys.argv = ['monte-carlo-simulation', '--total-draws', '250000', '--chunk-size', '40000', "
+               "'-n', '3', '-s', '4']; main()")
+    output = subprocess.run([sys.executable, "-c", command], env=env, capture_output=True, text=True,
+                            timeout=60, check=True).stdout
+    assert output.strip() == f"π ≈ {MonteCarloSimulation.estimate_pi(*expected):.10f}"
+
+    # Le mode précision cible n'a pas de budget total : combinaison refusée
+    import pytest
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=2, nb_draws_per_thread=1, seed=1, total_draws=1000,
+                         chunk_size=100).run_until_precision(0.001)
+    command = ("import sys; from hands_on_monte_carlo_simulation.main import main; "
+               "sys.argv = ['monte-carlo-simulation', '--total-draws', '1000', '--chunk-size', '100', "
+               "'--target-stderr', '0.001', '-s', '1', '-n', '2']; main()")
+    completed = subprocess.run([sys.executable, "-c", command], env=env, capture_output=True, text=True,
+                               timeout=60)
+    assert completed.returncode == 1 and "--total-draws" in completed.stderr
+
+    print("Budget total réparti par paquets: OK\n")
+
+
+def test_integer_engine():
+    """Test du moteur entier"""
+    print("=" * 60)
+    print("TEST 20: Moteur integer")
+    print("=" * 60)
+
+    import pytest
+    from hands_on_monte_carlo_simulation.monte_carlo_simulation import (
+        np, count_lattice_in_quadrant, INTEGER_BITS, INTEGER_RADIUS)
+    if np is None:
+        pytest.skip("numpy n'est pas installé")
+
+    def pack(x, y):
+        return (x << (64 - INTEGER_BITS)) | (y << 1)
+
+    # Points de part et d'autre du cercle, à moins de 2^-53 de celui-ci
+    r = INTEGER_RADIUS
+    cases = [(r - 1, 65535, True), (r - 1, 65536, False), (0, r - 1, True), (r - 1, r - 1, False)]
+    raw = np.array([pack(x, y) for x, y, _ in cases], dtype=np.uint64)
+    for (x, y, inside), value in zip(cases, raw):
+        assert count_lattice_in_quadrant(np.array([value])) == inside
+        assert (x * x + y * y <= r * r) == inside
+    # Le test en flottants se trompe sur le point juste à l'extérieur
+    assert MonteCarloSimulation.is_in_quadrant((r - 1) / r, 65536 / r)
+    print("✓ Test entier exact aux abords du cercle")
+
+    # Même comptage que l'arithmétique entière exacte de Python sur un bloc aléatoire
+    raw = np.random.default_rng(3).bit_generator.random_raw(100_000)
+    expected = sum(1 for v in raw.tolist()
+                   if (v >> 33) ** 2 + ((v >> 1) & (r - 1)) ** 2 <= r * r)
+    assert count_lattice_in_quadrant(raw.copy()) == expected
+
+    counts = [ThreadingManager(nb_threads=2, nb_draws_per_thread=200_000, seed=5, engine="integer",
+                               backend=backend).run_parallel() for backend in ("thread", "process")]
+    assert counts[0] == counts[1]
+    assert abs(MonteCarloSimulation.estimate_pi(*counts[0]) - 3.14159) < 0.02
+    print(f"✓ π ≈ {MonteCarloSimulation.estimate_pi(*counts[0]):.6f}")
+
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=10, seed=1, engine="integer",
+                         sampler="halton").run_parallel()
+
+    print("Moteur integer: OK\n")
+
+
+def test_point_rings(monkeypatch):
+    """Test des tampons partagés entre workers processus et GUI"""
+    print("=" * 60)
+    print("TEST 21: Tampons de points en mémoire partagée")
+    print("=" * 60)
+
+    import pytest
+    from array import array
+    from hands_on_monte_carlo_simulation.point_ring import PointRing
+
+    ring = PointRing(capacity=8)
+    try:
+        ring.write(array('d', [0.1, 0.2, 0.3]), array('d', [0.4, 0.5, 0.6]), bytearray([1, 1, 0]), 2)
+        blocks, new_points, new_inside = ring.read()
+        assert (new_points, new_inside) == (3, 2)
+        assert [list(xs) for xs, _, _ in blocks] == [[0.1, 0.2, 0.3]]
+        blocks = None
+        # Tour complet du tampon : seuls les capacity derniers points restent lisibles
+        ring.write(array('d', range(10)), array('d', range(10)), bytearray(10), 0)
+        blocks, new_points, _ = ring.read()
+        assert new_points == 10
+        assert [x for xs, _, _ in blocks for x in xs] == [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+        blocks = None
+        assert ring.read() == ([], 0, 0)
+    finally:
+        ring.close(unlink=True)
+
+    # Workers processus : mêmes points que les threads, lus dans les tampons
+    expected = ThreadingManager(nb_threads=2, nb_draws_per_thread=5000, seed=3).run_parallel(
+        batch_callback=lambda *args: None)
+    rings = [PointRing(capacity=1 << 13) for _ in range(2)]
+    try:
+        manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=5000, seed=3, backend="process")
+        assert manager.run_parallel(rings=rings, batch_size=700) == expected
+        reads = [ring.read() for ring in rings]
+        assert (sum(r[1] for r in reads), sum(r[2] for r in reads)) == expected
+        inside = sum(sum(flags) for blocks, _, _ in reads for _, _, flags in blocks)
+        # Les tampons sont assez grands pour conserver tous les points
+        assert inside == expected[1]
+        reads = None
+        print(f"✓ {expected[0]} points lus dans les tampons ({inside} dans le quadrant)")
+
+        # Le GUI lit les tampons à chaque frame
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        pytest.importorskip("pygame")
+        from hands_on_monte_carlo_simulation.Simulation import SimulationUI
+        for ring in rings:
+            ring.read_points = ring.read_inside = 0
+        ui = SimulationUI(width=200, height=200, bg_color="white", circle_color="black")
+        try:
+            for ring in rings:
+                ui.add_ring(ring)
+            ui.update()
+            assert (ui.total_points, ui.inside_points) == expected
+        finally:
+            ui.close()
+    finally:
+        for ring in rings:
+            ring.close(unlink=True)
+
+    print("Tampons de points en mémoire partagée: OK\n")
+
+
+def test_point_block():
+    """Test des blocs de points en colonnes"""
+    print("=" * 60)
+    print("TEST 22: Blocs de points en colonnes")
+    print("=" * 60)
+
+    import tracemalloc
+    from hands_on_monte_carlo_simulation.monte_carlo_simulation import PointBlock
+
+    block, inside = MonteCarloSimulation(seed=42).generate_point(1000)
+    assert isinstance(block, PointBlock) and len(block) == 1000
+    assert inside == sum(1 for _, _, is_inside in block if is_inside)
+    x, y, is_inside = block[10]
+    assert is_inside == MonteCarloSimulation.is_in_quadrant(x, y)
+    assert block[10:20] == list(block)[10:20] and len(block[10:20]) == 10
+    # Mêmes points, dans le même ordre, que le tirage point par point
+    sampler_points = list(MonteCarloSimulation(seed=42).sampler.points(1000))
+    assert [(x, y) for x, y, _ in block] == sampler_points
+
+    # Au moins 5 fois moins de mémoire qu'une liste de tuples
+    tracemalloc.start()
+    block, _ = MonteCarloSimulation(seed=1).generate_point(100_000)
+    columnar = tracemalloc.get_traced_memory()[0]
+    tuples = list(block)
+    as_tuples = tracemalloc.get_traced_memory()[0] - columnar
+    tracemalloc.stop()
+    assert columnar < as_tuples / 5
+    print(f"✓ {columnar / 100_000:.1f} octets/point en colonnes, {as_tuples / 100_000:.1f} en tuples")
+    del tuples
+
+    # Le mode GUI point par point reçoit toujours des tuples (x, y, is_inside)
+    received = []
+    total = ThreadingManager(nb_threads=1, nb_draws_per_thread=2500, seed=7).run_parallel(
+        callback=lambda x, y, is_inside: received.append(is_inside))
+    assert total == (2500, sum(received))
+
+    print("Blocs de points en colonnes: OK\n")
+
+
+def test_headless_startup():
+    """Test du démarrage sans GUI"""
+    print("=" * 60)
+    print("TEST 23: Démarrage sans GUI")
+    print("=" * 60)
+
+    import os
+    import subprocess
+    from hands_on_monte_carlo_simulation.benchmark import measure_startup
+
+    # Une exécution CLI ne doit charger ni pygame ni le code du GUI
+    startup = measure_startup(repeat=1)
+    assert startup["gui_modules"] == []
+    assert startup["import_time"] <= startup["wall_time"]
+    print(f"✓ Démarrage en {startup['wall_time']:.3f}s, sans pygame")
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    for module in ("hands_on_monte_carlo_simulation", "hands_on_monte_carlo_simulation.main"):
+        completed = subprocess.run([sys.executable, "-m", module, "-N", "100", "-s", "1"], env=env,
+                                   capture_output=True, text=True, timeout=60)
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.startswith("π ≈ ") and "pygame" not in completed.stdout
+    print("✓ python -m lance le CLI")
+
+    print("Démarrage sans GUI: OK\n")
+
+
+def test_result_cache(tmp_path):
+    """Test du cache de résultats"""
+    print("=" * 60)
+    print("TEST 24: Cache de résultats")
+    print("=" * 60)
+
+    import os
+    from hands_on_monte_carlo_simulation.result_cache import ResultCache
+
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    def cached(**kwargs):
+        manager = ThreadingManager(seed=9, **kwargs)
+        return manager.run_cached(cache), manager.cache_stats
+
+    # Découpage par worker : le flux de chaque worker est poursuivi
+    for backend in ("thread", "process"):
+        fresh = ThreadingManager(nb_threads=2, nb_draws_per_thread=30_000, seed=9).run_parallel()
+        assert cached(nb_threads=2, nb_draws_per_thread=30_000, backend=backend)[0] == fresh
+        result, stats = cached(nb_threads=2, nb_draws_per_thread=30_000, backend=backend)
+        assert result == fresh and stats == {"hits": 2, "extended": 0, "computed": 0}
+        fresh = ThreadingManager(nb_threads=3, nb_draws_per_thread=45_000, seed=9).run_parallel()
+        result, stats = cached(nb_threads=3, nb_draws_per_thread=45_000, backend=backend)
+        assert result == fresh and stats == {"hits": 0, "extended": 2, "computed": 1}
+        # Moins de tirages que l'entrée : recalcul, sans perdre les shards plus longs
+        fresh = ThreadingManager(nb_threads=1, nb_draws_per_thread=10_000, seed=9).run_parallel()
+        assert cached(nb_threads=1, nb_draws_per_thread=10_000, backend=backend)[0] == fresh
+        for entry in os.listdir(tmp_path / "cache"):
+            os.unlink(tmp_path / "cache" / entry)
+    print("✓ Découpage par worker: relecture et prolongation exactes")
+
+    # Budget total par paquets : seul le dernier paquet partiel est prolongé
+    for sampler in ("random", "halton"):
+        result, stats = cached(nb_threads=2, nb_draws_per_thread=1, total_draws=250_000, chunk_size=100_000,
+                               sampler=sampler)
+        assert stats["computed"] == 3
+        fresh = ThreadingManager(nb_threads=2, nb_draws_per_thread=1, seed=9, total_draws=420_000,
+                                 chunk_size=100_000, sampler=sampler).run_parallel()
+        result, stats = cached(nb_threads=4, nb_draws_per_thread=1, total_draws=420_000, chunk_size=100_000,
+                               sampler=sampler)
+        assert result == fresh and stats == {"hits": 2, "extended": 1, "computed": 2}
+    print("✓ Budget total: seuls les nouveaux tirages sont calculés")
+
+    # Éviction LRU : la dernière entrée écrite est conservée
+    small = ResultCache(str(tmp_path / "small"), max_bytes=1)
+    for seed in range(3):
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=100, seed=seed).run_cached(small)
+    assert len(os.listdir(tmp_path / "small")) == 1
+
+    print("Cache de résultats: OK\n")
+
+
+def test_free_threading(monkeypatch):
+    """Test du mode sans GIL"""
+    print("=" * 60)
+    print("TEST 25: Interpréteur sans GIL")
+    print("=" * 60)
+
+    from hands_on_monte_carlo_simulation import threading_manager
+    from hands_on_monte_carlo_simulation.benchmark import scaling_summary
+
+    print(f"GIL actif: {threading_manager.gil_enabled()}")
+    manager = ThreadingManager(nb_threads=4, nb_draws_per_thread=1000, seed=1, backend="auto")
+    monkeypatch.setattr(threading_manager, "gil_enabled", lambda: False)
+    assert manager.resolve_backend() == "thread"
+    monkeypatch.setattr(threading_manager, "gil_enabled", lambda: True)
+    assert manager.resolve_backend() == "process"
+
+    # Aucun état aléatoire partagé entre les workers (la région, sans état, peut l'être)
+    generators = [threading_manager.make_worker_generator(i, 1, "python", region=manager.region)
+                  for i in range(2)]
+    assert generators[0].calculator.sampler.rng is not generators[1].calculator.sampler.rng
+
+    case = {"engine": "python", "backend": "thread", "draws": 100, "block_size": None}
+    summary = scaling_summary([dict(case, workers=1, points_per_sec=100.0),
+                               dict(case, workers=4, points_per_sec=360.0)])
+    assert len(summary) == 1 and summary[0]["speedup"] == 3.6 and summary[0]["efficiency"] == 0.9
+
+    print("Interpréteur sans GIL: OK\n")
+
+
+def test_philox_sampler():
+    """Test du générateur à compteur Philox"""
+    print("=" * 60)
+    print("TEST 26: Générateur à compteur Philox")
+    print("=" * 60)
+
+    import pytest
+    from hands_on_monte_carlo_simulation import samplers
+    from hands_on_monte_carlo_simulation.samplers import make_sampler, philox4x64, philox_round_keys
+
+    # Vecteur de test de référence de Random123 (compteur et clé nuls)
+    assert philox4x64(0, philox_round_keys((0, 0))) == (0x16554D9ECA36314C, 0xDB20FE9D672D0FDC,
+                                                        0xD7E772CEE186176B, 0x7E68B68AEC7BA23B)
+
+    points = list(make_sampler("philox", seed=5).points(1001))
+    assert all(0 <= x < 1 and 0 <= y < 1 for x, y in points)
+    # Accès direct à n'importe quel offset, y compris très loin dans le flux
+    assert list(make_sampler("philox", seed=5, offset=601).points(400)) == points[601:]
+    assert list(make_sampler("philox", seed=6).points(10)) != points[:10]
+    far = make_sampler("philox", seed=5, offset=1 << 60)
+    assert list(far.points(3))[1:] == list(make_sampler("philox", seed=5, offset=(1 << 60) + 1).points(2))
+    assert far.get_state() == {"index": (1 << 60) + 3}
+
+    # Le résultat ne dépend pas du découpage entre workers
+    results = [ThreadingManager(nb_threads=n, nb_draws_per_thread=12_000 // n, seed=3,
+                                sampler="philox").run_parallel() for n in (1, 3, 4)]
+    assert results[0] == results[1] == results[2]
+    scheduled = [ThreadingManager(nb_threads=n, nb_draws_per_thread=1, seed=3, sampler="philox",
+                                  total_draws=12_000, chunk_size=2_500).run_parallel() for n in (1, 4)]
+    assert scheduled == [results[0], results[0]]
+    print(f"✓ Même résultat avec 1, 3 ou 4 workers: {results[0]}")
+
+    # Pseudo-aléatoire : le mode précision cible l'accepte
+    total, inside = ThreadingManager(nb_threads=2, nb_draws_per_thread=None, seed=3,
+                                     sampler="philox").run_until_precision(0.02)
+    assert MonteCarloSimulation.standard_error(total, inside) <= 0.02
+
+    # Les moteurs python et numpy parcourent le même flux, quelle que soit la dimension
+    if samplers.np is None:
+        pytest.skip("numpy n'est pas installé")
+    for dimension, offset in ((2, 0), (2, 7), (3, 5)):
+        python_points = list(make_sampler("philox", 5, offset, dimension).points(101))
+        block = make_sampler("philox", 5, offset, dimension).block(101)
+        assert [tuple(row) for row in block.tolist()] == python_points
+    numpy_results = [ThreadingManager(nb_threads=n, nb_draws_per_thread=12_000 // n, seed=3, engine="numpy",
+                                      block_size=1000, sampler="philox").run_parallel() for n in (1, 4)]
+    assert numpy_results == [results[0], results[0]]
+
+    print("Générateur à compteur Philox: OK\n")
+
+
+def test_estimators():
+    """Test des estimateurs à variance réduite"""
+    print("=" * 60)
+    print("TEST 27: Estimateurs à variance réduite")
+    print("=" * 60)
+
+    import math
+    import pytest
+    from hands_on_monte_carlo_simulation import samplers
+    from hands_on_monte_carlo_simulation.estimators import ESTIMATORS, make_estimator
+
+    # hit-or-miss redonne exactement les compteurs de run_parallel
+    manager = ThreadingManager(nb_threads=2, nb_draws_per_thread=20_000, seed=3)
+    total, inside = manager.run_parallel()
+    estimator = manager.run_estimator("hit-or-miss")
+    assert (estimator.draws, estimator.inside) == (total, inside)
+    assert estimator.standard_error() == MonteCarloSimulation.standard_error(total, inside)
+
+    # Chaque estimateur est sans biais à son erreur type près, et réduit la variance par tirage
+    variances = {}
+    for name in ESTIMATORS:
+        estimator = manager.run_estimator(name)
+        assert estimator.draws == 40_000
+        assert abs(estimator.estimate() - math.pi) < 5 * estimator.standard_error()
+        variances[name] = estimator.variance_per_draw()
+        print(f"✓ {name}: {estimator.estimate():.6f} ± {estimator.standard_error():.2e}, "
+              f"variance par tirage {variances[name]:.4f}")
+    assert variances["control-variate"] < variances["stratified"] < variances["antithetic"] \
+        < variances["hit-or-miss"]
+    assert variances["control-variate"] < variances["hit-or-miss"] / 50
+    estimator = manager.run_estimator("control-variate")
+    assert estimator.draws_for_stderr(estimator.standard_error() / 2) == \
+        pytest.approx(4 * estimator.draws, rel=1e-6)
+
+    # La fusion des workers équivaut à un seul worker sur le même flux (philox)
+    for name in ("hit-or-miss", "antithetic", "control-variate"):
+        split = ThreadingManager(nb_threads=4, nb_draws_per_thread=5_000, seed=3,
+                                 sampler="philox").run_estimator(name)
+        single = ThreadingManager(nb_threads=1, nb_draws_per_thread=20_000, seed=3,
+                                  sampler="philox").run_estimator(name)
+        assert split.estimate() == pytest.approx(single.estimate(), rel=1e-12)
+
+    # L'erreur type empirique n'a de sens que pour des points indépendants, et
+    # les estimateurs sont propres au quadrant
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=100, seed=3, sampler="halton").run_estimator("stratified")
+    with pytest.raises(ValueError):
+        ThreadingManager(nb_threads=1, nb_draws_per_thread=100, seed=3,
+                         region="hypersphere").run_estimator("antithetic")
+    with pytest.raises(ValueError):
+        make_estimator("importance")
+
+    # Les moteurs python et numpy donnent les mêmes statistiques sur les mêmes points
+    if samplers.np is None:
+        pytest.skip("numpy n'est pas installé")
+    for name in ESTIMATORS:
+        results = [ThreadingManager(nb_threads=2, nb_draws_per_thread=10_000, seed=3, sampler="philox",
+                                    engine=engine, block_size=3000).run_estimator(name)
+                   for engine in ("python", "numpy")]
+        assert results[0].draws == results[1].draws
+        assert results[0].estimate() == pytest.approx(results[1].estimate(), rel=1e-12)
+        assert results[0].standard_error() == pytest.approx(results[1].standard_error(), rel=1e-6)
+
+    print("Estimateurs à variance réduite: OK\n")
+
+
+def test_serve_mode(tmp_path):
+    """Test du service d'estimation"""
+    print("=" * 60)
+    print("TEST 28: Service d'estimation")
+    print("=" * 60)
+
+    import json
+    import socket
+    import threading
+    import http.client
+    from hands_on_monte_carlo_simulation.distributed import compute_shard
+    from hands_on_monte_carlo_simulation.server import EstimationService, make_server
+
+    service = EstimationService(workers=2, backend="thread", shard_size=50_000, batch_draws=50_000)
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+    def request(method, path, body=None):
+        connection.request(method, path, json.dumps(body) if body is not None else None)
+        response = connection.getresponse()
+        return response.status, response.read()
+
+    try:
+        # À graine fixée, le résultat est celui des shards du coordinateur réparti
+        status, body = request("POST", "/estimate", {"draws": 120_000, "seed": 3})
+        response = json.loads(body)
+        shards = [compute_shard({"shard_id": i, "draws": draws, "seed": 3, "engine": "python",
+                                 "sampler": "random", "segment_size": 50_000, "region": "quadrant",
+                                 "dimension": None})
+                  for i, draws in enumerate((50_000, 50_000, 20_000))]
+        assert status == 200
+        assert (response["total_points"], response["inside_points"]) == \
+            (120_000, sum(inside for _, inside in shards))
+        print(f"✓ {response['label']} ≈ {response['estimate']:.6f} ± {response['stderr']:.1e} "
+              f"en {response['latency_seconds'] * 1000:.1f} ms")
+
+        # Précision cible : arrêt au premier shard qui l'atteint
+        status, body = request("POST", "/estimate", {"target_stderr": 0.01, "seed": 1, "sampler": "philox"})
+        assert status == 200 and json.loads(body)["stderr"] <= 0.01
+
+        # Requêtes invalides refusées sans occuper de worker
+        for invalid in ({"draws": 0}, {"draws": 10, "sampler": "sobol", "target_stderr": 0.1},
+                        {"draws": 10, "colour": "red"}, {"draws": 10, "engine": "integer", "sampler": "halton"},
+                        {"draws": 10, "region": "hypersphere", "dimension": "abc"}, {"draws": True},
+                        {"draws": 10, "seed": False}, {"draws": 10, "engine": 3}, {"draws": 10, "sampler": None},
+                        {"draws": 10, "target_stderr": "0.1"}):
+            status, body = request("POST", "/estimate", invalid)
+            assert status == 400, invalid
+            print(f"✓ 400: {json.loads(body)['error']}")
+
+        # Régions plugins refusées par défaut : leur module n'est pas importé
+        imported = "this" in sys.modules
+        for region in ("this:X", "test_monte_carlo:Parabola"):
+            status, body = request("POST", "/estimate", {"draws": 10, "region": region})
+            assert status == 400 and "--allow-plugin-regions" in json.loads(body)["error"]
+        assert ("this" in sys.modules) == imported
+
+        # Équité : une petite requête n'attend pas la fin d'une grosse
+        big = service.submit(draws=2_000_000, seed=5)
+        small = service.submit(draws=1_000, seed=6)
+        small.done.wait()
+        assert not big.done.is_set()
+        big.done.wait()
+        assert big.response()["total_points"] == 2_000_000
+
+        # Compteurs de requêtes, de débit et de latence
+        status, body = request("GET", "/stats")
+        stats = json.loads(body)
+        assert status == 200 and stats["requests_total"] == 4 and stats["requests_in_progress"] == 0
+        assert stats["draws_total"] >= 120_000 + 2_001_000
+        status, body = request("GET", "/metrics")
+        assert b'monte_carlo_serve_request_latency_seconds_count 4' in body
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    # Régions plugins acceptées sur demande explicite
+    service = EstimationService(workers=1, backend="thread", allow_plugin_regions=True)
+    try:
+        response = service.estimate(draws=20_000, seed=1, region="test_monte_carlo:Parabola")
+        assert abs(response["estimate"] - 1 / 3) < 5 * response["stderr"]
+    finally:
+        service.close()
+
+    # Même protocole sur un socket Unix
+    service = EstimationService(workers=1, backend="thread")
+    path = str(tmp_path / "serve.sock")
+    server = make_server(service, unix_socket=path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(path)
+            body = json.dumps({"draws": 1000, "seed": 2}).encode()
+            client.sendall(b"POST /estimate HTTP/1.1\r\nHost: localhost\r\nContent-Length: "
+                           + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body)
+            reply = b""
+            while chunk := client.recv(65536):
+                reply += chunk
+        assert reply.startswith(b"HTTP/1.1 200")
+        assert json.loads(reply.split(b"\r\n\r\n", 1)[1])["total_points"] == 1000
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    print("Service d'estimation: OK\n")
+
+
+def test_sweep_mode(tmp_path):
+    """Test du balayage de paramètres"""
+    print("=" * 60)
+    print("TEST 29: Balayage de paramètres")
+    print("=" * 60)
+
+    import csv
+    import json
+    from hands_on_monte_carlo_simulation.server import EstimationService
+    from hands_on_monte_carlo_simulation.sweep import SweepWriter, load_configs, run_sweep, sweep_grid
+
+    configs = sweep_grid([1_000, 120_000], [1, 2], ["python"], ["random", "philox"], ["quadrant"],
+                         [None], [None])
+    assert len(configs) == 8
+    configs.append({"target_stderr": 0.01, "seed": 7})
+    configs.append({"draws": 10, "engine": "integer", "sampler": "halton"})
+
+    service = EstimationService(workers=2, backend="thread", shard_size=50_000, batch_draws=50_000)
+    path = tmp_path / "sweep.csv"
+    writer = SweepWriter(str(path))
+    try:
+        summary = run_sweep(configs, service, writer)
+        # À graine fixée, une configuration donne le même résultat qu'une requête seule
+        reference = service.estimate(draws=120_000, seed=2, sampler="philox")
+    finally:
+        writer.close()
+        service.close()
+
+    # Une ligne par configuration, configuration invalide comprise
+    with open(path) as f:
+        rows = {int(row["config"]): row for row in csv.DictReader(f)}
+    assert sorted(rows) == list(range(len(configs)))
+    assert summary["configs"] == len(configs) and summary["failed"] == 1
+    assert rows[9]["error"] and not rows[9]["estimate"]
+    assert float(rows[8]["stderr"]) <= 0.01 and rows[8]["seed"] == "7"
+    row = next(row for row in rows.values()
+               if row["draws"] == "120000" and row["seed"] == "2" and row["sampler"] == "philox")
+    assert int(row["inside_points"]) == reference["inside_points"]
+    assert float(row["ci_low"]) < float(row["estimate"]) < float(row["ci_high"])
+    print(f"✓ {summary['configs']} configurations en {summary['elapsed_seconds']:.2f}s "
+          f"({summary['draws_per_second']:.0f} tirages/s)")
+
+    # Configurations lues d'un fichier JSON lines ou CSV, résultats en JSON lines
+    (tmp_path / "configs.jsonl").write_text('{"draws": 5000, "seed": 3}\n\n{"draws": 2000}\n')
+    (tmp_path / "configs.csv").write_text("draws,seed,sampler\n5000,3,\n2000,,halton\n")
+    assert load_configs(str(tmp_path / "configs.jsonl")) == [{"draws": 5000, "seed": 3}, {"draws": 2000}]
+    assert load_configs(str(tmp_path / "configs.csv")) == [{"draws": 5000, "seed": 3},
+                                                           {"draws": 2000, "sampler": "halton"}]
+    (tmp_path / "bad.jsonl").write_text('{"draws": 5000, "colour": "red"}\n')
+    try:
+        load_configs(str(tmp_path / "bad.jsonl"))
+        assert False, "champ inconnu accepté"
+    except ValueError as e:
+        print(f"✓ {e}")
+
+    service = EstimationService(workers=1, backend="thread")
+    writer = SweepWriter(str(tmp_path / "sweep.jsonl"))
+    try:
+        run_sweep(load_configs(str(tmp_path / "configs.jsonl")), service, writer)
+    finally:
+        writer.close()
+        service.close()
+    rows = [json.loads(line) for line in (tmp_path / "sweep.jsonl").read_text().splitlines()]
+    assert sorted(row["config"] for row in rows) == [0, 1]
+    # Graine tirée au hasard écrite dans le résultat
+    assert all(isinstance(row["seed"], int) and row["error"] is None for row in rows)
+
+    print("Balayage de paramètres: OK\n")